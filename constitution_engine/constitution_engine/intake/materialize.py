@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import fields, is_dataclass, replace
+from dataclasses import is_dataclass, replace
 from typing import Any, Iterable
 
 from constitution_engine.intake.types import DraftEpisode
 from constitution_engine.models.episode import DecisionEpisode
 from constitution_engine.models.orientation import Orientation
-from constitution_engine.models.types import RiskPosture, new_id, now_utc
+from constitution_engine.models.types import RiskPosture, field_names, new_id, now_utc
 from constitution_engine.runtime.store import ArtifactStore
 
 
@@ -16,7 +16,7 @@ def _make(cls: type[Any], **kwargs: Any) -> Any:
     This lets the intake/materialize layer survive model evolution.
     """
     if is_dataclass(cls):
-        allowed = {f.name for f in fields(cls)}
+        allowed = field_names(cls)
         filtered = {k: v for k, v in kwargs.items() if k in allowed}
         return cls(**filtered)
     return cls(**kwargs)
@@ -85,7 +85,7 @@ def materialize_draft_episode(
         rec2 = _make(
             type(rec),
             **{
-                **rec.__dict__,
+                **{name: getattr(rec, name) for name in field_names(type(rec))},
                 "orientation_id": getattr(ori, "orientation_id"),
                 "evidence_ids": tuple(ev.evidence_id for ev in draft.evidence),
                 "observation_ids": tuple(o.observation_id for o in draft.observations),
@@ -14,7 +14,10 @@ from constitution_engine.models.review import ReviewRecord
 from constitution_engine.models.types import InfoType
 
 
-@dataclass(frozen=True)
+_OBSERVATIONAL_INFO_TYPES = frozenset({InfoType.FACT, InfoType.MEASUREMENT, InfoType.EVENT, InfoType.TESTIMONY})
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class InvariantViolation:
     rule: str
     message: str
@@ -67,10 +70,8 @@ def require_observations_are_observational(
     (Defensive: Observation.__post_init__ may already enforce this.)
     """
     violations: list[InvariantViolation] = []
-    allowed = {InfoType.FACT, InfoType.MEASUREMENT, InfoType.EVENT, InfoType.TESTIMONY}
-
     for obs in observations:
-        if obs.info_type not in allowed:
+        if obs.info_type not in _OBSERVATIONAL_INFO_TYPES:
             violations.append(
                 InvariantViolation(
                     rule="observation_type",
@@ -586,16 +587,39 @@ def require_proportionate_action_legacy_numeric(
     """
     violations: list[InvariantViolation] = []
 
-    ranked_option_ids = [ro.option_id for ro in rec.ranked_options]
-    ranked_options: list[Option] = []
+    # Single pass: resolve, collect missing, and evaluate both predicates inline.
+    # (Missing options decide the result on their own, so predicates stop once one is seen.)
     missing: list[str] = []
+    witness: Option | None = None
+    has_hedge_or_learn = False
+
+    # Undeclared uncertainty counts as 0.0, so with a positive threshold an option without
+    # uncertainties can never be risky: decide that once instead of per option.
+    undeclared_is_risky = high_uncertainty <= 0.0
 
-    for oid in ranked_option_ids:
-        opt = options_by_id.get(oid)
+    for ro in rec.ranked_options:
+        opt = options_by_id.get(ro.option_id)
         if opt is None:
-            missing.append(oid)
-        else:
-            ranked_options.append(opt)
+            missing.append(ro.option_id)
+            continue
+        if missing:
+            continue
+
+        kind = opt.kind
+        if kind == OptionKind.HEDGE or kind == OptionKind.INFO_GATHERING:
+            has_hedge_or_learn = True
+        elif witness is None and kind == OptionKind.EXECUTE:
+            max_unc = opt.max_uncertainty_level()
+            if max_unc is None:
+                if not undeclared_is_risky:
+                    continue
+                max_unc = 0.0
+            if (
+                max_unc >= high_uncertainty
+                and opt.reversibility.value <= low_reversibility
+                and opt.impact.value >= nontrivial_impact
+            ):
+                witness = opt
 
     if missing:
         violations.append(
@@ -606,29 +630,10 @@ def require_proportionate_action_legacy_numeric(
         )
         return tuple(violations)
 
-    def max_unc(opt: Option) -> float:
-        if not opt.uncertainties:
-            return 0.0
-        return max(u.level for u in opt.uncertainties)
-
-    risky_execute_options = [
-        opt for opt in ranked_options
-        if (opt.kind == OptionKind.EXECUTE)
-        and (max_unc(opt) >= high_uncertainty)
-        and (opt.reversibility.value <= low_reversibility)
-        and (opt.impact.value >= nontrivial_impact)
-    ]
-
-    if not risky_execute_options:
+    if witness is None:
         return tuple()
 
-    has_hedge_or_learn = any(
-        opt.kind in {OptionKind.HEDGE, OptionKind.INFO_GATHERING}
-        for opt in ranked_options
-    )
-
     if not has_hedge_or_learn:
-        witness = risky_execute_options[0]
         violations.append(
             InvariantViolation(
                 rule="proportionate_action_legacy_numeric",
@@ -739,24 +744,24 @@ def require_choice_option_is_ranked_unless_override(
       unless choice.used_override == True.
     """
     violations: list[InvariantViolation] = []
+    ranked_by_rec = {rid: rec.ranked_option_ids for rid, rec in recommendations_by_id.items()}
 
     for ch in choices:
-        rec = recommendations_by_id.get(ch.recommendation_id)
-        if rec is None:
+        ranked_ids = ranked_by_rec.get(ch.recommendation_id)
+        if ranked_ids is None:
             # INV-CHO-002 will cover missing recommendation
             continue
 
         if ch.used_override:
             continue
 
-        ranked_ids = {ro.option_id for ro in rec.ranked_options}
         if ch.option_id not in ranked_ids:
             violations.append(
                 InvariantViolation(
                     rule="INV-CHO-003",
                     message=(
                         f"ChoiceRecord {ch.choice_id} selected option_id={ch.option_id} "
-                        f"which is not ranked by Recommendation {rec.recommendation_id} "
+                        f"which is not ranked by Recommendation {ch.recommendation_id} "
                         "(set used_override=True if this is an intentional override)."
                     ),
                 )
@@ -983,7 +988,7 @@ def require_review_exists_if_override_used(
       If any recommendation has override_used=True,
       then the episode must include at least one ReviewRecord id.
     """
-    used = [r for r in recommendations if getattr(r, "override_used", False) is True]
+    used = [r for r in recommendations if r.override_used is True]
     if not used:
         return tuple()
 
@@ -1017,7 +1022,7 @@ def require_review_audits_overrides(
       - override_scope_used (list/tuple/set)
       - rationale (non-empty str)
     """
-    overridden = [r for r in recommendations if getattr(r, "override_used", False) is True]
+    overridden = [r for r in recommendations if r.override_used is True]
     if not overridden:
         return tuple()
 
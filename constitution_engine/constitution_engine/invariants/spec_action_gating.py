@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Iterable, Optional, Set, Tuple
+from typing import Dict, FrozenSet, Optional, Set, Tuple
 
 
 # -----------------------------
@@ -147,14 +147,32 @@ def allowed_action_classes(
         allowed = {ActionClass.PROBE} if unc != Level3.LOW else {ActionClass.PROBE, ActionClass.LIMITED}
         # If you *want* HIGH risk + LOW uncertainty to allow COMMIT, add it explicitly here.
 
-    # Posture tightening (never loosens)
-    if posture == RiskPosture.CONSERVATIVE and ActionClass.COMMIT in allowed:
-        allowed = set(allowed)
+    # Posture tightening (never loosens). `allowed` is a fresh local set, so mutate in place.
+    if posture == RiskPosture.CONSERVATIVE:
         allowed.discard(ActionClass.COMMIT)
 
     return allowed
 
 
+# -----------------------------
+# Allowed-by-gate reason strings
+# -----------------------------
+
+# (risk, uncertainty, allowed set) -> rendered reason. Gate outcomes are a small closed set
+# (3 x 3 bands x a handful of subsets), so each string is formatted once.
+_ALLOWED_REASONS: Dict[Tuple[Level3, Level3, FrozenSet[ActionClass]], str] = {}
+
+
+def _allowed_reason(risk: Level3, unc: Level3, allowed: Set[ActionClass]) -> str:
+    key = (risk, unc, frozenset(allowed))
+    reason = _ALLOWED_REASONS.get(key)
+    if reason is None:
+        reason = _ALLOWED_REASONS[key] = (
+            f"allowed by gate: risk={risk.value}, uncertainty={unc.value}, allowed={sorted(a.value for a in allowed)}"
+        )
+    return reason
+
+
 # -----------------------------
 # Override validation
 # -----------------------------
@@ -215,7 +233,7 @@ def evaluate_option_legality(
     allowed = allowed_action_classes(risk, unc, posture=orientation.risk_posture)
 
     if option.action_class in allowed:
-        return True, False, f"allowed by gate: risk={risk.value}, uncertainty={unc.value}, allowed={sorted(a.value for a in allowed)}"
+        return True, False, _allowed_reason(risk, unc, allowed)
 
     # Gate violation → override path
     ok, msg = override_is_valid(orientation, override_scope_used)
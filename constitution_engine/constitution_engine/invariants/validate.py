@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Iterable, Mapping, Sequence
+from typing import Hashable, Iterable, Mapping, Sequence
 
 from constitution_engine.models.evidence import Evidence
 from constitution_engine.models.episode import DecisionEpisode
@@ -29,7 +31,7 @@ from .rules import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class ValidationReport:
     """
     Collected violations and resolution errors for an artifact or episode.
@@ -67,17 +69,7 @@ def _episode_acted(ep: DecisionEpisode) -> bool:
     v0.5.2 thin-slice: prefer the explicit field (ep.acted), but remain backward-compatible
     with any legacy "meta['acted']" usage.
     """
-    try:
-        if bool(getattr(ep, "acted", False)):
-            return True
-    except Exception:
-        pass
-
-    meta = getattr(ep, "meta", {}) or {}
-    try:
-        return bool(meta.get("acted", False))
-    except Exception:
-        return False
+    return bool(ep.acted) or bool((ep.meta or {}).get("acted", False))
 
 
 def require_outcome_exists_if_episode_acted(
@@ -92,11 +84,7 @@ def require_outcome_exists_if_episode_acted(
       If the episode has a recommendation AND the user/system marked it as acted,
       then at least one outcome_id must exist.
     """
-    if not acted:
-        return tuple()
-    if not has_recommendation:
-        return tuple()
-    if outcome_ids:
+    if not acted or not has_recommendation or outcome_ids:
         return tuple()
 
     return (
@@ -124,6 +112,7 @@ def validate_outcomes(
         (soft guardrail for coherence)
     """
     violations: list[InvariantViolation] = []
+    ranked_by_rec = {rid: rec.ranked_option_ids for rid, rec in recommendations_by_id.items()}
 
     for out in outcomes:
         rid = out.recommendation_id
@@ -145,9 +134,8 @@ def validate_outcomes(
                 )
             )
 
-        if rid and oid and (rid in recommendations_by_id):
-            rec = recommendations_by_id[rid]
-            ranked_ids = {ro.option_id for ro in rec.ranked_options}
+        if rid and oid and (rid in ranked_by_rec):
+            ranked_ids = ranked_by_rec[rid]
             if ranked_ids and (oid not in ranked_ids):
                 violations.append(
                     InvariantViolation(
@@ -184,7 +172,7 @@ def validate_calibrations(
 
     for cal in calibrations:
         # 1) episode_id must match
-        if getattr(cal, "episode_id", "") and (cal.episode_id != episode.episode_id):
+        if cal.episode_id and (cal.episode_id != episode.episode_id):
             violations.append(
                 InvariantViolation(
                     rule="INV-CAL-001",
@@ -196,7 +184,7 @@ def validate_calibrations(
             )
 
         # 2) review_id must be present and exist
-        rid = getattr(cal, "review_id", None)
+        rid = cal.review_id
         if not rid:
             violations.append(
                 InvariantViolation(
@@ -213,7 +201,7 @@ def validate_calibrations(
             )
 
         # 3) outcome_ids must exist (if provided)
-        for oid in tuple(getattr(cal, "outcome_ids", tuple()) or tuple()):
+        for oid in cal.outcome_ids:
             if oid and oid not in outcomes_by_id:
                 violations.append(
                     InvariantViolation(
@@ -255,47 +243,152 @@ def validate_all(
 # ArtifactStore-based validators
 # ---------------------------
 
+def _resolve_indexed(
+    store: ArtifactStore,
+    cls: type,
+    ids: Sequence[str],
+) -> tuple[Mapping[str, object], Sequence[ResolveError]]:
+    """
+    store.resolve_many_indexed when the store has it; otherwise resolve_many (the only resolver
+    ArtifactStoreProtocol requires), indexed by pairing the found artifacts with the non-missing ids.
+    """
+    resolve_indexed = getattr(store, "resolve_many_indexed", None)
+    if resolve_indexed is not None:
+        return resolve_indexed(cls, ids)
+    found, errors = store.resolve_many(cls, ids)
+    missing = {err.artifact_id for err in errors}
+    return dict(zip([i for i in ids if i not in missing], found)), errors
+
+
+def _resolve_batch(
+    store: ArtifactStore,
+    requests: Mapping[type, Sequence[str]],
+) -> tuple[Mapping[type, Mapping[str, object]], Sequence[ResolveError]]:
+    """
+    store.resolve_batch when the store has it; otherwise one _resolve_indexed call per type.
+    """
+    resolve_batch = getattr(store, "resolve_batch", None)
+    if resolve_batch is not None:
+        return resolve_batch(requests)
+    found: dict[type, Mapping[str, object]] = {}
+    errors: list[ResolveError] = []
+    for cls, ids in requests.items():
+        found[cls], cls_errors = _resolve_indexed(store, cls, ids)
+        errors.extend(cls_errors)
+    return found, tuple(errors)
+
+
+def _validate_recommendation_core(
+    rec: Recommendation,
+    options_by_id: Mapping[str, Option],
+) -> tuple[Sequence[InvariantViolation], Sequence[ResolveError]]:
+    """
+    Recommendation invariants against already-resolved Options (no store access).
+
+    Ranked option ids absent from options_by_id are reported as ResolveErrors.
+    """
+    violations: list[InvariantViolation] = []
+
+    # Basic invariants
+    violations.extend(require_recommendation_has_orientation(rec))
+    violations.extend(require_recommendation_has_ranked_options(rec))
+
+    opt_errors = tuple(
+        ResolveError(artifact_type=Option.__name__, artifact_id=ro.option_id)
+        for ro in rec.ranked_options
+        if ro.option_id not in options_by_id
+    )
+
+    if opt_errors:
+        violations.extend(
+            _as_missing_violations(opt_errors, context=f"Recommendation:{rec.recommendation_id}")
+        )
+    else:
+        # canonical v0.5.1 gate
+        violations.extend(require_proportionate_action(rec, options_by_id))
+
+    return tuple(violations), opt_errors
+
+
+_REC_CORE_CACHE_MAXSIZE = 4096
+_rec_core_cache: "OrderedDict[Hashable, tuple[Sequence[InvariantViolation], Sequence[ResolveError]]]" = OrderedDict()
+# Guards _rec_core_cache: move_to_end/popitem from concurrent validators must not interleave.
+_rec_core_cache_lock = threading.Lock()
+
+
+def _validate_recommendation_cached(
+    rec: Recommendation,
+    options_by_id: Mapping[str, Option],
+) -> tuple[Sequence[InvariantViolation], Sequence[ResolveError]]:
+    """
+    LRU-memoized _validate_recommendation_core.
+
+    Keyed on the Recommendation's content hash plus the content hash of each ranked Option
+    (None when absent), so any change to the inputs the rules read produces a new key.
+    Both digests are memoized on their instances. Safe to call from several threads; on a
+    concurrent miss the core validator may run more than once, with identical results.
+    """
+    key = (
+        rec.recommendation_id,
+        rec.content_hash(),
+        tuple(
+            (ro.option_id, opt.content_hash() if (opt := options_by_id.get(ro.option_id)) is not None else None)
+            for ro in rec.ranked_options
+        ),
+    )
+
+    with _rec_core_cache_lock:
+        hit = _rec_core_cache.get(key)
+        if hit is not None:
+            _rec_core_cache.move_to_end(key)
+            return hit
+
+    result = _validate_recommendation_core(rec, options_by_id)
+    with _rec_core_cache_lock:
+        _rec_core_cache[key] = result
+        if len(_rec_core_cache) > _REC_CORE_CACHE_MAXSIZE:
+            _rec_core_cache.popitem(last=False)
+    return result
+
+
+def clear_validation_cache() -> None:
+    """
+    Drop every memoized recommendation result (e.g. between tests, or after changing rule
+    code at runtime). Results are keyed on content hashes, so this is never needed for
+    correctness after artifact edits.
+    """
+    with _rec_core_cache_lock:
+        _rec_core_cache.clear()
+
+
+# functools.lru_cache-style spelling.
+_validate_recommendation_cached.cache_clear = clear_validation_cache  # type: ignore[attr-defined]
+
+
 def validate_recommendation(
     store: ArtifactStore,
     rec_id: str,
 ) -> ValidationReport:
-    violations: list[InvariantViolation] = []
-    resolve_errors: list[ResolveError] = []
-
     # Resolve Recommendation (don't throw)
     try:
         rec = store.must_get(Recommendation, rec_id)
     except ResolveError as err:
-        resolve_errors.append(err)
-        violations.append(
-            InvariantViolation(rule="missing_reference", message=f"Recommendation missing: {rec_id}")
-        )
         return ValidationReport(
             subject=f"Recommendation:{rec_id}",
-            violations=tuple(violations),
-            resolve_errors=tuple(resolve_errors),
+            violations=(
+                InvariantViolation(rule="missing_reference", message=f"Recommendation missing: {rec_id}"),
+            ),
+            resolve_errors=(err,),
         )
 
-    # Basic invariants
-    violations.extend(require_recommendation_has_orientation(rec))
-    violations.extend(require_recommendation_has_ranked_options(rec))
-
     # Resolve referenced Options for proportionate action
-    opt_ids = [ro.option_id for ro in rec.ranked_options]
-    options, opt_errors = store.resolve_many(Option, opt_ids)
-    resolve_errors.extend(opt_errors)
-
-    options_by_id: Mapping[str, Option] = {o.option_id: o for o in options}
-    if opt_errors:
-        violations.extend(_as_missing_violations(opt_errors, context=f"Recommendation:{rec_id}"))
-    else:
-        # canonical v0.5.1 gate
-        violations.extend(require_proportionate_action(rec, options_by_id))
+    options_by_id, _ = _resolve_indexed(store, Option, [ro.option_id for ro in rec.ranked_options])
+    violations, resolve_errors = _validate_recommendation_cached(rec, options_by_id)
 
     return ValidationReport(
         subject=f"Recommendation:{rec_id}",
-        violations=tuple(violations),
-        resolve_errors=tuple(resolve_errors),
+        violations=violations,
+        resolve_errors=resolve_errors,
     )
 
 
@@ -320,70 +413,104 @@ def validate_episode(
             resolve_errors=tuple(resolve_errors),
         )
 
-    # Resolve observations and validate observational purity
-    observations, obs_errors = store.resolve_many(Observation, ep.observation_ids)
+    acted = _episode_acted(ep)
+
+    # Fast path: an un-acted episode that references nothing cannot trip any invariant.
+    if not acted and not (
+        ep.observation_ids
+        or ep.option_ids
+        or ep.recommendation_ids
+        or ep.choice_ids
+        or ep.outcome_ids
+        or ep.review_ids
+        or ep.calibration_ids
+    ):
+        return ValidationReport(subject=f"DecisionEpisode:{episode_id}", violations=(), resolve_errors=())
+
+    # Resolve every referenced artifact in one batched store call.
+    resolved, batch_errors = _resolve_batch(
+        store,
+        {
+            Observation: ep.observation_ids,
+            Option: ep.option_ids,
+            Recommendation: ep.recommendation_ids,
+            ChoiceRecord: ep.choice_ids,
+            Outcome: ep.outcome_ids,
+            ReviewRecord: ep.review_ids,
+            CalibrationNote: ep.calibration_ids,
+        }
+    )
+    errors_by_type: dict[str, list[ResolveError]] = {}
+    for err in batch_errors:
+        errors_by_type.setdefault(err.artifact_type, []).append(err)
+
+    # Validate observational purity
+    obs_errors = errors_by_type.get(Observation.__name__, ())
     resolve_errors.extend(obs_errors)
     if obs_errors:
-        violations.extend(_as_missing_violations(obs_errors, context=f"DecisionEpisode:{episode_id}"))
-    else:
-        violations.extend(require_observations_are_observational(observations))
+        violations += _as_missing_violations(obs_errors, context=f"DecisionEpisode:{episode_id}")
+    elif ep.observation_ids:
+        violations += require_observations_are_observational(tuple(resolved[Observation].values()))
 
-    # Resolve episode options once (used by Outcome checks and potentially other rules)
-    opts, opt_errors = store.resolve_many(Option, ep.option_ids)
+    # Episode options (used by Outcome checks and potentially other rules)
+    opt_errors = errors_by_type.get(Option.__name__, ())
     resolve_errors.extend(opt_errors)
     if opt_errors:
-        violations.extend(_as_missing_violations(opt_errors, context=f"DecisionEpisode:{episode_id}"))
-    opts_by_id: Mapping[str, Option] = {o.option_id: o for o in opts}
+        violations += _as_missing_violations(opt_errors, context=f"DecisionEpisode:{episode_id}")
+    opts_by_id: Mapping[str, Option] = resolved[Option]
 
     # Validate all recommendations in the episode (and collect resolved recs for review/outcome invariants)
-    recs: list[Recommendation] = []
-    recs_by_id: dict[str, Recommendation] = {}
-
+    recs_by_id: Mapping[str, Recommendation] = resolved[Recommendation]
+    recs = [rec for rec_id in ep.recommendation_ids if (rec := recs_by_id.get(rec_id)) is not None]
+    any_override_used = any(rec.override_used is True for rec in recs)
+    rec_missing = {err.artifact_id: err for err in errors_by_type.get(Recommendation.__name__, ())}
+
+    # Ranked options are normally a subset of ep.option_ids; only fetch the ones the episode lacks.
+    extra_opt_ids = {
+        ro.option_id for rec in recs for ro in rec.ranked_options if ro.option_id not in opts_by_id
+    }
+    rec_opts_by_id: Mapping[str, Option] = opts_by_id
+    if extra_opt_ids:
+        extra_opts, _ = _resolve_indexed(store, Option, sorted(extra_opt_ids))
+        rec_opts_by_id = {**opts_by_id, **extra_opts}
+
+    # Report per recommendation, in episode order: its missing reference, or its own findings.
     for rec_id in ep.recommendation_ids:
-        try:
-            rec = store.must_get(Recommendation, rec_id)
-            recs.append(rec)
-            recs_by_id[rec.recommendation_id] = rec
-        except ResolveError as err:
+        rec = recs_by_id.get(rec_id)
+        if rec is None:
+            err = rec_missing.get(rec_id) or ResolveError(artifact_type=Recommendation.__name__, artifact_id=rec_id)
             resolve_errors.append(err)
             violations.append(
                 InvariantViolation(rule="missing_reference", message=f"Recommendation missing: {rec_id}")
             )
             continue
-
-        rec_report = validate_recommendation(store, rec_id)
-        violations.extend(rec_report.violations)
-        resolve_errors.extend(rec_report.resolve_errors)
+        rec_violations, rec_errors = _validate_recommendation_cached(rec, rec_opts_by_id)
+        violations += rec_violations
+        resolve_errors.extend(rec_errors)
 
     # ---------------------------
     # v0.5.2 Choice invariants (NEW)
     # ---------------------------
 
-    acted = _episode_acted(ep)
-
-    violations.extend(
-        require_choice_exists_if_episode_acted(
-            episode_id=ep.episode_id,
-            acted=acted,
-            choice_ids=tuple(getattr(ep, "choice_ids", tuple()) or tuple()),
-        )
+    violations += require_choice_exists_if_episode_acted(
+        episode_id=ep.episode_id,
+        acted=acted,
+        choice_ids=ep.choice_ids,
     )
 
     # Resolve choices (only if present) and validate coherence.
-    if getattr(ep, "choice_ids", ()):
-        choices, ch_errors = store.resolve_many(ChoiceRecord, ep.choice_ids)
+    if ep.choice_ids:
+        ch_errors = errors_by_type.get(ChoiceRecord.__name__, ())
         resolve_errors.extend(ch_errors)
 
         if ch_errors:
-            violations.extend(_as_missing_violations(ch_errors, context=f"DecisionEpisode:{episode_id}"))
+            violations += _as_missing_violations(ch_errors, context=f"DecisionEpisode:{episode_id}")
         else:
             # Choices validate against resolved recs and opts.
-            violations.extend(
-                validate_choices(
-                    choices=tuple(choices),
-                    recommendations_by_id=recs_by_id,
-                    options_by_id=opts_by_id,
-                )
+            violations += validate_choices(
+                choices=tuple(resolved[ChoiceRecord].values()),
+                recommendations_by_id=recs_by_id,
+                options_by_id=opts_by_id,
             )
 
     # ---------------------------
@@ -392,94 +519,76 @@ def validate_episode(
 
     has_rec = bool(ep.recommendation_ids)
 
-    violations.extend(
-        require_outcome_exists_if_episode_acted(
-            episode_id=ep.episode_id,
-            acted=acted,
-            has_recommendation=has_rec,
-            outcome_ids=tuple(ep.outcome_ids),
-        )
+    violations += require_outcome_exists_if_episode_acted(
+        episode_id=ep.episode_id,
+        acted=acted,
+        has_recommendation=has_rec,
+        outcome_ids=ep.outcome_ids,
     )
 
-    outcomes_by_id: dict[str, Outcome] = {}
+    outcomes_by_id: Mapping[str, Outcome] = {}
     if ep.outcome_ids:
-        outcomes, out_errors = store.resolve_many(Outcome, ep.outcome_ids)
+        out_errors = errors_by_type.get(Outcome.__name__, ())
         resolve_errors.extend(out_errors)
         if out_errors:
-            violations.extend(_as_missing_violations(out_errors, context=f"DecisionEpisode:{episode_id}"))
+            violations += _as_missing_violations(out_errors, context=f"DecisionEpisode:{episode_id}")
         else:
-            outcomes_by_id = {o.outcome_id: o for o in outcomes}
-            violations.extend(
-                validate_outcomes(
-                    outcomes=tuple(outcomes),
-                    recommendations_by_id=recs_by_id,
-                    options_by_id=opts_by_id,
-                )
+            outcomes_by_id = resolved[Outcome]
+            violations += validate_outcomes(
+                outcomes=tuple(outcomes_by_id.values()),
+                recommendations_by_id=recs_by_id,
+                options_by_id=opts_by_id,
             )
 
     # ---------------------------
     # v0.5.2 Review invariants (existing pattern)
     # ---------------------------
 
-    violations.extend(
-        require_review_exists_if_override_used(
+    if any_override_used:
+        violations += require_review_exists_if_override_used(
             episode_id=ep.episode_id,
             recommendations=recs,
-            review_ids=tuple(ep.review_ids),
+            review_ids=ep.review_ids,
         )
-    )
 
-    reviews_by_id: dict[str, ReviewRecord] = {}
+    reviews_by_id: Mapping[str, ReviewRecord] = {}
     if ep.review_ids:
-        review_items, rev_errors = store.resolve_many(ReviewRecord, ep.review_ids)
+        rev_errors = errors_by_type.get(ReviewRecord.__name__, ())
         resolve_errors.extend(rev_errors)
         if rev_errors:
-            violations.extend(_as_missing_violations(rev_errors, context=f"DecisionEpisode:{episode_id}"))
+            violations += _as_missing_violations(rev_errors, context=f"DecisionEpisode:{episode_id}")
         else:
-            reviews_by_id = {r.review_id: r for r in review_items}
+            reviews_by_id = resolved[ReviewRecord]
 
-    any_override_used = any(getattr(r, "override_used", False) is True for r in recs)
     latest_review_id = ep.latest_review_id()
 
     if any_override_used and latest_review_id:
-        # We already resolved all reviews above; fall back to store if needed.
-        review = reviews_by_id.get(latest_review_id)
-        if review is None:
-            review_items, rev_errors = store.resolve_many(ReviewRecord, [latest_review_id])
-            resolve_errors.extend(rev_errors)
-            if rev_errors:
-                violations.extend(_as_missing_violations(rev_errors, context=f"DecisionEpisode:{episode_id}"))
-            else:
-                review = review_items[0]
-
+        # latest_review_id is one of ep.review_ids, so the batch already resolved (or reported) it.
+        review = resolved[ReviewRecord].get(latest_review_id)
         if review is not None:
-            violations.extend(
-                require_review_audits_overrides(
-                    episode_id=ep.episode_id,
-                    recommendations=recs,
-                    review=review,
-                )
+            violations += require_review_audits_overrides(
+                episode_id=ep.episode_id,
+                recommendations=recs,
+                review=review,
             )
 
     # ---------------------------
     # v0.5.2 Calibration invariants (NEW)
     # ---------------------------
 
-    if getattr(ep, "calibration_ids", ()):
-        cals, cal_errors = store.resolve_many(CalibrationNote, ep.calibration_ids)
+    if ep.calibration_ids:
+        cal_errors = errors_by_type.get(CalibrationNote.__name__, ())
         resolve_errors.extend(cal_errors)
 
         if cal_errors:
-            violations.extend(_as_missing_violations(cal_errors, context=f"DecisionEpisode:{episode_id}"))
+            violations += _as_missing_violations(cal_errors, context=f"DecisionEpisode:{episode_id}")
         else:
             # If outcomes/reviews weren't resolved (no ids), keep maps empty; validator will flag missing refs.
-            violations.extend(
-                validate_calibrations(
-                    calibrations=tuple(cals),
-                    episode=ep,
-                    reviews_by_id=reviews_by_id,
-                    outcomes_by_id=outcomes_by_id,
-                )
+            violations += validate_calibrations(
+                calibrations=tuple(resolved[CalibrationNote].values()),
+                episode=ep,
+                reviews_by_id=reviews_by_id,
+                outcomes_by_id=outcomes_by_id,
             )
 
     return ValidationReport(
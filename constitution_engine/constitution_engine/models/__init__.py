@@ -4,32 +4,63 @@ Core kernel models.
 Observe → Model → Orient → Act → Review
 """
 
-from .types import (
-    InfoType,
-    ArtifactType,
-    Confidence,
-    Uncertainty,
-    UncertaintyKind,
-    Reversibility,
-    Impact,
-    RiskPosture,
-    Weight,
-    now_utc,
-    new_id,
-)
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# Re-exports are resolved lazily (PEP 562): importing one model no longer imports all of them.
+_LAZY = {
+    "InfoType": ".types",
+    "ArtifactType": ".types",
+    "Confidence": ".types",
+    "Uncertainty": ".types",
+    "UncertaintyKind": ".types",
+    "Reversibility": ".types",
+    "Impact": ".types",
+    "RiskPosture": ".types",
+    "Weight": ".types",
+    "now_utc": ".types",
+    "new_id": ".types",
+    "RawInput": ".raw_input",
+    "Evidence": ".evidence",
+    "SourceRef": ".evidence",
+    "SpanRef": ".evidence",
+    "Observation": ".observation",
+    "Interpretation": ".interpretation",
+    "Assumption": ".interpretation",
+    "ModelSpec": ".model_spec",
+    "ModelState": ".model_spec",
+    "Orientation": ".orientation",
+    "Objective": ".orientation",
+    "Constraint": ".orientation",
+    "ValueSignal": ".orientation",
+    "Option": ".option",
+    "OptionKind": ".option",
+    "Recommendation": ".recommendation",
+    "RankedOption": ".recommendation",
+    "Outcome": ".outcome",
+    "ReviewRecord": ".review",
+    "AssumptionUpdate": ".review",
+    "AuditTrail": ".audit",
+    "Lineage": ".audit",
+    "DecisionEpisode": ".episode",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-from .raw_input import RawInput
-from .evidence import Evidence, SourceRef, SpanRef
-from .observation import Observation
-from .interpretation import Interpretation, Assumption
-from .model_spec import ModelSpec, ModelState
-from .orientation import Orientation, Objective, Constraint, ValueSignal
-from .option import Option, OptionKind
-from .recommendation import Recommendation, RankedOption
-from .outcome import Outcome
-from .review import ReviewRecord, AssumptionUpdate
-from .audit import AuditTrail, Lineage
-from .episode import DecisionEpisode
 
 __all__ = [
     "InfoType",
@@ -0,0 +1,322 @@
+"""
+Dataclass/codegen helpers shared by the frozen kernel models: read-only meta mappings,
+slot-stored memos, generated copiers/__init__s, and the id-tuple/meta append helpers.
+
+Internal: models import from here; types.py re-exports the names it used to define.
+"""
+
+from __future__ import annotations
+
+from dataclasses import MISSING, fields
+from types import MemberDescriptorType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple, TypeVar
+
+
+class FrozenDict(dict):  # type: ignore[type-arg]
+    """
+    Read-only dict for model meta/notes/patch mappings.
+
+    Still a real dict, so json.dumps, pickle, copy.deepcopy and dataclasses.asdict handle it;
+    only the mutating methods are blocked.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore[assignment]
+
+    def __reduce__(self) -> Any:
+        # Rebuild from a plain dict: the default dict-subclass protocol would replay __setitem__.
+        return (type(self), (dict(self),))
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __repr__(self) -> str:
+        return dict.__repr__(self)
+
+
+# Read-only empty mapping shared by every meta/notes/patch/metadata/parameters default (no
+# per-instance dict).
+EMPTY_META: Mapping[str, Any] = FrozenDict()
+
+
+def empty_meta() -> Mapping[str, Any]:
+    """
+    default_factory for the models' Mapping-typed meta fields; returns the shared EMPTY_META.
+
+    A defaulted mapping is read-only: ``obj.meta["k"] = v`` raises TypeError instead of mutating
+    a fresh dict. Derive a new instance with with_meta()/dataclasses.replace(), or pass your own
+    dict at construction time (caller-supplied mappings are stored as given).
+    """
+    return EMPTY_META
+
+
+_T = TypeVar("_T")
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+class MemoSlots:
+    """
+    Base for frozen slotted models that memoize derived values outside their dataclass fields,
+    so memos never show up in fields()/asdict()/repr/eq/pickle.
+
+    Subclasses name the memo slots in __slots__ and give each one a default in _memo_defaults
+    (a constant, or a callable computing it from the instance). Models call _init_memos() from
+    __post_init__; copy_with carries memos to the copy unless a change overrides them, and
+    from_trusted (also used to restore pickled/deep-copied instances) starts from the defaults.
+    Memos named in _content_memos depend on every field (e.g. a content digest), so copy_with
+    resets them to their defaults instead of carrying them.
+    """
+
+    __slots__ = ()
+    _memo_defaults: Mapping[str, Any] = FrozenDict()
+    _content_memos: FrozenSet[str] = frozenset()
+
+    def _init_memos(self) -> None:
+        for name, default in self._memo_defaults.items():
+            object.__setattr__(self, name, default(self) if callable(default) else default)
+
+    def __reduce__(self) -> Any:
+        # Field values only; memos are rebuilt on restore instead of being serialized.
+        cls = type(self)
+        return (_restore_memo_model, (cls, tuple(getattr(self, name) for name in field_names(cls))))
+
+
+def _restore_memo_model(cls: type[_T], values: Tuple[Any, ...]) -> _T:
+    return from_trusted(cls, **dict(zip(field_names(cls), values)))
+
+
+def memo_names(cls: type) -> Tuple[str, ...]:
+    """
+    Names of cls's MemoSlots memos (empty for models without any).
+    """
+    return tuple(getattr(cls, "_memo_defaults", ()))
+
+
+def field_names(cls: type) -> Tuple[str, ...]:
+    """
+    dataclasses.fields(cls) names, computed once per class (field sets are fixed after class creation).
+    """
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls))  # type: ignore[arg-type]
+    return names
+
+
+_COPIERS: Dict[type, Any] = {}
+
+
+def _build_copier(cls: type) -> Any:
+    """
+    Write out cls's field-by-field copy as straight-line code (dataclasses does the same for __init__).
+    MemoSlots memos are copied after the fields, the same way (content memos start from their default).
+
+    Slotted fields are stored through their slot descriptor's bound __set__, which skips the
+    frozen __setattr__ guard without the per-field object.__setattr__ name lookup.
+    """
+    ns: Dict[str, Any] = {"_new": object.__new__, "_cls": cls, "_setattr": object.__setattr__}
+    lines = ["def _copy(obj, changes):", "    new = _new(_cls)"]
+    content_memos = getattr(cls, "_content_memos", frozenset())
+    for i, name in enumerate(field_names(cls) + memo_names(cls)):
+        current = f"obj.{name}"
+        if name in content_memos:
+            default = ns[f"_default{i}"] = cls._memo_defaults[name]  # type: ignore[attr-defined]
+            current = f"_default{i}(new)" if callable(default) else f"_default{i}"
+        value = f"changes[{name!r}] if {name!r} in changes else {current}"
+        slot = next((k.__dict__[name] for k in cls.__mro__ if name in k.__dict__), None)
+        if isinstance(slot, MemberDescriptorType):
+            ns[f"_set{i}"] = slot.__set__
+            lines.append(f"    _set{i}(new, {value})")
+        else:
+            lines.append(f"    _setattr(new, {name!r}, {value})")
+    lines.append("    return new")
+    exec("\n".join(lines), ns)
+    return ns["_copy"]
+
+
+def copy_with(obj: _T, **changes: Any) -> _T:
+    """
+    dataclasses.replace without re-running __init__/__post_init__.
+
+    For append-only helpers on frozen models: only pass values that are already normalized
+    (tuples, validated scalars), since no validation runs on the copy.
+    """
+    cls = type(obj)
+    copier = _COPIERS.get(cls)
+    if copier is None:
+        copier = _COPIERS[cls] = _build_copier(cls)
+    return copier(obj, changes)
+
+
+_REPLACE_SPECS: Dict[type, Tuple[FrozenSet[str], Tuple[Tuple[str, Any, Any], ...]]] = {}
+
+
+def replace_fields(obj: _T, **changes: Any) -> _T:
+    """
+    __replace__ for the frozen models (copy.replace on 3.13+): dataclasses.replace semantics,
+    i.e. init=False caches reset to their defaults and __post_init__ validates/normalizes the
+    result, but built through copy_with instead of re-binding every field through __init__.
+    """
+    cls = type(obj)
+    spec = _REPLACE_SPECS.get(cls)
+    if spec is None:
+        fs = fields(cls)  # type: ignore[arg-type]
+        spec = _REPLACE_SPECS[cls] = (
+            frozenset(f.name for f in fs if f.init),
+            tuple((f.name, f.default, f.default_factory) for f in fs if not f.init),
+        )
+    init_names, resets = spec
+
+    if not changes.keys() <= init_names:
+        bad = ", ".join(sorted(changes.keys() - init_names))
+        raise TypeError(f"{cls.__name__}.__replace__ got unexpected or init=False field(s): {bad}")
+    for name, default, factory in resets:
+        changes[name] = factory() if factory is not MISSING else default
+
+    new = copy_with(obj, **changes)
+    post_init = getattr(new, "__post_init__", None)
+    if post_init is not None:
+        post_init()
+    return new
+
+
+def hash_by_id(id_field: str) -> Callable[[Any], int]:
+    """
+    __hash__ for the frozen models: hash only the primary id instead of every field.
+    The id is a compared field, so equal instances still hash equal, and str hashes are
+    cached, so hashing is O(1) regardless of how large the tuples/meta grow.
+    """
+    def __hash__(self: Any) -> int:
+        return hash(getattr(self, id_field))
+
+    __hash__.__qualname__ = f"hash_by_id.<{id_field}>"
+    return __hash__
+
+
+_FIELD_DEFAULTS: Dict[type, Tuple[Tuple[str, Any, Any], ...]] = {}
+
+
+def from_trusted(cls: type[_T], **values: Any) -> _T:
+    """
+    Build an instance from already-normalized field values (e.g. a storage row) without running
+    __init__/__post_init__. Omitted fields get their declared default; default factories only run
+    for fields that were actually omitted.
+    """
+    spec = _FIELD_DEFAULTS.get(cls)
+    if spec is None:
+        spec = _FIELD_DEFAULTS[cls] = tuple((f.name, f.default, f.default_factory) for f in fields(cls))  # type: ignore[arg-type]
+
+    new = object.__new__(cls)
+    set_attr = object.__setattr__
+    for name, default, factory in spec:
+        if name in values:
+            set_attr(new, name, values[name])
+        elif factory is not MISSING:
+            set_attr(new, name, factory())
+        elif default is not MISSING:
+            set_attr(new, name, default)
+        else:
+            raise TypeError(f"{cls.__name__}.from_trusted missing required field {name!r}")
+    if isinstance(new, MemoSlots):
+        new._init_memos()
+    return new
+
+
+class _FactoryDefault:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<factory>"
+
+
+_FACTORY_DEFAULT = _FactoryDefault()
+
+
+def fast_frozen_init(cls: type[_T]) -> type[_T]:
+    """
+    Class decorator for @dataclass(frozen=True, slots=True) models: swap the generated __init__
+    (one object.__setattr__ call per field) for one that stores through each slot descriptor's
+    bound __set__. Same signature, defaults and __post_init__ call; instances stay frozen.
+
+    Apply it above @dataclass. Plain fields only (no kw_only fields or InitVars).
+    """
+    ns: Dict[str, Any] = {"_FACTORY_DEFAULT": _FACTORY_DEFAULT}
+    params: List[str] = []
+    body: List[str] = []
+    for i, f in enumerate(fields(cls)):  # type: ignore[arg-type]
+        if f.kw_only:
+            raise TypeError(f"fast_frozen_init does not support kw_only field {cls.__name__}.{f.name}")
+        slot = cls.__dict__.get(f.name)
+        if not isinstance(slot, MemberDescriptorType):
+            raise TypeError(f"fast_frozen_init needs a slots=True dataclass ({cls.__name__}.{f.name})")
+        ns[f"_set{i}"] = slot.__set__
+
+        if f.default_factory is not MISSING:
+            ns[f"_factory{i}"] = f.default_factory
+            value = f"_factory{i}()"
+            if f.init:
+                params.append(f"{f.name}=_FACTORY_DEFAULT")
+                value = f"{value} if {f.name} is _FACTORY_DEFAULT else {f.name}"
+        elif f.default is not MISSING:
+            ns[f"_default{i}"] = f.default
+            value = f"_default{i}"
+            if f.init:
+                params.append(f"{f.name}=_default{i}")
+                value = f.name
+        elif f.init:
+            params.append(f.name)
+            value = f.name
+        else:
+            continue  # init=False with no default: left unset, as dataclasses does
+        body.append(f"    _set{i}(self, {value})")
+
+    if hasattr(cls, "__post_init__"):
+        body.append("    self.__post_init__()")
+    src = f"def __init__(self{''.join(', ' + p for p in params)}):\n" + ("\n".join(body) or "    pass")
+    exec(src, ns)
+    init = ns["__init__"]
+    init.__qualname__ = f"{cls.__qualname__}.__init__"
+    init.__doc__ = cls.__init__.__doc__
+    cls.__init__ = init  # type: ignore[misc]
+    return cls
+
+
+def append_unique_indexed(
+    seq: Tuple[str, ...],
+    seen: Optional[FrozenSet[str]],
+    *items: str,
+) -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+    """
+    Append IDs while preserving order and avoiding duplicates.
+
+    `seen` is the membership set of `seq` carried over from the previous append (built from seq
+    when None), so repeated appends don't rebuild it. Returns the new tuple and its set.
+    """
+    if not items:
+        return seq, (frozenset(seq) if seen is None else seen)
+    if seen is None:
+        seen = frozenset(seq)
+    if len(items) == 1:
+        # log_*/add_* with a single id is the common case: skip the dedupe scaffolding.
+        it = items[0]
+        if not it or it in seen:
+            return seq, seen
+        return seq + items, seen.union(items)
+    new = [it for it in dict.fromkeys(items) if it and it not in seen]
+    if not new:
+        return seq, seen
+    return seq + tuple(new), seen.union(new)
+
+
+def merge_meta(base: Mapping[str, Any], patch: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Returns `base` itself when `patch` adds nothing new (empty, or every key already set to an
+    equal value), so callers can detect the no-op by identity; otherwise a new FrozenDict.
+    """
+    if all(k in base and base[k] == v for k, v in patch.items()):
+        return base
+    return FrozenDict({**base, **patch})
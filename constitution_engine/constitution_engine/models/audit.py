@@ -1,112 +1,182 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, replace
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Mapping, Optional, Sequence, Tuple
 
+from ._dataclass_tools import FrozenDict, MemoSlots, append_unique_indexed, copy_with, replace_fields, empty_meta, from_trusted, merge_meta, hash_by_id
 from .types import new_id, now_utc
 
 
-def _as_tuple(seq: Sequence[str]) -> Tuple[str, ...]:
-    return tuple(seq)
-
-
-def _append_unique(seq: Sequence[str], *items: str) -> Tuple[str, ...]:
-    out = list(_as_tuple(seq))
-    seen = set(out)
-    for it in items:
-        if it and it not in seen:
-            out.append(it)
-            seen.add(it)
-    return tuple(out)
-
-
-def _merge_meta(base: Mapping[str, object], patch: Mapping[str, object]) -> Mapping[str, object]:
-    if not patch:
-        return dict(base)
-    out = dict(base)
-    out.update(patch)
-    return out
-
-
-@dataclass(frozen=True)
-class Lineage:
+# Bit i of Lineage._nonempty_mask is set iff the i-th of these fields is non-empty.
+_LINEAGE_ID_FIELDS: Tuple[str, ...] = (
+    "raw_input_ids",
+    "evidence_ids",
+    "observation_ids",
+    "interpretation_ids",
+    "model_spec_ids",
+    "model_state_ids",
+    "orientation_ids",
+    "option_ids",
+    "recommendation_ids",
+    "outcome_ids",
+    "review_ids",
+)
+_LINEAGE_BIT = {name: 1 << i for i, name in enumerate(_LINEAGE_ID_FIELDS)}
+
+
+def _lineage_mask(lin: "Lineage") -> int:
+    mask = 0
+    for name, bit in _LINEAGE_BIT.items():
+        if getattr(lin, name):
+            mask |= bit
+    return mask
+
+
+class _LineageMemo(MemoSlots):
+    # Private: per-field membership sets reused by the add_* appenders (filled lazily), and
+    # which id fields are non-empty (see _LINEAGE_ID_FIELDS), kept current by add_*.
+    __slots__ = ("_id_sets", "_nonempty_mask")
+    _memo_defaults = FrozenDict(_id_sets=FrozenDict(), _nonempty_mask=_lineage_mask)
+
+
+@dataclass(frozen=True, slots=True)
+class Lineage(_LineageMemo):
     """
     Trace chain pointers. All fields are IDs, not embedded objects.
     """
-    raw_input_ids: Sequence[str] = field(default_factory=tuple)
-    evidence_ids: Sequence[str] = field(default_factory=tuple)
-    observation_ids: Sequence[str] = field(default_factory=tuple)
-    interpretation_ids: Sequence[str] = field(default_factory=tuple)
-    model_spec_ids: Sequence[str] = field(default_factory=tuple)
-    model_state_ids: Sequence[str] = field(default_factory=tuple)
-    orientation_ids: Sequence[str] = field(default_factory=tuple)
-    option_ids: Sequence[str] = field(default_factory=tuple)
-    recommendation_ids: Sequence[str] = field(default_factory=tuple)
-    outcome_ids: Sequence[str] = field(default_factory=tuple)
-    review_ids: Sequence[str] = field(default_factory=tuple)
+    raw_input_ids: Tuple[str, ...] = ()
+    evidence_ids: Tuple[str, ...] = ()
+    observation_ids: Tuple[str, ...] = ()
+    interpretation_ids: Tuple[str, ...] = ()
+    model_spec_ids: Tuple[str, ...] = ()
+    model_state_ids: Tuple[str, ...] = ()
+    orientation_ids: Tuple[str, ...] = ()
+    option_ids: Tuple[str, ...] = ()
+    recommendation_ids: Tuple[str, ...] = ()
+    outcome_ids: Tuple[str, ...] = ()
+    review_ids: Tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        for name in _LINEAGE_ID_FIELDS:
+            v = getattr(self, name)
+            if type(v) is not tuple:
+                object.__setattr__(self, name, tuple(v))
+        self._init_memos()
+
+    @classmethod
+    def from_trusted_tuples(cls, **fields: Tuple[str, ...]) -> "Lineage":
+        """
+        Rebuild a stored Lineage without __init__: id fields must already be tuples.
+        """
+        return from_trusted(cls, **fields)
 
     # -----------------------
     # Immutability helpers
     # -----------------------
 
+    def extend(
+        self,
+        *,
+        raw_input_ids: Sequence[str] = (),
+        evidence_ids: Sequence[str] = (),
+        observation_ids: Sequence[str] = (),
+        interpretation_ids: Sequence[str] = (),
+        model_spec_ids: Sequence[str] = (),
+        model_state_ids: Sequence[str] = (),
+        orientation_ids: Sequence[str] = (),
+        option_ids: Sequence[str] = (),
+        recommendation_ids: Sequence[str] = (),
+        outcome_ids: Sequence[str] = (),
+        review_ids: Sequence[str] = (),
+    ) -> "Lineage":
+        """
+        Append to several id categories in one step (a single new Lineage instead of one per add_*).
+        Same dedupe/ordering semantics as the individual add_* helpers.
+        """
+        id_sets = dict(self._id_sets)
+        mask = self._nonempty_mask
+        changes: dict[str, Tuple[str, ...]] = {}
+        for name, ids in (
+            ("raw_input_ids", raw_input_ids),
+            ("evidence_ids", evidence_ids),
+            ("observation_ids", observation_ids),
+            ("interpretation_ids", interpretation_ids),
+            ("model_spec_ids", model_spec_ids),
+            ("model_state_ids", model_state_ids),
+            ("orientation_ids", orientation_ids),
+            ("option_ids", option_ids),
+            ("recommendation_ids", recommendation_ids),
+            ("outcome_ids", outcome_ids),
+            ("review_ids", review_ids),
+        ):
+            if ids:
+                current = getattr(self, name)
+                new_ids, id_sets[name] = append_unique_indexed(current, id_sets.get(name), *ids)
+                if new_ids is not current:
+                    changes[name] = new_ids
+                    mask |= _LINEAGE_BIT[name]
+
+        if not changes:
+            return self
+        return copy_with(self, _id_sets=id_sets, _nonempty_mask=mask, **changes)
+
+    def merge(self, other: "Lineage") -> "Lineage":
+        """
+        Append every id from `other` (in its order, deduped) in one step; only other's
+        non-empty fields are visited.
+        """
+        mask = other._nonempty_mask
+        if not mask:
+            return self
+        return self.extend(**{name: getattr(other, name) for name, bit in _LINEAGE_BIT.items() if mask & bit})
+
+    def _append_ids(self, name: str, *ids: str) -> "Lineage":
+        return self.extend(**{name: ids})
+
     def add_raw_inputs(self, *ids: str) -> "Lineage":
-        return replace(self, raw_input_ids=_append_unique(self.raw_input_ids, *ids))
+        return self._append_ids("raw_input_ids", *ids)
 
     def add_evidence(self, *ids: str) -> "Lineage":
-        return replace(self, evidence_ids=_append_unique(self.evidence_ids, *ids))
+        return self._append_ids("evidence_ids", *ids)
 
     def add_observations(self, *ids: str) -> "Lineage":
-        return replace(self, observation_ids=_append_unique(self.observation_ids, *ids))
+        return self._append_ids("observation_ids", *ids)
 
     def add_interpretations(self, *ids: str) -> "Lineage":
-        return replace(self, interpretation_ids=_append_unique(self.interpretation_ids, *ids))
+        return self._append_ids("interpretation_ids", *ids)
 
     def add_model_specs(self, *ids: str) -> "Lineage":
-        return replace(self, model_spec_ids=_append_unique(self.model_spec_ids, *ids))
+        return self._append_ids("model_spec_ids", *ids)
 
     def add_model_states(self, *ids: str) -> "Lineage":
-        return replace(self, model_state_ids=_append_unique(self.model_state_ids, *ids))
+        return self._append_ids("model_state_ids", *ids)
 
     def add_orientations(self, *ids: str) -> "Lineage":
-        return replace(self, orientation_ids=_append_unique(self.orientation_ids, *ids))
+        return self._append_ids("orientation_ids", *ids)
 
     def add_options(self, *ids: str) -> "Lineage":
-        return replace(self, option_ids=_append_unique(self.option_ids, *ids))
+        return self._append_ids("option_ids", *ids)
 
     def add_recommendations(self, *ids: str) -> "Lineage":
-        return replace(self, recommendation_ids=_append_unique(self.recommendation_ids, *ids))
+        return self._append_ids("recommendation_ids", *ids)
 
     def add_outcomes(self, *ids: str) -> "Lineage":
-        return replace(self, outcome_ids=_append_unique(self.outcome_ids, *ids))
+        return self._append_ids("outcome_ids", *ids)
 
     def add_reviews(self, *ids: str) -> "Lineage":
-        return replace(self, review_ids=_append_unique(self.review_ids, *ids))
+        return self._append_ids("review_ids", *ids)
 
     # -----------------------
     # Convenience
     # -----------------------
 
     def is_empty(self) -> bool:
-        return not any(
-            bool(_as_tuple(getattr(self, f)))
-            for f in (
-                "raw_input_ids",
-                "evidence_ids",
-                "observation_ids",
-                "interpretation_ids",
-                "model_spec_ids",
-                "model_state_ids",
-                "orientation_ids",
-                "option_ids",
-                "recommendation_ids",
-                "outcome_ids",
-                "review_ids",
-            )
-        )
+        return not self._nonempty_mask
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuditTrail:
     """
     A top-level auditable record for a decision episode or artifact.
@@ -123,7 +193,7 @@ class AuditTrail:
 
     # Optional: immutable digest summary, or storage pointers
     notes: Optional[str] = None
-    meta: Mapping[str, object] = field(default_factory=dict)
+    meta: Mapping[str, object] = field(default_factory=empty_meta)
 
     def __post_init__(self) -> None:
         if self.subject_id == "":
@@ -131,23 +201,43 @@ class AuditTrail:
         if self.subject_type == "":
             raise ValueError("AuditTrail.subject_type must be set (non-empty)")
 
+        # subject_type is a small closed vocabulary ("Recommendation", "Outcome", ...): share one object.
+        if type(self.subject_type) is str:
+            object.__setattr__(self, "subject_type", sys.intern(self.subject_type))
+
+    __hash__ = hash_by_id("audit_id")
+
+    __replace__ = replace_fields
+
+    @classmethod
+    def from_trusted_tuples(cls, **fields: object) -> "AuditTrail":
+        """
+        Rebuild a stored AuditTrail without __init__ (no non-empty checks, no interning).
+        Skips the id/timestamp default factories for fields that are supplied.
+        """
+        return from_trusted(cls, **fields)
+
     # -----------------------
     # Immutability helpers
     # -----------------------
 
     def with_notes(self, notes: Optional[str]) -> "AuditTrail":
-        return replace(self, notes=notes)
+        return copy_with(self, notes=notes)
 
     def with_meta(self, **meta: object) -> "AuditTrail":
-        return replace(self, meta=_merge_meta(self.meta, meta))
+        merged = merge_meta(self.meta, meta)
+        if merged is self.meta:
+            return self
+        return copy_with(self, meta=merged)
 
     def with_lineage(self, lineage: Lineage) -> "AuditTrail":
-        return replace(self, lineage=lineage)
+        return copy_with(self, lineage=lineage)
 
     # Convenience: mutate lineage immutably in one call
     def add_lineage(
         self,
         *,
+        lineage: Optional[Lineage] = None,
         raw_input_ids: Sequence[str] = (),
         evidence_ids: Sequence[str] = (),
         observation_ids: Sequence[str] = (),
@@ -160,27 +250,24 @@ class AuditTrail:
         outcome_ids: Sequence[str] = (),
         review_ids: Sequence[str] = (),
     ) -> "AuditTrail":
-        lin = self.lineage
-        if raw_input_ids:
-            lin = lin.add_raw_inputs(*raw_input_ids)
-        if evidence_ids:
-            lin = lin.add_evidence(*evidence_ids)
-        if observation_ids:
-            lin = lin.add_observations(*observation_ids)
-        if interpretation_ids:
-            lin = lin.add_interpretations(*interpretation_ids)
-        if model_spec_ids:
-            lin = lin.add_model_specs(*model_spec_ids)
-        if model_state_ids:
-            lin = lin.add_model_states(*model_state_ids)
-        if orientation_ids:
-            lin = lin.add_orientations(*orientation_ids)
-        if option_ids:
-            lin = lin.add_options(*option_ids)
-        if recommendation_ids:
-            lin = lin.add_recommendations(*recommendation_ids)
-        if outcome_ids:
-            lin = lin.add_outcomes(*outcome_ids)
-        if review_ids:
-            lin = lin.add_reviews(*review_ids)
-        return replace(self, lineage=lin)
+        """
+        Append ids to this trail's lineage; `lineage` merges a whole Lineage first
+        (see Lineage.merge), then the per-category ids are appended.
+        """
+        lin = self.lineage if lineage is None else self.lineage.merge(lineage)
+        lin = lin.extend(
+            raw_input_ids=raw_input_ids,
+            evidence_ids=evidence_ids,
+            observation_ids=observation_ids,
+            interpretation_ids=interpretation_ids,
+            model_spec_ids=model_spec_ids,
+            model_state_ids=model_state_ids,
+            orientation_ids=orientation_ids,
+            option_ids=option_ids,
+            recommendation_ids=recommendation_ids,
+            outcome_ids=outcome_ids,
+            review_ids=review_ids,
+        )
+        if lin is self.lineage:
+            return self
+        return copy_with(self, lineage=lin)
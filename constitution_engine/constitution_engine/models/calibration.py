@@ -4,10 +4,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Mapping, Sequence
 
+from ._dataclass_tools import empty_meta, from_trusted
 from .types import Confidence, Uncertainty, new_id, now_utc
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CalibrationNote:
     """
     A human-authored, auditable learning artifact.
@@ -25,15 +26,23 @@ class CalibrationNote:
 
     episode_id: str = ""
     review_id: str = ""
-    outcome_ids: Sequence[str] = field(default_factory=tuple)
+    outcome_ids: Sequence[str] = ()
 
     summary: str = ""
-    proposed_changes: Sequence[str] = field(default_factory=tuple)
+    proposed_changes: Sequence[str] = ()
 
     # Optional structured hints for future adapters (safe, not executable)
-    patch: Mapping[str, Any] = field(default_factory=dict)
+    patch: Mapping[str, Any] = field(default_factory=empty_meta)
 
-    confidence: Confidence = field(default_factory=lambda: Confidence(0.5))
-    uncertainties: Sequence[Uncertainty] = field(default_factory=tuple)
+    confidence: Confidence = Confidence(0.5)
+    uncertainties: Sequence[Uncertainty] = ()
 
-    meta: Mapping[str, Any] = field(default_factory=dict)
+    meta: Mapping[str, Any] = field(default_factory=empty_meta)
+
+    @classmethod
+    def from_trusted_tuples(cls, **fields: Any) -> "CalibrationNote":
+        """
+        Rebuild a stored CalibrationNote without __init__: sequence fields must already be tuples.
+        Skips the id/timestamp default factories for fields that are supplied.
+        """
+        return from_trusted(cls, **fields)
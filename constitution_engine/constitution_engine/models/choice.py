@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+from ._dataclass_tools import hash_by_id
 from .types import new_id, now_utc
 
 
@@ -14,7 +15,7 @@ class ChoiceBy(str, Enum):
     MODULE = "module"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChoiceRecord:
     """
     Canonical commitment record:
@@ -45,3 +46,5 @@ class ChoiceRecord:
         # Normalize None-like rationale to empty string (while keeping dataclass frozen).
         if self.rationale is None:
             object.__setattr__(self, "rationale", "")
+
+    __hash__ = hash_by_id("choice_id")
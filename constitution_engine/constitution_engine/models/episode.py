@@ -1,44 +1,42 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Mapping, Optional, Sequence, Tuple, TypeVar
 
+from ._dataclass_tools import FrozenDict, MemoSlots, append_unique_indexed, copy_with, replace_fields, empty_meta, from_trusted, merge_meta, hash_by_id
 from .types import new_id, now_utc
 
 
 _T = TypeVar("_T")
 
 
-def _as_tuple(seq: Sequence[str]) -> Tuple[str, ...]:
-    # normalize any incoming sequence to an immutable tuple
-    return tuple(seq)
-
-
-def _append_unique(seq: Sequence[str], *items: str) -> Tuple[str, ...]:
-    """
-    Append IDs while preserving order and avoiding duplicates.
-    Deterministic + stable for audit/indexing.
-    """
-    out = list(_as_tuple(seq))
-    seen = set(out)
-    for it in items:
-        if it and it not in seen:
-            out.append(it)
-            seen.add(it)
-    return tuple(out)
-
-
-def _merge_meta(base: Mapping[str, object], patch: Mapping[str, object]) -> Mapping[str, object]:
-    if not patch:
-        return dict(base)
-    out = dict(base)
-    out.update(patch)
-    return out
-
-
-@dataclass(frozen=True)
-class DecisionEpisode:
+_ID_FIELDS: Tuple[str, ...] = (
+    "raw_input_ids",
+    "evidence_ids",
+    "observation_ids",
+    "interpretation_ids",
+    "model_spec_ids",
+    "model_state_ids",
+    "orientation_ids",
+    "option_ids",
+    "recommendation_ids",
+    "choice_ids",
+    "outcome_ids",
+    "review_ids",
+    "calibration_ids",
+    "audit_ids",
+)
+
+
+class _EpisodeMemo(MemoSlots):
+    # Private: per-field membership sets reused by the add_*/log_* appenders (filled lazily).
+    __slots__ = ("_id_sets",)
+    _memo_defaults = FrozenDict(_id_sets=FrozenDict())
+
+
+@dataclass(frozen=True, slots=True)
+class DecisionEpisode(_EpisodeMemo):
     """
     A thin container that indexes a whole Observe→Model→Orient→Act→Review loop.
 
@@ -50,23 +48,23 @@ class DecisionEpisode:
     title: Optional[str] = None
     description: Optional[str] = None
 
-    raw_input_ids: Sequence[str] = field(default_factory=tuple)
-    evidence_ids: Sequence[str] = field(default_factory=tuple)
-    observation_ids: Sequence[str] = field(default_factory=tuple)
-    interpretation_ids: Sequence[str] = field(default_factory=tuple)
-    model_spec_ids: Sequence[str] = field(default_factory=tuple)
-    model_state_ids: Sequence[str] = field(default_factory=tuple)
-    orientation_ids: Sequence[str] = field(default_factory=tuple)
-    option_ids: Sequence[str] = field(default_factory=tuple)
-    recommendation_ids: Sequence[str] = field(default_factory=tuple)
+    raw_input_ids: Tuple[str, ...] = ()
+    evidence_ids: Tuple[str, ...] = ()
+    observation_ids: Tuple[str, ...] = ()
+    interpretation_ids: Tuple[str, ...] = ()
+    model_spec_ids: Tuple[str, ...] = ()
+    model_state_ids: Tuple[str, ...] = ()
+    orientation_ids: Tuple[str, ...] = ()
+    option_ids: Tuple[str, ...] = ()
+    recommendation_ids: Tuple[str, ...] = ()
 
     # NEW: explicit commitment records (IDs-only, append-only)
-    choice_ids: Sequence[str] = field(default_factory=tuple)
+    choice_ids: Tuple[str, ...] = ()
 
-    outcome_ids: Sequence[str] = field(default_factory=tuple)
-    review_ids: Sequence[str] = field(default_factory=tuple)
-    calibration_ids: Sequence[str] = field(default_factory=tuple)
-    audit_ids: Sequence[str] = field(default_factory=tuple)
+    outcome_ids: Tuple[str, ...] = ()
+    review_ids: Tuple[str, ...] = ()
+    calibration_ids: Tuple[str, ...] = ()
+    audit_ids: Tuple[str, ...] = ()
 
     # Act marker (makes the invariant “acted ⇒ outcome” precise)
     acted: bool = False
@@ -76,88 +74,146 @@ class DecisionEpisode:
     # It can be treated as "primary/first choice" for thin-slice flows.
     chosen_option_id: Optional[str] = None
 
-    meta: Mapping[str, object] = field(default_factory=dict)
+    meta: Mapping[str, object] = field(default_factory=empty_meta)
 
     def __post_init__(self) -> None:
         # Normalize sequences defensively so immutability is real even if callers pass lists.
-        object.__setattr__(self, "raw_input_ids", _as_tuple(self.raw_input_ids))
-        object.__setattr__(self, "evidence_ids", _as_tuple(self.evidence_ids))
-        object.__setattr__(self, "observation_ids", _as_tuple(self.observation_ids))
-        object.__setattr__(self, "interpretation_ids", _as_tuple(self.interpretation_ids))
-        object.__setattr__(self, "model_spec_ids", _as_tuple(self.model_spec_ids))
-        object.__setattr__(self, "model_state_ids", _as_tuple(self.model_state_ids))
-        object.__setattr__(self, "orientation_ids", _as_tuple(self.orientation_ids))
-        object.__setattr__(self, "option_ids", _as_tuple(self.option_ids))
-        object.__setattr__(self, "recommendation_ids", _as_tuple(self.recommendation_ids))
-        object.__setattr__(self, "choice_ids", _as_tuple(self.choice_ids))
-        object.__setattr__(self, "outcome_ids", _as_tuple(self.outcome_ids))
-        object.__setattr__(self, "review_ids", _as_tuple(self.review_ids))
-        object.__setattr__(self, "calibration_ids", _as_tuple(self.calibration_ids))
-        object.__setattr__(self, "audit_ids", _as_tuple(self.audit_ids))
-
-        # Minimal consistency: if acted is True, we *prefer* chosen_option_id set,
-        # but we do not hard-fail here; invariants enforce strictness.
-        if self.acted and not self.chosen_option_id and not self.choice_ids:
-            pass
+        # Exact type check: tuples (the common case, e.g. from add_*/replace) are left as-is.
+        for name in _ID_FIELDS:
+            v = getattr(self, name)
+            if type(v) is not tuple:
+                object.__setattr__(self, name, tuple(v))
+        self._init_memos()
+
+        # acted without chosen_option_id/choice_ids is allowed here; invariants enforce strictness.
+
+    __hash__ = hash_by_id("episode_id")
+
+    __replace__ = replace_fields
+
+    @classmethod
+    def from_trusted_tuples(cls, **fields: object) -> "DecisionEpisode":
+        """
+        Rebuild a stored episode without __init__: id fields must already be tuples.
+        Skips the id/timestamp default factories for fields that are supplied.
+        """
+        return from_trusted(cls, **fields)
 
     # -----------------------
     # Immutability helpers
     # -----------------------
 
     def with_title(self, title: Optional[str]) -> "DecisionEpisode":
-        return replace(self, title=title)
+        return copy_with(self, title=title)
 
     def with_description(self, description: Optional[str]) -> "DecisionEpisode":
-        return replace(self, description=description)
+        return copy_with(self, description=description)
 
     def with_meta(self, **meta: object) -> "DecisionEpisode":
-        return replace(self, meta=_merge_meta(self.meta, meta))
+        merged = merge_meta(self.meta, meta)
+        if merged is self.meta:
+            return self
+        return copy_with(self, meta=merged)
 
     # -----------------------
     # Adders (dedupe + stable)
     # -----------------------
 
+    def extend(
+        self,
+        *,
+        raw_input_ids: Sequence[str] = (),
+        evidence_ids: Sequence[str] = (),
+        observation_ids: Sequence[str] = (),
+        interpretation_ids: Sequence[str] = (),
+        model_spec_ids: Sequence[str] = (),
+        model_state_ids: Sequence[str] = (),
+        orientation_ids: Sequence[str] = (),
+        option_ids: Sequence[str] = (),
+        recommendation_ids: Sequence[str] = (),
+        choice_ids: Sequence[str] = (),
+        outcome_ids: Sequence[str] = (),
+        review_ids: Sequence[str] = (),
+        calibration_ids: Sequence[str] = (),
+        audit_ids: Sequence[str] = (),
+    ) -> "DecisionEpisode":
+        """
+        Append to several id categories in one step (a single new episode instead of one per add_*).
+        Same dedupe/ordering semantics as the individual add_* helpers.
+        """
+        id_sets = dict(self._id_sets)
+        changes: dict[str, Tuple[str, ...]] = {}
+        for name, ids in (
+            ("raw_input_ids", raw_input_ids),
+            ("evidence_ids", evidence_ids),
+            ("observation_ids", observation_ids),
+            ("interpretation_ids", interpretation_ids),
+            ("model_spec_ids", model_spec_ids),
+            ("model_state_ids", model_state_ids),
+            ("orientation_ids", orientation_ids),
+            ("option_ids", option_ids),
+            ("recommendation_ids", recommendation_ids),
+            ("choice_ids", choice_ids),
+            ("outcome_ids", outcome_ids),
+            ("review_ids", review_ids),
+            ("calibration_ids", calibration_ids),
+            ("audit_ids", audit_ids),
+        ):
+            if ids:
+                current = getattr(self, name)
+                new_ids, id_sets[name] = append_unique_indexed(current, id_sets.get(name), *ids)
+                if new_ids is not current:
+                    changes[name] = new_ids
+
+        if not changes:
+            # Nothing new (empty or already-present ids): keep this episode.
+            return self
+        return copy_with(self, _id_sets=id_sets, **changes)
+
+    def _append_ids(self, name: str, *ids: str) -> "DecisionEpisode":
+        return self.extend(**{name: ids})
+
     def add_raw_inputs(self, *raw_input_ids: str) -> "DecisionEpisode":
-        return replace(self, raw_input_ids=_append_unique(self.raw_input_ids, *raw_input_ids))
+        return self._append_ids("raw_input_ids", *raw_input_ids)
 
     def add_evidence(self, *evidence_ids: str) -> "DecisionEpisode":
-        return replace(self, evidence_ids=_append_unique(self.evidence_ids, *evidence_ids))
+        return self._append_ids("evidence_ids", *evidence_ids)
 
     def add_observations(self, *observation_ids: str) -> "DecisionEpisode":
-        return replace(self, observation_ids=_append_unique(self.observation_ids, *observation_ids))
+        return self._append_ids("observation_ids", *observation_ids)
 
     def add_interpretations(self, *interpretation_ids: str) -> "DecisionEpisode":
-        return replace(self, interpretation_ids=_append_unique(self.interpretation_ids, *interpretation_ids))
+        return self._append_ids("interpretation_ids", *interpretation_ids)
 
     def add_model_specs(self, *model_spec_ids: str) -> "DecisionEpisode":
-        return replace(self, model_spec_ids=_append_unique(self.model_spec_ids, *model_spec_ids))
+        return self._append_ids("model_spec_ids", *model_spec_ids)
 
     def add_model_states(self, *model_state_ids: str) -> "DecisionEpisode":
-        return replace(self, model_state_ids=_append_unique(self.model_state_ids, *model_state_ids))
+        return self._append_ids("model_state_ids", *model_state_ids)
 
     def add_orientations(self, *orientation_ids: str) -> "DecisionEpisode":
-        return replace(self, orientation_ids=_append_unique(self.orientation_ids, *orientation_ids))
+        return self._append_ids("orientation_ids", *orientation_ids)
 
     def add_options(self, *option_ids: str) -> "DecisionEpisode":
-        return replace(self, option_ids=_append_unique(self.option_ids, *option_ids))
+        return self._append_ids("option_ids", *option_ids)
 
     def add_recommendations(self, *recommendation_ids: str) -> "DecisionEpisode":
-        return replace(self, recommendation_ids=_append_unique(self.recommendation_ids, *recommendation_ids))
+        return self._append_ids("recommendation_ids", *recommendation_ids)
 
     def add_choices(self, *choice_ids: str) -> "DecisionEpisode":
-        return replace(self, choice_ids=_append_unique(self.choice_ids, *choice_ids))
+        return self._append_ids("choice_ids", *choice_ids)
 
     def add_outcomes(self, *outcome_ids: str) -> "DecisionEpisode":
-        return replace(self, outcome_ids=_append_unique(self.outcome_ids, *outcome_ids))
+        return self._append_ids("outcome_ids", *outcome_ids)
 
     def add_reviews(self, *review_ids: str) -> "DecisionEpisode":
-        return replace(self, review_ids=_append_unique(self.review_ids, *review_ids))
+        return self._append_ids("review_ids", *review_ids)
 
     def add_calibrations(self, *calibration_ids: str) -> "DecisionEpisode":
-        return replace(self, calibration_ids=_append_unique(self.calibration_ids, *calibration_ids))
+        return self._append_ids("calibration_ids", *calibration_ids)
 
     def add_audits(self, *audit_ids: str) -> "DecisionEpisode":
-        return replace(self, audit_ids=_append_unique(self.audit_ids, *audit_ids))
+        return self._append_ids("audit_ids", *audit_ids)
 
     # -----------------------
     # Act helpers
@@ -191,7 +247,7 @@ class DecisionEpisode:
                 f"Episode already acted on {self.chosen_option_id}; cannot change to {chosen_option_id}."
             )
 
-        return replace(
+        return copy_with(
             self,
             acted=True,
             chosen_option_id=chosen_option_id or self.chosen_option_id,
@@ -210,7 +266,7 @@ class DecisionEpisode:
         """
         if not choice_id:
             raise ValueError("choice_id is required")
-        return replace(self, choice_ids=_append_unique(self.choice_ids, choice_id))
+        return self._append_ids("choice_ids", choice_id)
 
     def log_outcome(self, outcome_id: str) -> "DecisionEpisode":
         """
@@ -220,7 +276,7 @@ class DecisionEpisode:
         """
         if not outcome_id:
             raise ValueError("outcome_id is required")
-        return replace(self, outcome_ids=_append_unique(self.outcome_ids, outcome_id))
+        return self._append_ids("outcome_ids", outcome_id)
 
     def log_review(self, review_id: str) -> "DecisionEpisode":
         """
@@ -228,7 +284,7 @@ class DecisionEpisode:
         """
         if not review_id:
             raise ValueError("review_id is required")
-        return replace(self, review_ids=_append_unique(self.review_ids, review_id))
+        return self._append_ids("review_ids", review_id)
 
     def log_calibration(self, calibration_id: str) -> "DecisionEpisode":
         """
@@ -236,7 +292,7 @@ class DecisionEpisode:
         """
         if not calibration_id:
             raise ValueError("calibration_id is required")
-        return replace(self, calibration_ids=_append_unique(self.calibration_ids, calibration_id))
+        return self._append_ids("calibration_ids", calibration_id)
 
     def log_audit(self, audit_id: str) -> "DecisionEpisode":
         """
@@ -244,36 +300,36 @@ class DecisionEpisode:
         """
         if not audit_id:
             raise ValueError("audit_id is required")
-        return replace(self, audit_ids=_append_unique(self.audit_ids, audit_id))
+        return self._append_ids("audit_ids", audit_id)
 
     # -----------------------
     # Convenience selectors
     # -----------------------
 
     def latest_orientation_id(self) -> Optional[str]:
-        ids = _as_tuple(self.orientation_ids)
+        ids = self.orientation_ids
         return ids[-1] if ids else None
 
     def latest_recommendation_id(self) -> Optional[str]:
-        ids = _as_tuple(self.recommendation_ids)
+        ids = self.recommendation_ids
         return ids[-1] if ids else None
 
     def latest_choice_id(self) -> Optional[str]:
-        ids = _as_tuple(self.choice_ids)
+        ids = self.choice_ids
         return ids[-1] if ids else None
 
     def latest_outcome_id(self) -> Optional[str]:
-        ids = _as_tuple(self.outcome_ids)
+        ids = self.outcome_ids
         return ids[-1] if ids else None
 
     def latest_review_id(self) -> Optional[str]:
-        ids = _as_tuple(self.review_ids)
+        ids = self.review_ids
         return ids[-1] if ids else None
 
     def latest_calibration_id(self) -> Optional[str]:
-        ids = _as_tuple(self.calibration_ids)
+        ids = self.calibration_ids
         return ids[-1] if ids else None
 
     def latest_audit_id(self) -> Optional[str]:
-        ids = _as_tuple(self.audit_ids)
+        ids = self.audit_ids
         return ids[-1] if ids else None
@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Mapping, Optional, Sequence
 
+from ._dataclass_tools import empty_meta, from_trusted, hash_by_id
 from .types import new_id, now_utc, Confidence
 
 
@@ -34,8 +35,16 @@ class SourceRef:
     retrieved_at: datetime = field(default_factory=now_utc)
     extra: Mapping[str, Any] = field(default_factory=dict)
 
+    @classmethod
+    def from_trusted_tuples(cls, **fields: Any) -> "SourceRef":
+        """
+        Rebuild a stored SourceRef without __init__ (retrieved_at is taken as stored;
+        now_utc() only runs if it is omitted).
+        """
+        return from_trusted(cls, **fields)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Evidence:
     """
     A typed evidence bundle: sources + spans + notes.
@@ -45,11 +54,21 @@ class Evidence:
     evidence_id: str = field(default_factory=lambda: new_id("ev"))
     created_at: datetime = field(default_factory=now_utc)
 
-    sources: Sequence[SourceRef] = field(default_factory=tuple)
-    spans: Sequence[SpanRef] = field(default_factory=tuple)
+    sources: Sequence[SourceRef] = ()
+    spans: Sequence[SpanRef] = ()
 
     summary: Optional[str] = None
-    notes: Mapping[str, Any] = field(default_factory=dict)
+    notes: Mapping[str, Any] = field(default_factory=empty_meta)
 
     # Confidence in the evidence integrity (not the claim itself)
-    integrity: Confidence = field(default_factory=lambda: Confidence(1.0))
+    integrity: Confidence = Confidence(1.0)
+
+    __hash__ = hash_by_id("evidence_id")
+
+    @classmethod
+    def from_trusted_tuples(cls, **fields: Any) -> "Evidence":
+        """
+        Rebuild stored Evidence without __init__: sources/spans must already be tuples.
+        Skips the id/timestamp default factories for fields that are supplied.
+        """
+        return from_trusted(cls, **fields)
@@ -1,73 +1,45 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Mapping, Sequence, Tuple, Optional
 
-from .types import InfoType, Confidence, Uncertainty, new_id, now_utc
+from ._dataclass_tools import FrozenDict, MemoSlots, append_unique_indexed, copy_with, replace_fields, merge_meta, empty_meta, hash_by_id
+from .types import InfoType, Confidence, Uncertainty, new_id, now_utc, append_uncertainty, bulk_create
 
 
-_INTERPRETIVE_TYPES = {
+_INTERPRETIVE_TYPES = frozenset({
     InfoType.CLAIM,
     InfoType.EXPLANATION,
     InfoType.HYPOTHESIS,
     InfoType.FRAME,
-}
-
-
-def _as_tuple_str(seq: Sequence[str]) -> Tuple[str, ...]:
-    return tuple(seq)
-
-
-def _as_tuple_unc(seq: Sequence[Uncertainty]) -> Tuple[Uncertainty, ...]:
-    return tuple(seq)
-
-
-def _as_tuple_asm(seq: Sequence["Assumption"]) -> Tuple["Assumption", ...]:
-    return tuple(seq)
-
-
-def _append_unique_str(seq: Sequence[str], *items: str) -> Tuple[str, ...]:
-    out = list(_as_tuple_str(seq))
-    seen = set(out)
-    for it in items:
-        if it and it not in seen:
-            out.append(it)
-            seen.add(it)
-    return tuple(out)
-
-
-def _append_uncertainty(seq: Sequence[Uncertainty], *items: Uncertainty) -> Tuple[Uncertainty, ...]:
-    out = list(_as_tuple_unc(seq))
-    out.extend([u for u in items if u is not None])
-    return tuple(out)
+})
 
 
 def _append_assumptions(seq: Sequence["Assumption"], *items: "Assumption") -> Tuple["Assumption", ...]:
     """
     Append assumptions while deduping by assumption_id (stable identity).
     """
-    out = list(_as_tuple_asm(seq))
-    seen = {a.assumption_id for a in out}
+    if not items:
+        return tuple(seq)
+    seen = {a.assumption_id for a in seq}
+    new: dict[str, "Assumption"] = {}
     for a in items:
-        if a is None:
-            continue
-        if a.assumption_id not in seen:
-            out.append(a)
-            seen.add(a.assumption_id)
-    return tuple(out)
+        if a is not None and a.assumption_id not in seen:
+            new.setdefault(a.assumption_id, a)  # first occurrence wins, as before
+    if not new:
+        return tuple(seq)
+    return tuple(seq) + tuple(new.values())
 
 
-def _merge_meta(base: Mapping[str, Any], patch: Mapping[str, Any]) -> Mapping[str, Any]:
-    if not patch:
-        return dict(base)
-    out = dict(base)
-    out.update(patch)
-    return out
+class _AssumptionMemo(MemoSlots):
+    # Private: memoized max_uncertainty_level() (-1.0 = not computed yet; reset when uncertainties change).
+    __slots__ = ("_max_unc",)
+    _memo_defaults = FrozenDict(_max_unc=-1.0)
 
 
-@dataclass(frozen=True)
-class Assumption:
+@dataclass(frozen=True, slots=True)
+class Assumption(_AssumptionMemo):
     """
     A named assumption with explicit uncertainty.
     Uses stable IDs to keep audit robust through renames.
@@ -76,38 +48,57 @@ class Assumption:
     name: str = ""
     description: str = ""
 
-    confidence: Confidence = field(default_factory=lambda: Confidence(0.5))
-    uncertainties: Sequence[Uncertainty] = field(default_factory=tuple)
+    confidence: Confidence = Confidence(0.5)
+    uncertainties: Sequence[Uncertainty] = ()
 
     def __post_init__(self) -> None:
         if self.name.strip() == "" and self.description.strip() == "":
             # allow stubs, but prefer having at least one
             pass
+        self._init_memos()
+
+    __hash__ = hash_by_id("assumption_id")
+
+    __replace__ = replace_fields
 
     # -----------------------
     # Immutability helpers
     # -----------------------
 
     def with_name(self, name: str) -> "Assumption":
-        return replace(self, name=name)
+        return copy_with(self, name=name)
 
     def with_description(self, description: str) -> "Assumption":
-        return replace(self, description=description)
+        return copy_with(self, description=description)
 
     def with_confidence(self, confidence: Confidence) -> "Assumption":
-        return replace(self, confidence=confidence)
+        return copy_with(self, confidence=confidence)
 
     def add_uncertainties(self, *uncertainties: Uncertainty) -> "Assumption":
-        return replace(self, uncertainties=_append_uncertainty(self.uncertainties, *uncertainties))
+        merged = append_uncertainty(self.uncertainties, *uncertainties)
+        if merged is self.uncertainties:
+            return self
+        return copy_with(self, uncertainties=merged, _max_unc=-1.0)
 
     def max_uncertainty_level(self) -> Optional[float]:
         if not self.uncertainties:
             return None
-        return max(u.level for u in self.uncertainties)
+        level = self._max_unc
+        if level < 0.0:
+            level = max(u.level for u in self.uncertainties)
+            object.__setattr__(self, "_max_unc", level)
+        return level
+
+
+class _InterpretationMemo(MemoSlots):
+    # Private: per-field membership sets reused by the add_* id/tag appenders (filled lazily), and
+    # memoized max_uncertainty_level() (-1.0 = not computed yet; reset when uncertainties change).
+    __slots__ = ("_id_sets", "_max_unc")
+    _memo_defaults = FrozenDict(_id_sets=FrozenDict(), _max_unc=-1.0)
 
 
-@dataclass(frozen=True)
-class Interpretation:
+@dataclass(frozen=True, slots=True)
+class Interpretation(_InterpretationMemo):
     """
     Structured hypothesis / explanation that connects observations.
     """
@@ -118,50 +109,80 @@ class Interpretation:
     title: str = ""
     narrative: str = ""
 
-    observation_ids: Sequence[str] = field(default_factory=tuple)
-    evidence_ids: Sequence[str] = field(default_factory=tuple)
+    observation_ids: Sequence[str] = ()
+    evidence_ids: Sequence[str] = ()
 
-    assumptions: Sequence[Assumption] = field(default_factory=tuple)
-    confidence: Confidence = field(default_factory=lambda: Confidence(0.5))
-    uncertainties: Sequence[Uncertainty] = field(default_factory=tuple)
+    assumptions: Sequence[Assumption] = ()
+    confidence: Confidence = Confidence(0.5)
+    uncertainties: Sequence[Uncertainty] = ()
 
     model_payload: Any = None
-    meta: Mapping[str, Any] = field(default_factory=dict)
+    meta: Mapping[str, Any] = field(default_factory=empty_meta)
 
     def __post_init__(self) -> None:
         if self.info_type not in _INTERPRETIVE_TYPES:
             raise ValueError("Interpretation.info_type must be interpretive")
+        self._init_memos()
+
+    __hash__ = hash_by_id("interpretation_id")
+
+    __replace__ = replace_fields
+
+    @classmethod
+    def bulk_create(cls, specs: Sequence[Mapping[str, Any]]) -> Tuple["Interpretation", ...]:
+        """
+        Construct many Interpretations from constructor kwargs with one timestamp and one batched id draw.
+        """
+        return bulk_create(cls, "interpretation_id", "int", specs)
 
     # -----------------------
     # Immutability helpers
     # -----------------------
 
+    def _append_ids(self, name: str, *ids: str) -> "Interpretation":
+        current = getattr(self, name)
+        if type(current) is not tuple:
+            current = tuple(current)
+        new_ids, seen = append_unique_indexed(current, self._id_sets.get(name), *ids)
+        if new_ids is current:
+            return self
+        return copy_with(self, _id_sets={**self._id_sets, name: seen}, **{name: new_ids})
+
     def with_title(self, title: str) -> "Interpretation":
-        return replace(self, title=title)
+        return copy_with(self, title=title)
 
     def with_narrative(self, narrative: str) -> "Interpretation":
-        return replace(self, narrative=narrative)
+        return copy_with(self, narrative=narrative)
 
     def with_confidence(self, confidence: Confidence) -> "Interpretation":
-        return replace(self, confidence=confidence)
+        return copy_with(self, confidence=confidence)
 
     def with_model_payload(self, payload: Any) -> "Interpretation":
-        return replace(self, model_payload=payload)
+        return copy_with(self, model_payload=payload)
 
     def add_observations(self, *observation_ids: str) -> "Interpretation":
-        return replace(self, observation_ids=_append_unique_str(self.observation_ids, *observation_ids))
+        return self._append_ids("observation_ids", *observation_ids)
 
     def add_evidence(self, *evidence_ids: str) -> "Interpretation":
-        return replace(self, evidence_ids=_append_unique_str(self.evidence_ids, *evidence_ids))
+        return self._append_ids("evidence_ids", *evidence_ids)
 
     def add_assumptions(self, *assumptions: Assumption) -> "Interpretation":
-        return replace(self, assumptions=_append_assumptions(self.assumptions, *assumptions))
+        merged = _append_assumptions(self.assumptions, *assumptions)
+        if merged is self.assumptions:
+            return self
+        return copy_with(self, assumptions=merged)
 
     def add_uncertainties(self, *uncertainties: Uncertainty) -> "Interpretation":
-        return replace(self, uncertainties=_append_uncertainty(self.uncertainties, *uncertainties))
+        merged = append_uncertainty(self.uncertainties, *uncertainties)
+        if merged is self.uncertainties:
+            return self
+        return copy_with(self, uncertainties=merged, _max_unc=-1.0)
 
     def with_meta(self, **meta: Any) -> "Interpretation":
-        return replace(self, meta=_merge_meta(self.meta, meta))
+        merged = merge_meta(self.meta, meta)
+        if merged is self.meta:
+            return self
+        return copy_with(self, meta=merged)
 
     # -----------------------
     # Convenience
@@ -173,4 +194,8 @@ class Interpretation:
     def max_uncertainty_level(self) -> Optional[float]:
         if not self.uncertainties:
             return None
-        return max(u.level for u in self.uncertainties)
+        level = self._max_unc
+        if level < 0.0:
+            level = max(u.level for u in self.uncertainties)
+            object.__setattr__(self, "_max_unc", level)
+        return level
@@ -4,10 +4,12 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Mapping, Optional, Sequence
 
+from ._dataclass_tools import empty_meta, fast_frozen_init, hash_by_id
 from .types import new_id, now_utc
 
 
-@dataclass(frozen=True)
+@fast_frozen_init
+@dataclass(frozen=True, slots=True)
 class ModelSpec:
     """
     Declares a model family used by the engine, without hardcoding domain.
@@ -21,10 +23,13 @@ class ModelSpec:
     version: str = "0.0.0"
 
     description: Optional[str] = None
-    parameters_schema: Mapping[str, Any] = field(default_factory=dict)
+    parameters_schema: Mapping[str, Any] = field(default_factory=empty_meta)
 
+    __hash__ = hash_by_id("model_spec_id")
 
-@dataclass(frozen=True)
+
+@fast_frozen_init
+@dataclass(frozen=True, slots=True)
 class ModelState:
     """
     The current instantiated state of a ModelSpec (weights, priors, etc.)
@@ -33,11 +38,13 @@ class ModelState:
     created_at: datetime = field(default_factory=now_utc)
 
     model_spec_id: str = ""
-    parameters: Mapping[str, Any] = field(default_factory=dict)
+    parameters: Mapping[str, Any] = field(default_factory=empty_meta)
 
     # What influenced the state (for audit)
-    evidence_ids: Sequence[str] = field(default_factory=tuple)
-    observation_ids: Sequence[str] = field(default_factory=tuple)
-    interpretation_ids: Sequence[str] = field(default_factory=tuple)
+    evidence_ids: Sequence[str] = ()
+    observation_ids: Sequence[str] = ()
+    interpretation_ids: Sequence[str] = ()
 
     notes: Optional[str] = None
+
+    __hash__ = hash_by_id("model_state_id")
@@ -1,54 +1,30 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Mapping, Sequence, Tuple, Optional
 
-from .types import InfoType, Confidence, Uncertainty, new_id, now_utc
+from ._dataclass_tools import FrozenDict, MemoSlots, append_unique_indexed, copy_with, replace_fields, merge_meta, empty_meta, hash_by_id
+from .types import InfoType, Confidence, Uncertainty, new_id, now_utc, append_uncertainty, bulk_create
 
 
-_OBSERVATIONAL_TYPES = {
+_OBSERVATIONAL_TYPES = frozenset({
     InfoType.FACT,
     InfoType.MEASUREMENT,
     InfoType.EVENT,
     InfoType.TESTIMONY,
-}
+})
 
 
-def _as_tuple_str(seq: Sequence[str]) -> Tuple[str, ...]:
-    return tuple(seq)
+class _ObservationMemo(MemoSlots):
+    # Private: per-field membership sets reused by the add_* id/tag appenders (filled lazily), and
+    # memoized max_uncertainty_level() (-1.0 = not computed yet; reset when uncertainties change).
+    __slots__ = ("_id_sets", "_max_unc")
+    _memo_defaults = FrozenDict(_id_sets=FrozenDict(), _max_unc=-1.0)
 
 
-def _as_tuple_unc(seq: Sequence[Uncertainty]) -> Tuple[Uncertainty, ...]:
-    return tuple(seq)
-
-
-def _append_unique_str(seq: Sequence[str], *items: str) -> Tuple[str, ...]:
-    out = list(_as_tuple_str(seq))
-    seen = set(out)
-    for it in items:
-        if it and it not in seen:
-            out.append(it)
-            seen.add(it)
-    return tuple(out)
-
-
-def _append_uncertainty(seq: Sequence[Uncertainty], *items: Uncertainty) -> Tuple[Uncertainty, ...]:
-    out = list(_as_tuple_unc(seq))
-    out.extend([u for u in items if u is not None])
-    return tuple(out)
-
-
-def _merge_meta(base: Mapping[str, Any], patch: Mapping[str, Any]) -> Mapping[str, Any]:
-    if not patch:
-        return dict(base)
-    out = dict(base)
-    out.update(patch)
-    return out
-
-
-@dataclass(frozen=True)
-class Observation:
+@dataclass(frozen=True, slots=True)
+class Observation(_ObservationMemo):
     """
     Reality-anchored statement(s) derived from evidence, explicitly typed.
     Observations must be observational InfoTypes only.
@@ -60,45 +36,82 @@ class Observation:
     statement: str = ""
     data: Any = None
 
-    raw_input_ids: Sequence[str] = field(default_factory=tuple)
-    evidence_ids: Sequence[str] = field(default_factory=tuple)
+    raw_input_ids: Sequence[str] = ()
+    evidence_ids: Sequence[str] = ()
 
-    confidence: Confidence = field(default_factory=lambda: Confidence(0.5))
-    uncertainties: Sequence[Uncertainty] = field(default_factory=tuple)
+    confidence: Confidence = Confidence(0.5)
+    uncertainties: Sequence[Uncertainty] = ()
 
-    tags: Sequence[str] = field(default_factory=tuple)
-    meta: Mapping[str, Any] = field(default_factory=dict)
+    tags: Sequence[str] = ()
+    meta: Mapping[str, Any] = field(default_factory=empty_meta)
 
     def __post_init__(self) -> None:
         if self.info_type not in _OBSERVATIONAL_TYPES:
             raise ValueError(
                 f"Observation.info_type must be observational; got {self.info_type}"
             )
+        self._init_memos()
+
+    __hash__ = hash_by_id("observation_id")
+
+    __replace__ = replace_fields
+
+    @classmethod
+    def bulk_create(cls, specs: Sequence[Mapping[str, Any]]) -> Tuple["Observation", ...]:
+        """
+        Construct many Observations from constructor kwargs with one timestamp and one batched id draw.
+        """
+        return bulk_create(cls, "observation_id", "obs", specs)
 
     # -----------------------
     # Immutability helpers
     # -----------------------
 
+    def _append_ids(self, name: str, *ids: str) -> "Observation":
+        current = getattr(self, name)
+        if type(current) is not tuple:
+            current = tuple(current)
+        new_ids, seen = append_unique_indexed(current, self._id_sets.get(name), *ids)
+        if new_ids is current:
+            return self
+        return copy_with(self, _id_sets={**self._id_sets, name: seen}, **{name: new_ids})
+
     def with_statement(self, statement: str, *, data: Any = None) -> "Observation":
-        return replace(self, statement=statement, data=data if data is not None else self.data)
+        return copy_with(self, statement=statement, data=data if data is not None else self.data)
 
     def with_confidence(self, confidence: Confidence) -> "Observation":
-        return replace(self, confidence=confidence)
+        return copy_with(self, confidence=confidence)
 
     def add_raw_inputs(self, *raw_input_ids: str) -> "Observation":
-        return replace(self, raw_input_ids=_append_unique_str(self.raw_input_ids, *raw_input_ids))
+        return self._append_ids("raw_input_ids", *raw_input_ids)
 
     def add_evidence(self, *evidence_ids: str) -> "Observation":
-        return replace(self, evidence_ids=_append_unique_str(self.evidence_ids, *evidence_ids))
+        return self._append_ids("evidence_ids", *evidence_ids)
 
     def add_uncertainties(self, *uncertainties: Uncertainty) -> "Observation":
-        return replace(self, uncertainties=_append_uncertainty(self.uncertainties, *uncertainties))
+        merged = append_uncertainty(self.uncertainties, *uncertainties)
+        if merged is self.uncertainties:
+            return self
+        return copy_with(self, uncertainties=merged, _max_unc=-1.0)
 
     def add_tags(self, *tags: str) -> "Observation":
-        return replace(self, tags=_append_unique_str(self.tags, *tags))
+        return self._append_ids("tags", *tags)
 
     def with_meta(self, **meta: Any) -> "Observation":
-        return replace(self, meta=_merge_meta(self.meta, meta))
+        merged = merge_meta(self.meta, meta)
+        if merged is self.meta:
+            return self
+        return copy_with(self, meta=merged)
+
+    def builder(self) -> "ObservationBuilder":
+        """
+        Batch several with_*/add_* edits into a single new Observation:
+
+            with obs.builder() as b:
+                b.add_tags("a", "b").add_evidence("ev_1").with_meta(k=1)
+            obs2 = b.result
+        """
+        return ObservationBuilder(self)
 
     # -----------------------
     # Convenience checks
@@ -114,4 +127,93 @@ class Observation:
     def max_uncertainty_level(self) -> Optional[float]:
         if not self.uncertainties:
             return None
-        return max(u.level for u in self.uncertainties)
+        level = self._max_unc
+        if level < 0.0:
+            level = max(u.level for u in self.uncertainties)
+            object.__setattr__(self, "_max_unc", level)
+        return level
+
+
+class ObservationBuilder:
+    """
+    Mutable draft of Observation edits (see Observation.builder()).
+
+    Records edits and applies them in one copy on build(), with the same dedupe/ordering/no-op
+    semantics as the equivalent with_*/add_* chain but without its intermediate Observations.
+    """
+    __slots__ = ("_base", "_changes", "_ids", "_uncertainties", "_meta", "result")
+
+    def __init__(self, base: Observation) -> None:
+        self._base = base
+        self._changes: dict[str, Any] = {}
+        self._ids: dict[str, list[str]] = {}
+        self._uncertainties: list[Uncertainty] = []
+        self._meta: dict[str, Any] = {}
+        self.result: Optional[Observation] = None
+
+    def __enter__(self) -> "ObservationBuilder":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None:
+            self.build()
+
+    def with_statement(self, statement: str, *, data: Any = None) -> "ObservationBuilder":
+        self._changes["statement"] = statement
+        if data is not None:
+            self._changes["data"] = data
+        return self
+
+    def with_confidence(self, confidence: Confidence) -> "ObservationBuilder":
+        self._changes["confidence"] = confidence
+        return self
+
+    def add_raw_inputs(self, *raw_input_ids: str) -> "ObservationBuilder":
+        self._ids.setdefault("raw_input_ids", []).extend(raw_input_ids)
+        return self
+
+    def add_evidence(self, *evidence_ids: str) -> "ObservationBuilder":
+        self._ids.setdefault("evidence_ids", []).extend(evidence_ids)
+        return self
+
+    def add_tags(self, *tags: str) -> "ObservationBuilder":
+        self._ids.setdefault("tags", []).extend(tags)
+        return self
+
+    def add_uncertainties(self, *uncertainties: Uncertainty) -> "ObservationBuilder":
+        self._uncertainties.extend(uncertainties)
+        return self
+
+    def with_meta(self, **meta: Any) -> "ObservationBuilder":
+        self._meta.update(meta)
+        return self
+
+    def build(self) -> Observation:
+        base = self._base
+        changes = dict(self._changes)
+
+        id_sets = None
+        for name, ids in self._ids.items():
+            current = getattr(base, name)
+            if type(current) is not tuple:
+                current = tuple(current)
+            if id_sets is None:
+                id_sets = dict(base._id_sets)
+            new_ids, id_sets[name] = append_unique_indexed(current, id_sets.get(name), *ids)
+            if new_ids is not current:
+                changes[name] = new_ids
+        if id_sets is not None and changes.keys() & self._ids.keys():
+            changes["_id_sets"] = id_sets
+
+        if self._uncertainties:
+            merged = append_uncertainty(base.uncertainties, *self._uncertainties)
+            if merged is not base.uncertainties:
+                changes["uncertainties"] = merged
+                changes["_max_unc"] = -1.0
+
+        meta = merge_meta(base.meta, self._meta)
+        if meta is not base.meta:
+            changes["meta"] = meta
+
+        self.result = copy_with(base, **changes) if changes else base
+        return self.result
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Mapping, Optional, Sequence, Tuple
 
-from .types import Reversibility, Uncertainty, Impact, new_id, now_utc
+from ._dataclass_tools import FrozenDict, MemoSlots, append_unique_indexed, copy_with, replace_fields, merge_meta, empty_meta, hash_by_id
+from .types import Reversibility, Uncertainty, Impact, content_hash, new_id, now_utc, append_uncertainty, bulk_create
 
 
 class OptionKind(str, Enum):
@@ -14,40 +15,17 @@ class OptionKind(str, Enum):
     INFO_GATHERING = "info_gathering"
 
 
-def _as_tuple_str(seq: Sequence[str]) -> Tuple[str, ...]:
-    return tuple(seq)
+class _OptionMemo(MemoSlots):
+    # Private: per-field membership sets reused by the add_* id/tag appenders (filled lazily),
+    # memoized max_uncertainty_level() (-1.0 = not computed yet; reset when uncertainties change),
+    # and memoized content_hash() (None = not computed yet; reset by every copy).
+    __slots__ = ("_id_sets", "_max_unc", "_digest")
+    _memo_defaults = FrozenDict(_id_sets=FrozenDict(), _max_unc=-1.0, _digest=None)
+    _content_memos = frozenset({"_digest"})
 
 
-def _as_tuple_unc(seq: Sequence[Uncertainty]) -> Tuple[Uncertainty, ...]:
-    return tuple(seq)
-
-
-def _append_unique_str(seq: Sequence[str], *items: str) -> Tuple[str, ...]:
-    out = list(_as_tuple_str(seq))
-    seen = set(out)
-    for it in items:
-        if it and it not in seen:
-            out.append(it)
-            seen.add(it)
-    return tuple(out)
-
-
-def _append_uncertainty(seq: Sequence[Uncertainty], *items: Uncertainty) -> Tuple[Uncertainty, ...]:
-    out = list(_as_tuple_unc(seq))
-    out.extend([u for u in items if u is not None])
-    return tuple(out)
-
-
-def _merge_meta(base: Mapping[str, Any], patch: Mapping[str, Any]) -> Mapping[str, Any]:
-    if not patch:
-        return dict(base)
-    out = dict(base)
-    out.update(patch)
-    return out
-
-
-@dataclass(frozen=True)
-class Option:
+@dataclass(frozen=True, slots=True)
+class Option(_OptionMemo):
     """
     A possible action before ranking.
 
@@ -68,15 +46,15 @@ class Option:
     action_payload: Any = None
 
     orientation_id: Optional[str] = None
-    observation_ids: Sequence[str] = field(default_factory=tuple)
-    interpretation_ids: Sequence[str] = field(default_factory=tuple)
-    evidence_ids: Sequence[str] = field(default_factory=tuple)
+    observation_ids: Sequence[str] = ()
+    interpretation_ids: Sequence[str] = ()
+    evidence_ids: Sequence[str] = ()
 
-    reversibility: Reversibility = field(default_factory=lambda: Reversibility(0.5))
-    impact: Impact = field(default_factory=lambda: Impact(0.5))
-    uncertainties: Sequence[Uncertainty] = field(default_factory=tuple)
+    reversibility: Reversibility = Reversibility(0.5)
+    impact: Impact = Impact(0.5)
+    uncertainties: Sequence[Uncertainty] = ()
 
-    meta: Mapping[str, Any] = field(default_factory=dict)
+    meta: Mapping[str, Any] = field(default_factory=empty_meta)
 
     def __post_init__(self) -> None:
         # Keep this permissive enough for early drafts, but never allow nonsense scalars
@@ -85,19 +63,40 @@ class Option:
             # Options can be created as stubs, but it’s almost always a mistake.
             # We don't raise to preserve kernel neutrality; invariants can enforce later.
             pass
+        self._init_memos()
+
+    __hash__ = hash_by_id("option_id")
+
+    __replace__ = replace_fields
+
+    @classmethod
+    def bulk_create(cls, specs: Sequence[Mapping[str, Any]]) -> Tuple["Option", ...]:
+        """
+        Construct many Options from constructor kwargs with one timestamp and one batched id draw.
+        """
+        return bulk_create(cls, "option_id", "opt", specs)
 
     # -----------------------
     # Immutability helpers
     # -----------------------
 
+    def _append_ids(self, name: str, *ids: str) -> "Option":
+        current = getattr(self, name)
+        if type(current) is not tuple:
+            current = tuple(current)
+        new_ids, seen = append_unique_indexed(current, self._id_sets.get(name), *ids)
+        if new_ids is current:
+            return self
+        return copy_with(self, _id_sets={**self._id_sets, name: seen}, **{name: new_ids})
+
     def with_title(self, title: str) -> "Option":
-        return replace(self, title=title)
+        return copy_with(self, title=title)
 
     def with_description(self, description: str) -> "Option":
-        return replace(self, description=description)
+        return copy_with(self, description=description)
 
     def with_kind(self, kind: OptionKind) -> "Option":
-        return replace(self, kind=kind)
+        return copy_with(self, kind=kind)
 
     def with_action_class(self, action_class: Optional[str]) -> "Option":
         """
@@ -105,34 +104,40 @@ class Option:
         - None => not declared (should trigger INV-ACT-001 for EXECUTE options)
         - expected string values: "probe" | "limited" | "commit"
         """
-        return replace(self, action_class=action_class)
+        return copy_with(self, action_class=action_class)
 
     def with_action_payload(self, payload: Any) -> "Option":
-        return replace(self, action_payload=payload)
+        return copy_with(self, action_payload=payload)
 
     def with_orientation(self, orientation_id: Optional[str]) -> "Option":
-        return replace(self, orientation_id=orientation_id)
+        return copy_with(self, orientation_id=orientation_id)
 
     def with_reversibility(self, reversibility: Reversibility) -> "Option":
-        return replace(self, reversibility=reversibility)
+        return copy_with(self, reversibility=reversibility)
 
     def with_impact(self, impact: Impact) -> "Option":
-        return replace(self, impact=impact)
+        return copy_with(self, impact=impact)
 
     def add_observations(self, *observation_ids: str) -> "Option":
-        return replace(self, observation_ids=_append_unique_str(self.observation_ids, *observation_ids))
+        return self._append_ids("observation_ids", *observation_ids)
 
     def add_interpretations(self, *interpretation_ids: str) -> "Option":
-        return replace(self, interpretation_ids=_append_unique_str(self.interpretation_ids, *interpretation_ids))
+        return self._append_ids("interpretation_ids", *interpretation_ids)
 
     def add_evidence(self, *evidence_ids: str) -> "Option":
-        return replace(self, evidence_ids=_append_unique_str(self.evidence_ids, *evidence_ids))
+        return self._append_ids("evidence_ids", *evidence_ids)
 
     def add_uncertainties(self, *uncertainties: Uncertainty) -> "Option":
-        return replace(self, uncertainties=_append_uncertainty(self.uncertainties, *uncertainties))
+        merged = append_uncertainty(self.uncertainties, *uncertainties)
+        if merged is self.uncertainties:
+            return self
+        return copy_with(self, uncertainties=merged, _max_unc=-1.0)
 
     def with_meta(self, **meta: Any) -> "Option":
-        return replace(self, meta=_merge_meta(self.meta, meta))
+        merged = merge_meta(self.meta, meta)
+        if merged is self.meta:
+            return self
+        return copy_with(self, meta=merged)
 
     # -----------------------
     # Convenience
@@ -148,4 +153,19 @@ class Option:
     def max_uncertainty_level(self) -> Optional[float]:
         if not self.uncertainties:
             return None
-        return max(u.level for u in self.uncertainties)
+        level = self._max_unc
+        if level < 0.0:
+            level = max(u.level for u in self.uncertainties)
+            object.__setattr__(self, "_max_unc", level)
+        return level
+
+    def content_hash(self) -> str:
+        """
+        Stable digest of this Option's contents (changes whenever any field changes).
+        Computed once per instance.
+        """
+        digest = self._digest
+        if digest is None:
+            digest = content_hash(self)
+            object.__setattr__(self, "_digest", digest)
+        return digest
@@ -1,51 +1,59 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Mapping, Optional, Sequence, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, FrozenSet, Mapping, Optional, Sequence, Tuple
 
+from ._dataclass_tools import FrozenDict, MemoSlots, copy_with, replace_fields, merge_meta, EMPTY_META, empty_meta, hash_by_id
 from .types import RiskPosture, Weight, new_id, now_utc
 
 
-def _as_tuple(seq: Sequence) -> Tuple:
-    return tuple(seq)
-
-
 def _append(seq: Sequence, *items) -> Tuple:
-    out = list(_as_tuple(seq))
-    out.extend([it for it in items if it is not None])
-    return tuple(out)
+    # tuple(seq) is a no-op for tuples (the usual case).
+    return tuple(seq) + tuple(it for it in items if it is not None)
 
 
-def _append_unique_by_name(seq: Sequence, *items) -> Tuple:
+def _append_unique_by_name(
+    seq: Tuple[Any, ...],
+    seen_names: Optional[FrozenSet[Any]],
+    *items: Any,
+) -> Tuple[Tuple[Any, ...], FrozenSet[Any]]:
     """
     Deduplicate by `.name` when present; otherwise fall back to full object identity.
     This keeps orientation stable and avoids accidental duplicates.
+
+    `seen_names` is the name set of `seq` carried over from the previous add (built from seq when
+    None), so adds don't rescan the existing items. Returns the new tuple and its name set.
     """
-    out = list(_as_tuple(seq))
-    seen_names = {getattr(x, "name", None) for x in out}
+    if seen_names is None:
+        seen_names = frozenset(getattr(x, "name", None) for x in seq)
+    new: list[Any] = []
+    added: set[Any] = set()
     for it in items:
         if it is None:
             continue
         nm = getattr(it, "name", None)
         if nm is None:
-            out.append(it)
+            new.append(it)
             continue
-        if nm not in seen_names:
-            out.append(it)
-            seen_names.add(nm)
-    return tuple(out)
+        if nm not in seen_names and nm not in added:
+            new.append(it)
+            added.add(nm)
+    if not new:
+        return seq, seen_names
+    return seq + tuple(new), seen_names | added
 
 
-def _merge_meta(base: Mapping[str, Any], patch: Mapping[str, Any]) -> Mapping[str, Any]:
-    if not patch:
-        return dict(base)
-    out = dict(base)
-    out.update(patch)
-    return out
+# Shared Objective/Constraint/ValueSignal instances keyed by (class, field values); see .canonical().
+# Bounded rather than weak-valued: slots dataclasses only get a __weakref__ slot on 3.11+.
+@lru_cache(maxsize=1024)
+def _canonical(cls: type, *values: Any) -> Any:
+    return cls(*values)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Objective:
     """
     A goal the system is trying to advance.
@@ -58,8 +66,16 @@ class Objective:
         if not self.name.strip():
             raise ValueError("Objective.name must be non-empty")
 
+    @classmethod
+    def canonical(cls, name: str, description: str, weight: Weight = Weight(1.0)) -> "Objective":
+        """
+        One shared (immutable) instance per distinct field values, for objectives that get rebuilt
+        with the same content over and over; repeat calls skip construction and validation.
+        """
+        return _canonical(cls, name, description, weight)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Constraint:
     """
     A hard boundary (must-not-violate).
@@ -73,8 +89,15 @@ class Constraint:
         if not self.name.strip():
             raise ValueError("Constraint.name must be non-empty")
 
+    @classmethod
+    def canonical(cls, name: str, description: str, expression: Optional[str] = None) -> "Constraint":
+        """
+        Shared instance for these field values (see Objective.canonical).
+        """
+        return _canonical(cls, name, description, expression)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValueSignal:
     """
     A normative value or preference signal (not a constraint).
@@ -87,9 +110,23 @@ class ValueSignal:
         if not self.name.strip():
             raise ValueError("ValueSignal.name must be non-empty")
 
+    @classmethod
+    def canonical(cls, name: str, description: str, weight: Weight = Weight(1.0)) -> "ValueSignal":
+        """
+        Shared instance for these field values (see Objective.canonical).
+        """
+        return _canonical(cls, name, description, weight)
+
+
+class _OrientationMemo(MemoSlots):
+    # Private: memoized convenience views (None = not built yet; reset by the matching add_*), and
+    # per-field name sets reused by add_objectives/add_constraints/add_values (filled lazily).
+    __slots__ = ("_obj_wmap", "_val_wmap", "_cons_names", "_name_sets")
+    _memo_defaults = FrozenDict(_obj_wmap=None, _val_wmap=None, _cons_names=None, _name_sets=FrozenDict())
 
-@dataclass(frozen=True)
-class Orientation:
+
+@dataclass(frozen=True, slots=True)
+class Orientation(_OrientationMemo):
     """
     Explicit values/objectives/constraints and risk posture.
 
@@ -98,48 +135,63 @@ class Orientation:
     orientation_id: str = field(default_factory=lambda: new_id("ori"))
     created_at: datetime = field(default_factory=now_utc)
 
-    objectives: Tuple[Objective, ...] = field(default_factory=tuple)
-    constraints: Tuple[Constraint, ...] = field(default_factory=tuple)
-    values: Tuple[ValueSignal, ...] = field(default_factory=tuple)
+    objectives: Tuple[Objective, ...] = ()
+    constraints: Tuple[Constraint, ...] = ()
+    values: Tuple[ValueSignal, ...] = ()
 
     risk_posture: RiskPosture = RiskPosture.BALANCED
 
     # Optional: context about who/what set this orientation
     owner: Optional[str] = None
-    meta: Mapping[str, Any] = field(default_factory=dict)
+    meta: Mapping[str, Any] = field(default_factory=empty_meta)
 
     def __post_init__(self) -> None:
         # Normalize sequences -> tuples for immutability + audit stability
-        object.__setattr__(self, "objectives", _as_tuple(self.objectives))
-        object.__setattr__(self, "constraints", _as_tuple(self.constraints))
-        object.__setattr__(self, "values", _as_tuple(self.values))
-        object.__setattr__(self, "meta", dict(self.meta) if self.meta else {})
+        for name in ("objectives", "constraints", "values"):
+            v = getattr(self, name)
+            if type(v) is not tuple:
+                object.__setattr__(self, name, tuple(v))
+        object.__setattr__(self, "meta", dict(self.meta) if self.meta else EMPTY_META)
+        self._init_memos()
+
+    __hash__ = hash_by_id("orientation_id")
+
+    __replace__ = replace_fields
 
     # -----------------------
     # Immutability helpers
     # -----------------------
 
     def with_owner(self, owner: Optional[str]) -> "Orientation":
-        return replace(self, owner=owner)
+        return copy_with(self, owner=owner)
 
     def with_risk_posture(self, risk_posture: RiskPosture) -> "Orientation":
-        return replace(self, risk_posture=risk_posture)
+        return copy_with(self, risk_posture=risk_posture)
 
     def with_meta(self, **meta: Any) -> "Orientation":
-        return replace(self, meta=_merge_meta(self.meta, meta))
+        merged = merge_meta(self.meta, meta)
+        if merged is self.meta:
+            return self
+        return copy_with(self, meta=merged)
 
     # -----------------------
     # Adders (stable + mostly deduped)
     # -----------------------
 
+    def _append_named(self, name: str, view: str, *items: Any) -> "Orientation":
+        new_items, seen = _append_unique_by_name(getattr(self, name), self._name_sets.get(name), *items)
+        if new_items is getattr(self, name):
+            return self
+        return copy_with(self, _name_sets={**self._name_sets, name: seen}, **{name: new_items, view: None})
+
     def add_objectives(self, *objectives: Objective) -> "Orientation":
-        return replace(self, objectives=_append_unique_by_name(self.objectives, *objectives))
+        return self._append_named("objectives", "_obj_wmap", *objectives)
 
     def add_constraints(self, *constraints: Constraint) -> "Orientation":
-        return replace(self, constraints=_append_unique_by_name(self.constraints, *constraints))
+        return self._append_named("constraints", "_cons_names", *constraints)
 
     def add_values(self, *values: ValueSignal) -> "Orientation":
-        return replace(self, values=_append_unique_by_name(self.values, *values))
+        return self._append_named("values", "_val_wmap", *values)
 
     # -----------------------
     # Convenience
@@ -147,12 +199,25 @@ class Orientation:
 
     def objective_weight_map(self) -> Mapping[str, float]:
         """
-        Returns objective weights as plain floats for downstream scoring engines.
+        Returns objective weights as plain floats for downstream scoring engines
+        (read-only, built once per Orientation).
         """
-        return {o.name: float(o.weight) for o in self.objectives}
+        wmap = self._obj_wmap
+        if wmap is None:
+            wmap = MappingProxyType({o.name: float(o.weight) for o in self.objectives})
+            object.__setattr__(self, "_obj_wmap", wmap)
+        return wmap
 
     def value_weight_map(self) -> Mapping[str, float]:
-        return {v.name: float(v.weight) for v in self.values}
+        wmap = self._val_wmap
+        if wmap is None:
+            wmap = MappingProxyType({v.name: float(v.weight) for v in self.values})
+            object.__setattr__(self, "_val_wmap", wmap)
+        return wmap
 
     def constraint_names(self) -> Tuple[str, ...]:
-        return tuple(c.name for c in self.constraints)
+        names = self._cons_names
+        if names is None:
+            names = tuple(c.name for c in self.constraints)
+            object.__setattr__(self, "_cons_names", names)
+        return names
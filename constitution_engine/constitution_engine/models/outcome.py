@@ -4,10 +4,12 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Mapping, Optional, Sequence
 
+from ._dataclass_tools import empty_meta, fast_frozen_init, hash_by_id
 from .types import Confidence, Uncertainty, new_id, now_utc
 
 
-@dataclass(frozen=True)
+@fast_frozen_init
+@dataclass(frozen=True, slots=True)
 class Outcome:
     """
     What actually happened after an action/decision.
@@ -23,8 +25,10 @@ class Outcome:
     description: str = ""
     data: Any = None
 
-    evidence_ids: Sequence[str] = field(default_factory=tuple)
-    confidence: Confidence = field(default_factory=lambda: Confidence(0.5))
-    uncertainties: Sequence[Uncertainty] = field(default_factory=tuple)
+    evidence_ids: Sequence[str] = ()
+    confidence: Confidence = Confidence(0.5)
+    uncertainties: Sequence[Uncertainty] = ()
 
-    meta: Mapping[str, Any] = field(default_factory=dict)
+    meta: Mapping[str, Any] = field(default_factory=empty_meta)
+
+    __hash__ = hash_by_id("outcome_id")
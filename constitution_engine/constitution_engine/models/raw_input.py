@@ -4,12 +4,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Mapping, Optional
+from typing import Any, Mapping, Optional, Sequence, Tuple
 
-from .types import new_id, now_utc
+from ._dataclass_tools import empty_meta, fast_frozen_init, hash_by_id
+from .types import new_id, now_utc, bulk_create
 
 
-@dataclass(frozen=True)
+@fast_frozen_init
+@dataclass(frozen=True, slots=True)
 class RawInput:
     """
     Immutable record of what entered the system.
@@ -21,7 +23,16 @@ class RawInput:
     created_at: datetime = field(default_factory=now_utc)
 
     payload: Any = None
-    metadata: Mapping[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=empty_meta)
 
     # Optional: reference to a parent raw input if this is a derived ingestion step
     parent_raw_input_id: Optional[str] = None
+
+    __hash__ = hash_by_id("raw_input_id")
+
+    @classmethod
+    def bulk_create(cls, specs: Sequence[Mapping[str, Any]]) -> Tuple["RawInput", ...]:
+        """
+        Construct many RawInputs from constructor kwargs with one timestamp and one batched id draw.
+        """
+        return bulk_create(cls, "raw_input_id", "raw", specs)
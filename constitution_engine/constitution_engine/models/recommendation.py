@@ -1,59 +1,63 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, replace
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Mapping, Optional, Sequence, Tuple
-
-from .types import Confidence, Uncertainty, new_id, now_utc
-
-
-def _as_tuple_str(seq: Sequence[str]) -> Tuple[str, ...]:
-    return tuple(seq)
-
-
-def _as_tuple_ro(seq: Sequence["RankedOption"]) -> Tuple["RankedOption", ...]:
-    return tuple(seq)
-
-
-def _as_tuple_unc(seq: Sequence[Uncertainty]) -> Tuple[Uncertainty, ...]:
-    return tuple(seq)
-
-
-def _append_unique_str(seq: Sequence[str], *items: str) -> Tuple[str, ...]:
-    out = list(_as_tuple_str(seq))
-    seen = set(out)
-    for it in items:
-        if it and it not in seen:
-            out.append(it)
-            seen.add(it)
-    return tuple(out)
-
-
-def _append_uncertainty(seq: Sequence[Uncertainty], *items: Uncertainty) -> Tuple[Uncertainty, ...]:
-    out = list(_as_tuple_unc(seq))
-    out.extend([u for u in items if u is not None])
-    return tuple(out)
-
-
-def _merge_meta(base: Mapping[str, object], patch: Mapping[str, object]) -> Mapping[str, object]:
-    if not patch:
-        return dict(base)
-    out = dict(base)
-    out.update(patch)
-    return out
+from types import MappingProxyType
+from typing import Any, FrozenSet, Mapping, Optional, Sequence, Tuple
+
+from ._dataclass_tools import (
+    FrozenDict,
+    MemoSlots,
+    append_unique_indexed,
+    copy_with,
+    empty_meta,
+    field_names,
+    from_trusted,
+    merge_meta,
+)
+from .types import (
+    Confidence,
+    Uncertainty,
+    append_uncertainty,
+    content_hash,
+    new_id,
+    new_ids,
+    now_utc,
+)
+
+
+def _interned(items: Sequence[str]) -> Tuple[str, ...]:
+    # For small closed vocabularies (permission names, constraint names): one shared object per
+    # distinct string. Ids and free text (rationale, tradeoffs) are deliberately not interned.
+    return tuple(sys.intern(it) if type(it) is str else it for it in items)
+
+
+_RO_SEQ_FIELDS: Tuple[str, ...] = ("uncertainties", "tradeoffs", "constraint_checks")
+_REC_SEQ_FIELDS: Tuple[str, ...] = (
+    "ranked_options",
+    "evidence_ids",
+    "observation_ids",
+    "interpretation_ids",
+    "model_state_ids",
+    "override_scope_used",
+)
 
 
 def _validate_contiguous_ranks(ranked_options: Sequence["RankedOption"]) -> None:
-    ranks = [ro.rank for ro in ranked_options]
-    if not ranks:
+    """
+    Ranks must be exactly 1..n (any order). n ranks are a permutation of 1..n iff they are
+    n distinct values forming the set {1..n}; a repeated rank therefore fails as non-contiguous.
+    """
+    n = len(ranked_options)
+    if not n:
         return
-    if sorted(ranks) != list(range(1, len(ranks) + 1)):
+    ranks = {ro.rank for ro in ranked_options}
+    if len(ranks) != n or ranks != set(range(1, n + 1)):
         raise ValueError("RankedOption.rank must be contiguous starting at 1")
-    if len(set(ranks)) != len(ranks):
-        raise ValueError("RankedOption.rank values must be unique")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RankedOption:
     """
     An option with ranking metadata and explanation.
@@ -65,11 +69,11 @@ class RankedOption:
     score: float
     rationale: str
 
-    confidence: Confidence = field(default_factory=lambda: Confidence(0.5))
-    uncertainties: Sequence[Uncertainty] = field(default_factory=tuple)
+    confidence: Confidence = Confidence(0.5)
+    uncertainties: Tuple[Uncertainty, ...] = ()
 
-    tradeoffs: Sequence[str] = field(default_factory=tuple)
-    constraint_checks: Sequence[str] = field(default_factory=tuple)
+    tradeoffs: Tuple[str, ...] = ()
+    constraint_checks: Tuple[str, ...] = ()
 
     def __post_init__(self) -> None:
         if self.rank < 1:
@@ -77,38 +81,60 @@ class RankedOption:
         if not (0.0 <= float(self.score) <= 1.0):
             raise ValueError("RankedOption.score must be between 0.0 and 1.0")
 
-        # Normalize sequences defensively (immutability)
-        object.__setattr__(self, "uncertainties", tuple(self.uncertainties))
-        object.__setattr__(self, "tradeoffs", tuple(self.tradeoffs))
-        object.__setattr__(self, "constraint_checks", tuple(self.constraint_checks))
+        # Normalize sequences defensively (immutability); tuples (the usual case) are left as-is.
+        for name in _RO_SEQ_FIELDS:
+            v = getattr(self, name)
+            if type(v) is not tuple:
+                object.__setattr__(self, name, tuple(v))
+        if self.constraint_checks:
+            object.__setattr__(self, "constraint_checks", _interned(self.constraint_checks))
 
     # -----------------------
     # Immutability helpers
     # -----------------------
+    # These copy without re-running __post_init__: each passes only values that keep the
+    # instance valid (tuples from the appenders; with_score re-checks the score range itself).
+
+    def _append_strs(self, name: str, *items: str) -> "RankedOption":
+        current = getattr(self, name)
+        merged, _ = append_unique_indexed(current, None, *items)
+        if merged is current:
+            return self
+        return copy_with(self, **{name: merged})
 
     def with_rationale(self, rationale: str) -> "RankedOption":
-        return replace(self, rationale=rationale)
+        return copy_with(self, rationale=rationale)
 
     def with_score(self, score: float) -> "RankedOption":
         if not (0.0 <= float(score) <= 1.0):
             raise ValueError("RankedOption.score must be between 0.0 and 1.0")
-        return replace(self, score=float(score))
+        return copy_with(self, score=float(score))
 
     def with_confidence(self, confidence: Confidence) -> "RankedOption":
-        return replace(self, confidence=confidence)
+        return copy_with(self, confidence=confidence)
 
     def add_uncertainties(self, *uncertainties: Uncertainty) -> "RankedOption":
-        return replace(self, uncertainties=_append_uncertainty(self.uncertainties, *uncertainties))
+        merged = append_uncertainty(self.uncertainties, *uncertainties)
+        if merged is self.uncertainties:
+            return self
+        return copy_with(self, uncertainties=merged)
 
     def add_tradeoffs(self, *tradeoffs: str) -> "RankedOption":
-        return replace(self, tradeoffs=_append_unique_str(self.tradeoffs, *tradeoffs))
+        return self._append_strs("tradeoffs", *tradeoffs)
 
     def add_constraint_checks(self, *checks: str) -> "RankedOption":
-        return replace(self, constraint_checks=_append_unique_str(self.constraint_checks, *checks))
+        return self._append_strs("constraint_checks", *_interned(checks))
+
 
+class _RecommendationMemo(MemoSlots):
+    # Private: memoized content_hash() (None = not computed yet; reset by every copy).
+    __slots__ = ("_digest",)
+    _memo_defaults = FrozenDict(_digest=None)
+    _content_memos = frozenset({"_digest"})
 
-@dataclass(frozen=True)
-class Recommendation:
+
+@dataclass(frozen=True, slots=True)
+class Recommendation(_RecommendationMemo):
     """
     Ranked, explainable, uncertainty-aware action proposals.
 
@@ -122,23 +148,23 @@ class Recommendation:
     created_at: datetime = field(default_factory=now_utc)
 
     orientation_id: str = ""
-    ranked_options: Sequence[RankedOption] = field(default_factory=tuple)
+    ranked_options: Tuple[RankedOption, ...] = ()
 
-    evidence_ids: Sequence[str] = field(default_factory=tuple)
-    observation_ids: Sequence[str] = field(default_factory=tuple)
-    interpretation_ids: Sequence[str] = field(default_factory=tuple)
-    model_state_ids: Sequence[str] = field(default_factory=tuple)
+    evidence_ids: Tuple[str, ...] = ()
+    observation_ids: Tuple[str, ...] = ()
+    interpretation_ids: Tuple[str, ...] = ()
+    model_state_ids: Tuple[str, ...] = ()
 
     # v0.5.1 — override usage logging
     override_used: bool = False
-    override_scope_used: Sequence[str] = field(default_factory=tuple)
+    override_scope_used: Tuple[str, ...] = ()
 
     # v0.5.1 — justification outputs (kept permissive at model level; invariants may require non-empty)
     uncertainty_summary: Optional[str] = None
     proportionate_action_justification: Optional[str] = None
 
     summary: Optional[str] = None
-    meta: Mapping[str, object] = field(default_factory=dict)
+    meta: Mapping[str, object] = field(default_factory=empty_meta)
 
     def __post_init__(self) -> None:
         # Keep this strict; Recommendations without Orientation violate the kernel loop.
@@ -147,77 +173,156 @@ class Recommendation:
             raise ValueError("Recommendation.orientation_id must be set (non-empty)")
 
         # Normalize sequences defensively to tuples so immutability is real.
-        object.__setattr__(self, "ranked_options", tuple(self.ranked_options))
+        # Exact type check: tuples (the common case, e.g. from add_*) are left as-is.
+        for name in _REC_SEQ_FIELDS:
+            v = getattr(self, name)
+            if type(v) is not tuple:
+                object.__setattr__(self, name, tuple(v))
+        if self.override_scope_used:
+            object.__setattr__(self, "override_scope_used", _interned(self.override_scope_used))
         _validate_contiguous_ranks(self.ranked_options)
+        self._init_memos()
+
+    @classmethod
+    def create_batch(
+        cls,
+        specs: Sequence[Mapping[str, Any]],
+        *,
+        orientation_id: str,
+    ) -> Tuple["Recommendation", ...]:
+        """
+        Build many Recommendations under one orientation without a full __init__ per item.
 
-        object.__setattr__(self, "evidence_ids", tuple(self.evidence_ids))
-        object.__setattr__(self, "observation_ids", tuple(self.observation_ids))
-        object.__setattr__(self, "interpretation_ids", tuple(self.interpretation_ids))
-        object.__setattr__(self, "model_state_ids", tuple(self.model_state_ids))
-
-        object.__setattr__(self, "override_scope_used", tuple(self.override_scope_used))
+        orientation_id is checked once; the clock and the id source are read once per batch.
+        Each spec (field kwargs; orientation_id always comes from the argument) only gets tuple
+        normalization and the rank check, i.e. exactly what __post_init__ would do for it.
+        As with bulk_create, a spec that supplies its own recommendation_id or created_at keeps it.
+        Subclasses (which may extend __post_init__) are built through the constructor instead.
+        """
+        if orientation_id == "":
+            raise ValueError("Recommendation.orientation_id must be set (non-empty)")
+        if not specs:
+            return ()
+        if cls is not Recommendation:
+            ts = now_utc()
+            return tuple(
+                cls(**{"recommendation_id": rec_id, "created_at": ts, **spec, "orientation_id": orientation_id})
+                for rec_id, spec in zip(new_ids("rec", len(specs)), specs)
+            )
+
+        allowed = frozenset(field_names(cls))
+        # Every item is a copy of one defaults-filled template (shared timestamp, shared empty meta).
+        template = from_trusted(cls, recommendation_id="", created_at=now_utc(), orientation_id=orientation_id)
+        out = []
+        for rec_id, spec in zip(new_ids("rec", len(specs)), specs):
+            if not spec.keys() <= allowed:
+                bad = ", ".join(sorted(spec.keys() - allowed))
+                raise TypeError(f"Recommendation.create_batch got unexpected field(s): {bad}")
+            values = dict(spec)
+            for name in _REC_SEQ_FIELDS:
+                v = values.get(name)
+                if v is not None and type(v) is not tuple:
+                    values[name] = tuple(v)
+            if values.get("override_scope_used"):
+                values["override_scope_used"] = _interned(values["override_scope_used"])
+            _validate_contiguous_ranks(values.get("ranked_options", ()))
+            values.setdefault("recommendation_id", rec_id)
+            values["orientation_id"] = orientation_id
+            out.append(copy_with(template, **values))
+        return tuple(out)
 
     # -----------------------
     # Immutability helpers
     # -----------------------
+    # These copy without re-running __post_init__. orientation_id is never changed here, and
+    # add_ranked_options validates the combined ranks itself before copying.
+
+    def _append_ids(self, name: str, *ids: str) -> "Recommendation":
+        current = getattr(self, name)
+        merged, _ = append_unique_indexed(current, None, *ids)
+        if merged is current:
+            return self
+        return copy_with(self, **{name: merged})
 
     def with_summary(self, summary: Optional[str]) -> "Recommendation":
-        return replace(self, summary=summary)
+        return copy_with(self, summary=summary)
 
     def with_meta(self, **meta: object) -> "Recommendation":
-        return replace(self, meta=_merge_meta(self.meta, meta))
+        merged = merge_meta(self.meta, meta)
+        if merged is self.meta:
+            return self
+        return copy_with(self, meta=merged)
 
     def with_override_used(self, used: bool) -> "Recommendation":
-        return replace(self, override_used=bool(used))
+        return copy_with(self, override_used=bool(used))
 
     def with_override_scope_used(self, *scope_items: str) -> "Recommendation":
-        return replace(self, override_scope_used=_append_unique_str(self.override_scope_used, *scope_items))
+        return self._append_ids("override_scope_used", *_interned(scope_items))
 
     def with_uncertainty_summary(self, text: Optional[str]) -> "Recommendation":
-        return replace(self, uncertainty_summary=text)
+        return copy_with(self, uncertainty_summary=text)
 
     def with_proportionate_action_justification(self, text: Optional[str]) -> "Recommendation":
-        return replace(self, proportionate_action_justification=text)
+        return copy_with(self, proportionate_action_justification=text)
 
     def add_ranked_options(self, *ranked_options: RankedOption) -> "Recommendation":
-        new_ros = _as_tuple_ro(self.ranked_options) + tuple(ranked_options)
+        new_ros = self.ranked_options + tuple(ranked_options)
         # Ensure ranks remain contiguous; easiest is to require caller to supply rank numbers properly.
         _validate_contiguous_ranks(new_ros)
-        return replace(self, ranked_options=new_ros)
+        return copy_with(self, ranked_options=new_ros)
 
     def add_evidence(self, *evidence_ids: str) -> "Recommendation":
-        return replace(self, evidence_ids=_append_unique_str(self.evidence_ids, *evidence_ids))
+        return self._append_ids("evidence_ids", *evidence_ids)
 
     def add_observations(self, *observation_ids: str) -> "Recommendation":
-        return replace(self, observation_ids=_append_unique_str(self.observation_ids, *observation_ids))
+        return self._append_ids("observation_ids", *observation_ids)
 
     def add_interpretations(self, *interpretation_ids: str) -> "Recommendation":
-        return replace(self, interpretation_ids=_append_unique_str(self.interpretation_ids, *interpretation_ids))
+        return self._append_ids("interpretation_ids", *interpretation_ids)
 
     def add_model_states(self, *model_state_ids: str) -> "Recommendation":
-        return replace(self, model_state_ids=_append_unique_str(self.model_state_ids, *model_state_ids))
+        return self._append_ids("model_state_ids", *model_state_ids)
 
     # -----------------------
     # Convenience
     # -----------------------
 
     def top_option_id(self) -> Optional[str]:
-        if not self.ranked_options:
-            return None
-        # ranks are contiguous; rank=1 is top
-        top = min(self.ranked_options, key=lambda ro: ro.rank)
-        return top.option_id
+        # Ranks are validated to be exactly 1..n, so rank 1 is present whenever the tuple is non-empty.
+        for ro in self.ranked_options:
+            if ro.rank == 1:
+                return ro.option_id
+        return None
+
+    @property
+    def ranked_option_ids(self) -> FrozenSet[str]:
+        """
+        Option ids referenced by ranked_options (membership tests in invariants).
+        """
+        return frozenset(ro.option_id for ro in self.ranked_options)
+
+    def content_hash(self) -> str:
+        """
+        Stable digest of this Recommendation's contents (changes whenever any field changes).
+        Used as a cache key by validators; computed once per instance.
+        """
+        digest = self._digest
+        if digest is None:
+            digest = content_hash(self)
+            object.__setattr__(self, "_digest", digest)
+        return digest
 
     def ids_for_trace(self) -> Mapping[str, Sequence[str]]:
         """
         A compact, consistent way to expose provenance pointers for audit trail building.
+        Read-only view over the (already tuple) id fields; nothing is copied.
         """
-        return {
-            "evidence_ids": tuple(self.evidence_ids),
-            "observation_ids": tuple(self.observation_ids),
-            "interpretation_ids": tuple(self.interpretation_ids),
-            "model_state_ids": tuple(self.model_state_ids),
-        }
+        return MappingProxyType({
+            "evidence_ids": self.evidence_ids,
+            "observation_ids": self.observation_ids,
+            "interpretation_ids": self.interpretation_ids,
+            "model_state_ids": self.model_state_ids,
+        })
 
     def as_dict(self) -> Mapping[str, Any]:
         """
@@ -233,14 +338,8 @@ class Recommendation:
                     "rank": ro.rank,
                     "score": ro.score,
                     "rationale": ro.rationale,
-                    "confidence": getattr(ro.confidence, "value", ro.confidence),
-                    "uncertainties": [
-                        {
-                            "description": getattr(u, "description", None),
-                            "level": getattr(u, "level", None),
-                        }
-                        for u in ro.uncertainties
-                    ],
+                    "confidence": ro.confidence.value,
+                    "uncertainties": [{"description": u.description, "level": u.level} for u in ro.uncertainties],
                     "tradeoffs": list(ro.tradeoffs),
                     "constraint_checks": list(ro.constraint_checks),
                 }
@@ -1,21 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Mapping, Optional
 
+from ._dataclass_tools import copy_with, empty_meta, merge_meta
 from .types import new_id, now_utc
 
 
-def _merge_meta(base: Mapping[str, Any], patch: Mapping[str, Any]) -> Mapping[str, Any]:
-    if not patch:
-        return dict(base)
-    out = dict(base)
-    out.update(patch)
-    return out
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReviewRecord:
     """
     Episode-scoped review artifact.
@@ -44,30 +37,33 @@ class ReviewRecord:
     #       ...
     #   ]
     # }
-    override_audit: Mapping[str, Any] = field(default_factory=dict)
+    override_audit: Mapping[str, Any] = field(default_factory=empty_meta)
 
-    meta: Mapping[str, Any] = field(default_factory=dict)
+    meta: Mapping[str, Any] = field(default_factory=empty_meta)
 
     # -----------------------
     # Immutability helpers
     # -----------------------
 
     def with_episode(self, episode_id: Optional[str]) -> "ReviewRecord":
-        return replace(self, episode_id=episode_id)
+        return copy_with(self, episode_id=episode_id)
 
     def with_outcome_summary(self, outcome_summary: str) -> "ReviewRecord":
-        return replace(self, outcome_summary=outcome_summary)
+        return copy_with(self, outcome_summary=outcome_summary)
 
     def with_calibration_notes(self, calibration_notes: str) -> "ReviewRecord":
-        return replace(self, calibration_notes=calibration_notes)
+        return copy_with(self, calibration_notes=calibration_notes)
 
     def with_override_audit(self, override_audit: Mapping[str, Any]) -> "ReviewRecord":
-        return replace(self, override_audit=dict(override_audit))
+        return copy_with(self, override_audit=dict(override_audit))
 
     def with_meta(self, **meta: Any) -> "ReviewRecord":
-        return replace(self, meta=_merge_meta(self.meta, meta))
+        merged = merge_meta(self.meta, meta)
+        if merged is self.meta:
+            return self
+        return copy_with(self, meta=merged)
         
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AssumptionUpdate:
     """
     Minimal v0.5.x placeholder to keep the public import contract stable.
@@ -85,4 +81,4 @@ class AssumptionUpdate:
 
     # Human explanation / audit trace
     rationale: str = ""
-    meta: Mapping[str, Any] = field(default_factory=dict)
\ No newline at end of file
+    meta: Mapping[str, Any] = field(default_factory=empty_meta)
\ No newline at end of file
@@ -1,22 +1,99 @@
 from __future__ import annotations
 
+import hashlib
+import os
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, Iterable, List, NewType, Optional, Sequence, Tuple
-from uuid import uuid4
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, NewType, Optional, Sequence, Tuple, TypeVar
+
+# Dataclass/codegen helpers live in ._dataclass_tools; re-exported here for existing imports.
+from ._dataclass_tools import (  # noqa: F401
+    EMPTY_META,
+    FrozenDict,
+    MemoSlots,
+    _restore_memo_model,
+    append_unique_indexed,
+    copy_with,
+    empty_meta,
+    fast_frozen_init,
+    field_names,
+    from_trusted,
+    hash_by_id,
+    memo_names,
+    merge_meta,
+    replace_fields,
+)
 
 
 # ============================================================
 # types.py (kernel scalars + taxonomies)
 # ============================================================
 
+_T = TypeVar("_T")
+
+
+# Set by batched_clock(): the one timestamp now_utc() hands out for the duration of the block.
+_BATCH_NOW: ContextVar[Optional[datetime]] = ContextVar("_BATCH_NOW", default=None)
+
+
 def now_utc() -> datetime:
-    return datetime.now(timezone.utc)
+    batch_now = _BATCH_NOW.get()
+    return batch_now if batch_now is not None else datetime.now(timezone.utc)
+
+
+@contextmanager
+def batched_clock() -> Iterator[datetime]:
+    """
+    Read the clock once and make now_utc() return that instant inside the block (per context,
+    so other threads/tasks are unaffected). For artifacts created together as one logical event.
+    """
+    t = datetime.now(timezone.utc)
+    token = _BATCH_NOW.set(t)
+    try:
+        yield t
+    finally:
+        _BATCH_NOW.reset(token)
 
 
 def new_id(prefix: str) -> str:
-    return f"{prefix}_{uuid4().hex}"
+    # 128 random bits as 32 hex chars (same shape as uuid4().hex) without building a UUID object.
+    return f"{prefix}_{os.urandom(16).hex()}"
+
+
+def new_ids(prefix: str, n: int) -> List[str]:
+    """
+    n ids in new_id's format (prefix + 32 hex chars) from a single urandom read,
+    instead of one urandom call per id.
+    """
+    digits = os.urandom(16 * n).hex()
+    return [f"{prefix}_{digits[i:i + 32]}" for i in range(0, 32 * n, 32)]
+
+
+def content_hash(obj: object) -> str:
+    """
+    Digest of an immutable artifact's field values (via its dataclass repr).
+    Equal-content artifacts hash equal; any field change yields a new digest.
+    """
+    return hashlib.blake2b(repr(obj).encode("utf-8"), digest_size=16).hexdigest()
+
+
+
+def bulk_create(cls: type[_T], id_field: str, prefix: str, specs: Sequence[Mapping[str, Any]]) -> Tuple[_T, ...]:
+    """
+    One instance per spec (constructor kwargs), sharing a single created_at and ids from new_ids().
+    Each instance still goes through __init__/__post_init__, so validation is unchanged;
+    a spec that supplies its own id or created_at keeps it.
+    """
+    if not specs:
+        return ()
+    ts = now_utc()
+    ids = new_ids(prefix, len(specs))
+    return tuple(cls(**{id_field: i, "created_at": ts, **spec}) for i, spec in zip(ids, specs))
 
 
 # Information typing ONLY (not artifact typing)
@@ -60,7 +137,7 @@ class ArtifactType(str, Enum):
     EPISODE = "DecisionEpisode"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Confidence:
     """
     Epistemic confidence: how well-supported something is by evidence.
@@ -82,7 +159,7 @@ class UncertaintyKind(str, Enum):
     OTHER = "other"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Uncertainty:
     """
     Explicit uncertainty.
@@ -99,7 +176,18 @@ class Uncertainty:
             raise ValueError("Uncertainty.level must be between 0.0 and 1.0")
 
 
-@dataclass(frozen=True)
+def append_uncertainty(seq: Sequence[Uncertainty], *items: Optional[Uncertainty]) -> Tuple[Uncertainty, ...]:
+    """
+    Append uncertainties (None items are skipped). Shared by the models' add_uncertainties helpers.
+    """
+    # tuple(seq) is a no-op for tuples (the usual case), so "nothing to add" returns seq itself.
+    new = tuple(u for u in items if u is not None)
+    if not new:
+        return tuple(seq)
+    return tuple(seq) + new
+
+
+@dataclass(frozen=True, slots=True)
 class Reversibility:
     """
     How reversible an action is. Higher means easier to undo.
@@ -112,7 +200,7 @@ class Reversibility:
             raise ValueError("Reversibility.value must be between 0.0 and 1.0")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Impact:
     """
     Magnitude of downside/upside exposure if executed.
@@ -132,7 +220,7 @@ class RiskPosture(str, Enum):
     AGGRESSIVE = "aggressive"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Strength:
     """
     Recommendation push intensity (normatively consequential).
@@ -145,7 +233,7 @@ class Strength:
             raise ValueError("Strength.value must be between 0.0 and 1.0")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Score:
     """
     Internal ranking signal (non-normative).
@@ -227,7 +315,7 @@ class Option:
     impact: Impact
     reversibility: Reversibility
     preconditions: Tuple[str, ...] = ()
-    uncertainty: Uncertainty = field(default_factory=lambda: Uncertainty("unspecified", 0.5))
+    uncertainty: Uncertainty = Uncertainty("unspecified", 0.5)
 
 
 @dataclass(frozen=True)
@@ -313,6 +401,14 @@ class ArtifactStore:
     def get_audit_trail(self, audit_trail_id: str) -> AuditTrail:
         raise NotImplementedError
 
+    def get_options(self, option_ids: Iterable[str]) -> Dict[str, Option]:
+        """Resolve several options at once (id -> Option, first-seen order); missing ids raise like get_option."""
+        return {oid: self.get_option(oid) for oid in option_ids}
+
+    def get_recommendations(self, recommendation_ids: Iterable[str]) -> Dict[str, Recommendation]:
+        """Resolve several recommendations at once; missing ids raise like get_recommendation."""
+        return {rid: self.get_recommendation(rid) for rid in recommendation_ids}
+
 
 class InMemoryStore(ArtifactStore):
     def __init__(self) -> None:
@@ -326,27 +422,30 @@ class InMemoryStore(ArtifactStore):
         self.audit_trails: Dict[str, AuditTrail] = {}
         self.episodes: Dict[str, DecisionEpisode] = {}
 
+        # Exact-type dispatch for put(); insertion order is also the isinstance fallback order.
+        self._by_type: Dict[type, Dict[str, Any]] = {
+            RawInput: self.raw_inputs,
+            Evidence: self.evidence,
+            Observation: self.observations,
+            Interpretation: self.interpretations,
+            Orientation: self.orientations,
+            Option: self.options,
+            Recommendation: self.recommendations,
+            AuditTrail: self.audit_trails,
+            DecisionEpisode: self.episodes,
+        }
+
     def put(self, obj) -> None:
-        if isinstance(obj, RawInput):
-            self.raw_inputs[obj.id] = obj
-        elif isinstance(obj, Evidence):
-            self.evidence[obj.id] = obj
-        elif isinstance(obj, Observation):
-            self.observations[obj.id] = obj
-        elif isinstance(obj, Interpretation):
-            self.interpretations[obj.id] = obj
-        elif isinstance(obj, Orientation):
-            self.orientations[obj.id] = obj
-        elif isinstance(obj, Option):
-            self.options[obj.id] = obj
-        elif isinstance(obj, Recommendation):
-            self.recommendations[obj.id] = obj
-        elif isinstance(obj, AuditTrail):
-            self.audit_trails[obj.id] = obj
-        elif isinstance(obj, DecisionEpisode):
-            self.episodes[obj.id] = obj
-        else:
-            raise TypeError(f"Unknown artifact type: {type(obj)}")
+        bucket = self._by_type.get(type(obj))
+        if bucket is None:
+            # Subclasses miss the exact-type table; resolve once by MRO and remember the bucket.
+            for cls, candidate in list(self._by_type.items()):
+                if isinstance(obj, cls):
+                    bucket = self._by_type[type(obj)] = candidate
+                    break
+            else:
+                raise TypeError(f"Unknown artifact type: {type(obj)}")
+        bucket[obj.id] = obj
 
     def get_episode(self, episode_id: str) -> DecisionEpisode:
         return self.episodes[episode_id]
@@ -375,6 +474,14 @@ class InMemoryStore(ArtifactStore):
     def get_audit_trail(self, audit_trail_id: str) -> AuditTrail:
         return self.audit_trails[audit_trail_id]
 
+    def get_options(self, option_ids: Iterable[str]) -> Dict[str, Option]:
+        options = self.options
+        return {oid: options[oid] for oid in option_ids}
+
+    def get_recommendations(self, recommendation_ids: Iterable[str]) -> Dict[str, Recommendation]:
+        recommendations = self.recommendations
+        return {rid: recommendations[rid] for rid in recommendation_ids}
+
 
 # ============================================================
 # Invariants + validation harness
@@ -389,31 +496,50 @@ class Violation:
 
 Invariant = callable
 
-
 def validate_episode(store: ArtifactStore, episode_id: str, invariants: Iterable) -> List[Violation]:
     out: List[Violation] = []
     for inv in invariants:
-        out.extend(list(inv(store, episode_id)))
+        out.extend(inv(store, episode_id))
     return out
 
 
+def find_first_violation(store: ArtifactStore, episode_id: str, invariants: Iterable) -> Optional[Violation]:
+    """
+    First violation in invariant order, or None; later invariants don't run once one fails.
+    For callers that only need a pass/fail answer (pass FAIL_FAST_INVARIANTS, or any cheapest-first list).
+    """
+    for inv in invariants:
+        for v in inv(store, episode_id):
+            return v
+    return None
+
+
 OBS_OK = {InfoType.FACT, InfoType.MEASUREMENT, InfoType.EVENT, InfoType.TESTIMONY}
 INT_OK = {InfoType.CLAIM, InfoType.EXPLANATION, InfoType.HYPOTHESIS, InfoType.FRAME}
 
+_MSG_ORIENTATION_MISSING = "DecisionEpisode must include an Orientation before any Recommendation is valid."
+_MSG_TRACEABILITY_EMPTY = "Recommendations exist but no Observation/Interpretation/Evidence is recorded in the episode."
+
 
 def inv_episode_requires_orientation(store: ArtifactStore, episode_id: str) -> Sequence[Violation]:
-    ep = store.get_episode(episode_id)
+    return _check_orientation(store, store.get_episode(episode_id), episode_id)
+
+
+def _check_orientation(store: ArtifactStore, ep: DecisionEpisode, episode_id: str) -> Sequence[Violation]:
     if ep.orientation_id is None:
         return [Violation(
             code="orientation.missing",
-            message="DecisionEpisode must include an Orientation before any Recommendation is valid.",
+            message=_MSG_ORIENTATION_MISSING,
             artifact_id=episode_id,
         )]
     return []
 
 
 def inv_recommendation_requires_audit(store: ArtifactStore, episode_id: str) -> Sequence[Violation]:
-    ep = store.get_episode(episode_id)
+    return _check_audit(store, store.get_episode(episode_id), episode_id)
+
+
+def _check_audit(store: ArtifactStore, ep: DecisionEpisode, episode_id: str) -> Sequence[Violation]:
     v: List[Violation] = []
     for rec_id in ep.recommendation_ids:
         rec = store.get_recommendation(rec_id)
@@ -427,7 +553,10 @@ def inv_recommendation_requires_audit(store: ArtifactStore, episode_id: str) ->
 
 
 def inv_info_type_slots(store: ArtifactStore, episode_id: str) -> Sequence[Violation]:
-    ep = store.get_episode(episode_id)
+    return _check_info_types(store, store.get_episode(episode_id), episode_id)
+
+
+def _check_info_types(store: ArtifactStore, ep: DecisionEpisode, episode_id: str) -> Sequence[Violation]:
     v: List[Violation] = []
 
     for obs_id in ep.observation_ids:
@@ -450,6 +579,24 @@ def inv_info_type_slots(store: ArtifactStore, episode_id: str) -> Sequence[Viola
     return v
 
 
+# Risk-posture shift applied to the strength cap (bounded, symmetric).
+_POSTURE_ADJ: Dict[RiskPosture, float] = {
+    RiskPosture.CONSERVATIVE: -0.10,
+    RiskPosture.BALANCED: 0.00,
+    RiskPosture.AGGRESSIVE: 0.10,
+}
+
+
+@lru_cache(maxsize=4096)
+def _strength_cap(conf: float, unc: float, imp: float, rev: float, posture_adj: float) -> float:
+    # Scalar kernel behind max_strength_allowed: plain floats in, clamped float out. Pure, so memoized
+    # on the exact inputs: re-validating an episode repeats the same (rec, option) tuples.
+    risk = 0.5 * imp + 0.5 * (1.0 - rev)
+    epistemic = 0.6 * (1.0 - conf) + 0.4 * unc
+    raw = 1.0 - (0.95 * risk + 0.95 * epistemic) + posture_adj
+    return 0.0 if raw < 0.0 else (1.0 if raw > 1.0 else raw)
+
+
 def max_strength_allowed(
     *,
     confidence: Confidence,
@@ -463,37 +610,39 @@ def max_strength_allowed(
     - decreases as impact↑, irreversibility↑, uncertainty↑, confidence↓
     - risk posture shifts slightly, bounded
     """
-    risk = 0.5 * impact.value + 0.5 * (1.0 - reversibility.value)
-    epistemic = 0.6 * (1.0 - confidence.value) + 0.4 * uncertainty.level
+    return _strength_cap(
+        confidence.value,
+        uncertainty.level,
+        impact.value,
+        reversibility.value,
+        _POSTURE_ADJ[risk_posture],
+    )
 
-    posture_adj = {
-        RiskPosture.CONSERVATIVE: -0.10,
-        RiskPosture.BALANCED: 0.00,
-        RiskPosture.AGGRESSIVE: 0.10,
-    }[risk_posture]
 
-    raw = 1.0 - (0.95 * risk + 0.95 * epistemic) + posture_adj
-    return max(0.0, min(1.0, raw))
+def inv_proportionate_action(store: ArtifactStore, episode_id: str) -> Sequence[Violation]:
+    return _check_proportionate(store, store.get_episode(episode_id), episode_id)
 
 
-def inv_proportionate_action(store: ArtifactStore, episode_id: str) -> Sequence[Violation]:
-    ep = store.get_episode(episode_id)
+def _check_proportionate(store: ArtifactStore, ep: DecisionEpisode, episode_id: str) -> Sequence[Violation]:
     if ep.orientation_id is None:
         return []  # other invariant catches
     ori = store.get_orientation(ep.orientation_id)
 
+    posture_adj = _POSTURE_ADJ[ori.risk_posture]
+
+    # Resolve every recommendation, then every referenced option, in one batch each.
+    recs = store.get_recommendations(ep.recommendation_ids)
+    opt_by_id = store.get_options(dict.fromkeys(r.option_id for rec in recs.values() for r in rec.ranked_options))
+
     v: List[Violation] = []
     for rec_id in ep.recommendation_ids:
-        rec = store.get_recommendation(rec_id)
+        rec = recs[rec_id]
+        # Per-recommendation inputs are fixed; only the option's impact/reversibility vary per row.
+        conf = rec.confidence.value
+        unc = rec.uncertainty.level
         for ranked in rec.ranked_options:
-            opt = store.get_option(ranked.option_id)
-            cap = max_strength_allowed(
-                confidence=rec.confidence,
-                uncertainty=rec.uncertainty,
-                impact=opt.impact,
-                reversibility=opt.reversibility,
-                risk_posture=ori.risk_posture,
-            )
+            opt = opt_by_id[ranked.option_id]
+            cap = _strength_cap(conf, unc, opt.impact.value, opt.reversibility.value, posture_adj)
             if ranked.strength.value > cap + 1e-12:
                 v.append(Violation(
                     code="action.disproportionate",
@@ -513,18 +662,82 @@ def inv_traceability_minimum(store: ArtifactStore, episode_id: str) -> Sequence[
     - If there's a Recommendation, there must be at least one Observation or Interpretation or Evidence.
     - (Domain apps can tighten this later.)
     """
-    ep = store.get_episode(episode_id)
+    return _check_traceability(store, store.get_episode(episode_id), episode_id)
+
+
+def _check_traceability(store: ArtifactStore, ep: DecisionEpisode, episode_id: str) -> Sequence[Violation]:
     if not ep.recommendation_ids:
         return []
     if not (ep.observation_ids or ep.interpretation_ids or ep.evidence_ids):
         return [Violation(
             code="traceability.empty",
-            message="Recommendations exist but no Observation/Interpretation/Evidence is recorded in the episode.",
+            message=_MSG_TRACEABILITY_EMPTY,
             artifact_id=episode_id,
         )]
     return []
 
 
+# Default invariant set, in report order.
+DEFAULT_INVARIANTS: Tuple[Callable[[ArtifactStore, str], Sequence[Violation]], ...] = (
+    inv_episode_requires_orientation,
+    inv_recommendation_requires_audit,
+    inv_info_type_slots,
+    inv_traceability_minimum,
+    inv_proportionate_action,
+)
+
+# The same set cheapest first, for find_first_violation: O(1) episode checks, then per-artifact
+# scans, and the recommendations x ranked options walk last.
+FAIL_FAST_INVARIANTS: Tuple[Callable[[ArtifactStore, str], Sequence[Violation]], ...] = (
+    inv_episode_requires_orientation,
+    inv_traceability_minimum,
+    inv_recommendation_requires_audit,
+    inv_info_type_slots,
+    inv_proportionate_action,
+)
+
+
+# Episode-taking bodies of the invariants above, so a compiled validator fetches the episode once.
+_EPISODE_CHECKS: Dict[Callable[..., Sequence[Violation]], Callable[..., Sequence[Violation]]] = {
+    inv_episode_requires_orientation: _check_orientation,
+    inv_recommendation_requires_audit: _check_audit,
+    inv_info_type_slots: _check_info_types,
+    inv_proportionate_action: _check_proportionate,
+    inv_traceability_minimum: _check_traceability,
+}
+
+_VALIDATORS: "weakref.WeakValueDictionary[Tuple[Any, ...], Callable[[ArtifactStore, str], List[Violation]]]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def compile_validator(invariants: Iterable) -> Callable[[ArtifactStore, str], List[Violation]]:
+    """
+    Build validate_episode(store, episode_id, invariants) for a fixed invariant list as one function.
+
+    Known invariants run their episode-taking bodies against one shared episode fetch; any other
+    invariant is called as-is. Returns the same violations, in the same order. Compiled validators
+    are cached per invariant tuple for as long as a caller holds on to them.
+    """
+    key = tuple(invariants)
+    fn = _VALIDATORS.get(key)
+    if fn is not None:
+        return fn
+
+    checks = tuple((_EPISODE_CHECKS.get(inv), inv) for inv in key)
+    needs_episode = any(check is not None for check, _ in checks)
+
+    def _validate(store: ArtifactStore, episode_id: str) -> List[Violation]:
+        out: List[Violation] = []
+        ep = store.get_episode(episode_id) if needs_episode else None
+        for check, inv in checks:
+            out.extend(check(store, ep, episode_id) if check is not None else inv(store, episode_id))
+        return out
+
+    fn = _VALIDATORS[key] = _validate
+    return fn
+
+
 # ============================================================
 # Audit dump
 # ============================================================
@@ -723,15 +936,7 @@ def main() -> None:
     store = InMemoryStore()
     episode_id = build_toy_episode(store)
 
-    invariants = [
-        inv_episode_requires_orientation,
-        inv_recommendation_requires_audit,
-        inv_info_type_slots,
-        inv_traceability_minimum,
-        inv_proportionate_action,
-    ]
-
-    violations = validate_episode(store, episode_id, invariants)
+    violations = validate_episode(store, episode_id, DEFAULT_INVARIANTS)
     ep = store.get_episode(episode_id)
 
     print(f"DecisionEpisode {ep.id} @ {ep.created_at.isoformat()}")
@@ -1,77 +1,89 @@
 from __future__ import annotations
 
-from dataclasses import is_dataclass
+from dataclasses import fields, is_dataclass
 from threading import RLock
-from typing import Any, Dict, Iterable, Optional, Sequence, Tuple, Type, TypeVar
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, Tuple, Type, TypeVar
 
 from .store import ArtifactStore, ResolveError
 
 T = TypeVar("T")
 
 
-def _type_name(cls: Type[Any]) -> str:
-    return cls.__name__
+# Shared read-only stand-in for a type bucket that doesn't exist yet.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Per-class "*_id" dataclass field names, in declaration order (class metadata, never invalidated).
+_PK_FIELDS: Dict[type, Tuple[str, ...]] = {}
 
 
 def _infer_primary_id(obj: Any) -> str:
     """
     Finds the primary ID field by convention:
-      - first dataclass field ending with "_id"
+      - first dataclass field ending with "_id" that holds a non-empty str
       - or KeyError if none found
     """
-    if not is_dataclass(obj):
-        raise TypeError("Only dataclass artifacts are supported by InMemoryArtifactStore")
+    cls = type(obj)
+    names = _PK_FIELDS.get(cls)
+    if names is None:
+        if not is_dataclass(obj):
+            raise TypeError("Only dataclass artifacts are supported by InMemoryArtifactStore")
+        names = _PK_FIELDS[cls] = tuple(f.name for f in fields(cls) if f.name.endswith("_id"))
 
-    for f in obj.__dataclass_fields__.values():  # type: ignore[attr-defined]
-        if f.name.endswith("_id"):
-            value = getattr(obj, f.name, None)
-            if isinstance(value, str) and value:
-                return value
-    raise KeyError(f"Could not infer primary id field for {type(obj).__name__}")
+    for name in names:
+        value = getattr(obj, name, None)
+        if isinstance(value, str) and value:
+            return value
+    raise KeyError(f"Could not infer primary id field for {cls.__name__}")
 
 
 class InMemoryArtifactStore(ArtifactStore):
+    """
+    Thread-safe variant of the base store: writes and multi-key reads (list_ids, batch resolves)
+    hold an RLock; single get/has/must_get calls don't.
+    """
+
     def __init__(self) -> None:
         self._lock = RLock()
-        self._data: Dict[str, Dict[str, Any]] = {}
+        # Buckets are keyed by the class itself: hashing/comparing a type is by identity.
+        self._data: Dict[type, Dict[str, Any]] = {}
 
     def put(self, obj: Any) -> str:
-        cls = type(obj)
-        type_name = _type_name(cls)
         obj_id = _infer_primary_id(obj)
 
         with self._lock:
-            self._data.setdefault(type_name, {})
-            self._data[type_name][obj_id] = obj
+            bucket = self._data.get(type(obj))
+            if bucket is None:
+                bucket = self._data[type(obj)] = {}
+            bucket[obj_id] = obj
         return obj_id
 
     def get(self, cls: Type[T], obj_id: str) -> Optional[T]:
-        type_name = _type_name(cls)
-        with self._lock:
-            obj = self._data.get(type_name, {}).get(obj_id)
-        return obj  # type: ignore[return-value]
-
-    def must_get(self, cls: Type[T], obj_id: str) -> T:
-        obj = self.get(cls, obj_id)
-        if obj is None:
-            raise KeyError(f"{_type_name(cls)} not found: {obj_id}")
-        return obj
+        # Lock-free: two single-key dict reads, each atomic under the GIL. Buckets are only ever
+        # created/inserted into (under _lock), so a get racing a put sees the object or misses it.
+        bucket = self._data.get(cls)
+        if bucket is None:
+            return None
+        return bucket.get(obj_id)
 
     def has(self, cls: Type[Any], obj_id: str) -> bool:
         return self.get(cls, obj_id) is not None
 
     def list_ids(self, cls: Type[Any]) -> Sequence[str]:
-        type_name = _type_name(cls)
         with self._lock:
-            return tuple(self._data.get(type_name, {}).keys())
+            return tuple(self._data.get(cls, _EMPTY))
 
-    def resolve_many(self, cls: Type[T], ids: Iterable[str]) -> Tuple[Sequence[T], Sequence[ResolveError]]:
-        found = []
+    def resolve_many_indexed(self, cls: Type[T], ids: Iterable[str]) -> Tuple[Mapping[str, T], Sequence[ResolveError]]:
+        type_name = cls.__name__
+        found: Dict[str, T] = {}
         errors = []
-        for obj_id in ids:
-            obj = self.get(cls, obj_id)
-            if obj is None:
-                errors.append(ResolveError(artifact_type=_type_name(cls), artifact_id=obj_id))
-            else:
-                found.append(obj)
-        return tuple(found), tuple(errors)
+        # One lock acquisition and one type-bucket lookup per batch; repeated ids are resolved once.
+        with self._lock:
+            bucket = self._data.get(cls, _EMPTY)
+            for obj_id in dict.fromkeys(ids):
+                obj = bucket.get(obj_id)
+                if obj is None:
+                    errors.append(ResolveError(artifact_type=type_name, artifact_id=obj_id))
+                else:
+                    found[obj_id] = obj
+        return found, tuple(errors)
@@ -125,29 +125,20 @@ def materialize_episode_from_recommendation(
     if raw_inputs:
         _persist_many(store, raw_inputs)
 
-    # Build binder via append-only helpers (matches your dataclass design)
-    episode = DecisionEpisode()
-    episode = episode.add_orientations(orientation.orientation_id)
-    episode = episode.add_recommendations(recommendation.recommendation_id)
-
-    # Thread through provenance IDs if we have them (good for indexing/audit)
-    if getattr(recommendation, "evidence_ids", None):
-        episode = episode.add_evidence(*tuple(recommendation.evidence_ids))
-    if getattr(recommendation, "observation_ids", None):
-        episode = episode.add_observations(*tuple(recommendation.observation_ids))
-    if getattr(recommendation, "interpretation_ids", None):
-        episode = episode.add_interpretations(*tuple(recommendation.interpretation_ids))
-
-    # Options referenced by ranked_options
-    ranked = getattr(recommendation, "ranked_options", None)
-    if ranked:
-        option_ids = tuple(ro.option_id for ro in ranked if getattr(ro, "option_id", None))
-        if option_ids:
-            episode = episode.add_options(*option_ids)
-
-    # Raw inputs (if supplied)
-    if raw_inputs:
-        episode = episode.add_raw_inputs(*tuple(ri.raw_input_id for ri in raw_inputs))
+    # Build binder via append-only helpers (matches your dataclass design), in a single step
+    ranked = getattr(recommendation, "ranked_options", None) or ()
+    episode = DecisionEpisode().extend(
+        orientation_ids=(orientation.orientation_id,),
+        recommendation_ids=(recommendation.recommendation_id,),
+        # Thread through provenance IDs if we have them (good for indexing/audit)
+        evidence_ids=tuple(getattr(recommendation, "evidence_ids", None) or ()),
+        observation_ids=tuple(getattr(recommendation, "observation_ids", None) or ()),
+        interpretation_ids=tuple(getattr(recommendation, "interpretation_ids", None) or ()),
+        # Options referenced by ranked_options
+        option_ids=tuple(ro.option_id for ro in ranked if getattr(ro, "option_id", None)),
+        # Raw inputs (if supplied)
+        raw_input_ids=tuple(ri.raw_input_id for ri in raw_inputs),
+    )
 
     # Persist binder
     _persist_one(store, episode)
@@ -1,17 +1,25 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Optional, Protocol, Sequence, Tuple, Type, TypeVar, runtime_checkable
+from typing import Any, Dict, Iterable, Mapping, Optional, Protocol, Sequence, Tuple, Type, TypeVar, runtime_checkable
 
 T = TypeVar("T")
 
 
 @dataclass
-class ResolveError(Exception):
+class ResolveError(KeyError):
+    """
+    A referenced artifact is missing. Subclasses KeyError so callers written against a
+    dict-like must_get (``except KeyError``) keep working.
+    """
+
     artifact_type: str
     artifact_id: str
     message: str = "not found"
 
+    def __str__(self) -> str:
+        return f"{self.artifact_type} {self.message}: {self.artifact_id}"
+
 
 @runtime_checkable
 class ArtifactStoreProtocol(Protocol):
@@ -46,6 +54,50 @@ def _type_key(cls: Type[Any]) -> str:
     return f"{cls.__module__}.{cls.__qualname__}"
 
 
+# Explicit common primaries, checked before episode_id so ReviewRecord isn't keyed by its episode.
+_COMMON_PRIMARY_FIELDS: Tuple[str, ...] = (
+    "review_id",
+    "recommendation_id",
+    "option_id",
+    "orientation_id",
+    "outcome_id",
+    "calibration_id",
+    "choice_id",  # include explicitly as a common primary
+)
+
+# Classes whose own "<classname>_id" would lose to a common primary (avoid episode_id/review_id collisions).
+_HARD_PRIMARY_FIELDS: Mapping[str, str] = {
+    "CalibrationNote": "calibration_id",
+    "ChoiceRecord": "choice_id",
+}
+
+
+def _primary_id_candidates(cls: type) -> Tuple[Tuple[str, ...], Optional[Tuple[str, ...]]]:
+    """
+    Per-class attribute order for _infer_primary_id (class metadata only; cached in _PRIMARY_ID_CANDIDATES).
+
+    Returns (priority, fallback): `priority` covers rules 0-2 in order; `fallback` is every other
+    "*_id" attribute sorted by (len, name) for rule 3-4, or None when instances carry a __dict__
+    (their attribute set can vary per instance, so the fallback must scan dir(obj)).
+    """
+    priority = [_HARD_PRIMARY_FIELDS[cls.__name__]] if cls.__name__ in _HARD_PRIMARY_FIELDS else []
+    priority.append(f"{cls.__name__.lower()}_id")
+    priority.extend(_COMMON_PRIMARY_FIELDS)
+    priority.append("episode_id")  # DecisionEpisode primary
+    ordered = tuple(dict.fromkeys(priority))
+
+    if cls.__dictoffset__:
+        return ordered, None
+
+    # No instance __dict__: dir(cls) is exactly what dir(obj) would list, so drop absent names up front.
+    present = set(dir(cls))
+    fallback = sorted((a for a in present if a.endswith("_id") and a not in ordered), key=lambda a: (len(a), a))
+    return tuple(a for a in ordered if a in present), tuple(fallback)
+
+
+_PRIMARY_ID_CANDIDATES: Dict[type, Tuple[Tuple[str, ...], Optional[Tuple[str, ...]]]] = {}
+
+
 def _infer_primary_id(obj: Any) -> str:
     """
     Heuristic ID inference (deterministic):
@@ -56,69 +108,30 @@ def _infer_primary_id(obj: Any) -> str:
     3) If exactly one "*_id" attribute exists and is a str, use it.
     4) If multiple candidates exist, prefer shortest attr name (then lexicographic) deterministically.
     """
-    # 0) Hard preference for CalibrationNote
-    if type(obj).__name__ == "CalibrationNote":
-        val = getattr(obj, "calibration_id", None)
-        if isinstance(val, str) and val:
-            return val
-
-    # 0b) Hard preference for ChoiceRecord (avoid episode_id/recommendation_id collisions)
-    if type(obj).__name__ == "ChoiceRecord":
-        val = getattr(obj, "choice_id", None)
-        if isinstance(val, str) and val:
-            return val
-
-    cls_name = type(obj).__name__.lower()
-    preferred = f"{cls_name}_id"
-
-    # 1) canonical "<classname>_id"
-    if hasattr(obj, preferred):
-        val = getattr(obj, preferred, None)
+    cls = type(obj)
+    cached = _PRIMARY_ID_CANDIDATES.get(cls)
+    if cached is None:
+        cached = _PRIMARY_ID_CANDIDATES[cls] = _primary_id_candidates(cls)
+    priority, fallback = cached
+
+    # 0-2) first non-empty str in priority order
+    for attr in priority:
+        val = getattr(obj, attr, None)
         if isinstance(val, str) and val:
             return val
 
-    # 2) common primaries (avoid episode_id stealing ReviewRecord)
-    for attr in (
-        "review_id",
-        "recommendation_id",
-        "option_id",
-        "orientation_id",
-        "outcome_id",
-        "calibration_id",
-        "choice_id",  # include explicitly as a common primary
-    ):
-        if hasattr(obj, attr):
-            val = getattr(obj, attr, None)
-            if isinstance(val, str) and val:
-                return val
-
-    # DecisionEpisode primary
-    if hasattr(obj, "episode_id"):
-        val = getattr(obj, "episode_id", None)
-        if isinstance(val, str) and val:
-            return val
-
-    # 3) fallback: find any *_id string fields
-    candidates: list[Tuple[str, str]] = []
-    for attr in dir(obj):
-        if not attr.endswith("_id"):
-            continue
+    # 3-4) any other *_id string field; shortest name (then lexicographic) wins
+    if fallback is None:
+        fallback = sorted((a for a in dir(obj) if a.endswith("_id")), key=lambda a: (len(a), a))
+    for attr in fallback:
         try:
             val = getattr(obj, attr)
         except Exception:
             continue
         if isinstance(val, str) and val:
-            candidates.append((attr, val))
-
-    if len(candidates) == 1:
-        return candidates[0][1]
-
-    # 4) deterministic pick if multiple
-    if candidates:
-        candidates.sort(key=lambda t: (len(t[0]), t[0]))
-        return candidates[0][1]
+            return val
 
-    raise ValueError(f"Cannot infer primary id for object of type {type(obj)!r}")
+    raise ValueError(f"Cannot infer primary id for object of type {cls!r}")
 
 
 class InMemoryArtifactStore:
@@ -151,7 +164,7 @@ class InMemoryArtifactStore:
     def must_get(self, cls: Type[T], obj_id: str) -> T:
         obj = self.get(cls, obj_id)
         if obj is None:
-            # Raise ResolveError (not KeyError) so validators can aggregate deterministically.
+            # Raise ResolveError (a KeyError) so validators can aggregate deterministically.
             raise ResolveError(artifact_type=cls.__name__, artifact_id=obj_id)
         return obj
 
@@ -163,17 +176,50 @@ class InMemoryArtifactStore:
         return tuple(self._ids_by_type.get(tk, []))
 
     def resolve_many(self, cls: Type[T], ids: Iterable[str]) -> Tuple[Sequence[T], Sequence[ResolveError]]:
-        found: list[T] = []
+        """
+        Resolve ids in first-seen order; repeated ids are looked up (and reported) once.
+        """
+        by_id, errors = self.resolve_many_indexed(cls, ids)
+        return tuple(by_id.values()), errors
+
+    def resolve_many_indexed(self, cls: Type[T], ids: Iterable[str]) -> Tuple[Mapping[str, T], Sequence[ResolveError]]:
+        """
+        Like resolve_many, but returns the id -> artifact mapping built while resolving,
+        so callers don't need to re-index the found sequence.
+        """
+        tk = _type_key(cls)
+        data = self._data
+        found: Dict[str, T] = {}
         errors: list[ResolveError] = []
 
-        for obj_id in ids:
-            obj = self.get(cls, obj_id)
+        for obj_id in dict.fromkeys(ids):
+            obj = data.get((tk, obj_id))
             if obj is None:
                 errors.append(ResolveError(artifact_type=cls.__name__, artifact_id=obj_id))
             else:
-                found.append(obj)
+                found[obj_id] = obj
+
+        return found, tuple(errors)
+
+    def resolve_batch(
+        self,
+        requests: Mapping[Type[Any], Iterable[str]],
+    ) -> Tuple[Mapping[Type[Any], Mapping[str, Any]], Sequence[ResolveError]]:
+        """
+        Resolve several artifact kinds in one call.
+
+        Returns {cls: {id: artifact}} (every requested cls gets a mapping, possibly empty)
+        plus the ResolveErrors for missing ids, in request order.
+        """
+        found: Dict[Type[Any], Mapping[str, Any]] = {}
+        errors: list[ResolveError] = []
+
+        for cls, ids in requests.items():
+            by_id, cls_errors = self.resolve_many_indexed(cls, ids)
+            found[cls] = by_id
+            errors.extend(cls_errors)
 
-        return tuple(found), tuple(errors)
+        return found, tuple(errors)
 
 
 # What the rest of the codebase imports in tests:
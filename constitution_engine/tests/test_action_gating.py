@@ -275,3 +275,24 @@ def test_dependencies_required_for_auditability() -> None:
     allowed, requires_override, _ = evaluate_option_legality(opt, ori)
     assert allowed is False
     assert requires_override is False  # structural invalidity, not a gate violation
+
+
+def test_allowed_reason_is_a_plain_string_with_sorted_allowed_set() -> None:
+    """
+    The allowed-by-gate reason is memoized per gate outcome but must render the same text as before.
+    """
+    opt = Option(
+        impact=SCALAR_BY_LEVEL[Level3.LOW],
+        reversibility=SCALAR_BY_LEVEL[Level3.HIGH],
+        uncertainty=SCALAR_BY_LEVEL[Level3.LOW],
+        action_class=ActionClass.PROBE,
+        dependencies=("obs:1",),
+    )
+    ori = Orientation(governance_mode=GovernanceMode.ADVISORY_ONLY, risk_posture=RiskPosture.DEFAULT)
+
+    allowed, requires_override, reason = evaluate_option_legality(opt, ori)
+    assert allowed is True
+    assert requires_override is False
+    assert type(reason) is str
+    assert reason == "allowed by gate: risk=LOW, uncertainty=LOW, allowed=['COMMIT', 'LIMITED', 'PROBE']"
+    assert evaluate_option_legality(opt, ori)[2] is reason
@@ -0,0 +1,73 @@
+# tests/test_audit_lineage_smoke.py
+
+from dataclasses import replace
+
+from constitution_engine.models.audit import AuditTrail, Lineage
+
+
+def test_lineage_is_empty_tracks_appends_and_constructor_args():
+    empty = Lineage()
+    assert empty.is_empty()
+    assert empty.add_evidence().is_empty()
+    assert not empty.add_evidence("ev_1").is_empty()
+    assert not Lineage(option_ids=["opt_1"]).is_empty()
+    assert not replace(empty.add_reviews("rev_1")).is_empty()
+
+    trail = AuditTrail(subject_id="rec_1", subject_type="Recommendation").add_lineage(outcome_ids=("out_1",))
+    assert trail.lineage.outcome_ids == ("out_1",)
+    assert not trail.lineage.is_empty()
+
+
+def test_add_lineage_matches_chained_lineage_adders():
+    trail = AuditTrail(subject_id="rec_1", subject_type="Recommendation")
+    chained = trail.lineage.add_evidence("ev_1", "ev_1").add_options("opt_1").add_reviews("", "rev_1")
+
+    merged = trail.add_lineage(evidence_ids=("ev_1", "ev_1"), option_ids=("opt_1",), review_ids=("", "rev_1"))
+    assert merged.lineage == chained
+    assert merged.lineage.extend(evidence_ids=("ev_1", "ev_2")).evidence_ids == ("ev_1", "ev_2")
+    assert not merged.lineage.is_empty()
+
+
+def test_from_trusted_tuples_round_trips_stored_fields():
+    trail = AuditTrail(subject_id="rec_1", subject_type="Recommendation").add_lineage(
+        evidence_ids=("ev_1",), review_ids=("rev_1",)
+    )
+    lin = Lineage.from_trusted_tuples(evidence_ids=("ev_1",), review_ids=("rev_1",))
+    assert lin == trail.lineage
+    assert not lin.is_empty()
+    assert lin.add_evidence("ev_1").evidence_ids == ("ev_1",)
+
+    loaded = AuditTrail.from_trusted_tuples(
+        audit_id=trail.audit_id,
+        created_at=trail.created_at,
+        subject_id=trail.subject_id,
+        subject_type=trail.subject_type,
+        lineage=lin,
+    )
+    assert loaded == trail
+
+
+def test_lineage_merge_appends_other_in_order_without_duplicates():
+    base = Lineage().add_evidence("ev_1").add_options("opt_1")
+    other = Lineage().add_evidence("ev_2", "ev_1").add_reviews("rev_1")
+
+    merged = base.merge(other)
+    assert merged.evidence_ids == ("ev_1", "ev_2")
+    assert merged.option_ids == ("opt_1",)
+    assert merged.review_ids == ("rev_1",)
+    assert base.merge(Lineage()) is base
+
+    trail = AuditTrail(subject_id="rec_1", subject_type="Recommendation", lineage=base)
+    assert trail.add_lineage(lineage=other, review_ids=("rev_2",)).lineage.review_ids == ("rev_1", "rev_2")
+
+
+def test_audit_trails_are_hashable_and_dedupe_in_sets():
+    trail = AuditTrail(subject_id="rec_1", subject_type="Recommendation").with_meta(source="test")
+    same = AuditTrail.from_trusted_tuples(
+        audit_id=trail.audit_id,
+        created_at=trail.created_at,
+        subject_id=trail.subject_id,
+        subject_type=trail.subject_type,
+        meta=trail.meta,
+    )
+    assert len({trail, same, trail.with_notes("n")}) == 2
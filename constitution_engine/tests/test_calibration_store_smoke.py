@@ -7,3 +7,17 @@ def test_store_put_get_calibration_note():
     store.put(cal)
     got = store.must_get(CalibrationNote, cal.calibration_id)
     assert got.summary.startswith("Adjust")
+
+
+def test_from_trusted_tuples_reloads_calibration_note_as_stored():
+    cal = CalibrationNote(episode_id="ep_1", review_id="rev_1", outcome_ids=("out_1",), summary="Adjust next time.")
+    loaded = CalibrationNote.from_trusted_tuples(
+        calibration_id=cal.calibration_id,
+        created_at=cal.created_at,
+        episode_id=cal.episode_id,
+        review_id=cal.review_id,
+        outcome_ids=cal.outcome_ids,
+        summary=cal.summary,
+        confidence=cal.confidence,
+    )
+    assert loaded == cal
@@ -112,6 +112,8 @@ def _make_minimal(cls: type[Any], **overrides: Any) -> Any:
     kwargs: dict[str, Any] = {}
 
     for f in fields(cls):
+        if not f.init:
+            continue
         if f.name in overrides:
             kwargs[f.name] = overrides[f.name]
             continue
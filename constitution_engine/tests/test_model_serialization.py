@@ -0,0 +1,189 @@
+import copy
+import dataclasses
+import json
+import pickle
+
+import pytest
+
+from constitution_engine.models.audit import AuditTrail, Lineage
+from constitution_engine.models.calibration import CalibrationNote
+from constitution_engine.models.choice import ChoiceRecord
+from constitution_engine.models.episode import DecisionEpisode
+from constitution_engine.models.evidence import Evidence, SourceRef, SpanRef
+from constitution_engine.models.interpretation import Assumption, Interpretation
+from constitution_engine.models.model_spec import ModelSpec, ModelState
+from constitution_engine.models.observation import Observation
+from constitution_engine.models.option import Option
+from constitution_engine.models.orientation import Constraint, Objective, Orientation, ValueSignal
+from constitution_engine.models.outcome import Outcome
+from constitution_engine.models.raw_input import RawInput
+from constitution_engine.models.recommendation import RankedOption, Recommendation
+from constitution_engine.models.review import AssumptionUpdate, ReviewRecord
+from constitution_engine.models.types import Uncertainty
+
+
+def _models():
+    ranked = RankedOption(option_id="opt_1", rank=1, score=0.7, rationale="r")
+    return [
+        AuditTrail(subject_id="rec_1", subject_type="Recommendation"),
+        Lineage(),
+        CalibrationNote(),
+        ChoiceRecord(episode_id="ep_1", recommendation_id="rec_1", option_id="opt_1"),
+        DecisionEpisode(),
+        Evidence(),
+        SourceRef(uri="https://example.test"),
+        SpanRef(start=0, end=3),
+        Assumption(),
+        Interpretation(),
+        ModelSpec(),
+        ModelState(),
+        Observation(),
+        Option(title="x"),
+        Constraint(name="c", description="d"),
+        Objective(name="o", description="d"),
+        Orientation(),
+        ValueSignal(name="v", description="d"),
+        Outcome(),
+        RawInput(),
+        ranked,
+        Recommendation(orientation_id="ori_1", ranked_options=(ranked,)),
+        AssumptionUpdate(),
+        ReviewRecord(),
+    ]
+
+
+@pytest.mark.parametrize("obj", _models(), ids=lambda o: type(o).__name__)
+def test_fresh_models_pickle_deepcopy_and_asdict(obj):
+    assert pickle.loads(pickle.dumps(obj)) == obj
+    assert copy.deepcopy(obj) == obj
+    assert isinstance(dataclasses.asdict(obj), dict)
+
+
+_DEFAULT_MAPPING_FIELDS = ("meta", "notes", "patch", "metadata", "parameters", "parameters_schema", "override_audit")
+
+
+@pytest.mark.parametrize("obj", _models(), ids=lambda o: type(o).__name__)
+def test_default_meta_mappings_are_plain_json(obj):
+    for name in _DEFAULT_MAPPING_FIELDS:
+        value = getattr(obj, name, None)
+        if isinstance(value, dict):
+            assert json.dumps(value) == "{}"
+            with pytest.raises(TypeError):
+                value["k"] = 1  # type: ignore[index]
+
+
+def test_default_meta_is_read_only_but_supplied_dicts_are_kept():
+    # Defaults share one read-only mapping, so in-place mutation of a default raises TypeError;
+    # a dict passed by the caller is stored as given and stays mutable.
+    for cls, name in ((Observation, "meta"), (RawInput, "metadata"), (ModelState, "parameters")):
+        with pytest.raises(TypeError, match="read-only"):
+            getattr(cls(), name)["k"] = 1
+        own = {"k": 0}
+        obj = cls(**{name: own})
+        getattr(obj, name)["k"] = 1
+        assert own == {"k": 1}
+
+    obs = Observation().with_meta(k=1)
+    assert obs.meta == {"k": 1} and Observation().meta == {}
+
+
+@pytest.mark.parametrize("obj", [o for o in _models() if hasattr(o, "with_meta")], ids=lambda o: type(o).__name__)
+def test_merged_meta_round_trips(obj):
+    big = obj.with_meta(**{f"k{i}": i for i in range(12)})
+    merged = big.with_meta(k0=-1, extra=["x"]).with_meta(step=1)
+
+    assert json.loads(json.dumps(merged.meta)) == {**{f"k{i}": i for i in range(12)}, "k0": -1, "extra": ["x"], "step": 1}
+    assert pickle.loads(pickle.dumps(merged)) == merged
+    assert copy.deepcopy(merged).meta == merged.meta
+    assert dataclasses.asdict(merged)["meta"] == dict(merged.meta)
+    with pytest.raises(TypeError):
+        merged.meta["k1"] = 0  # type: ignore[index]
+
+
+# dataclasses.fields() of the models that keep private memos; memos must not add fields.
+_PUBLIC_FIELDS = {
+    Lineage: (
+        "raw_input_ids", "evidence_ids", "observation_ids", "interpretation_ids", "model_spec_ids",
+        "model_state_ids", "orientation_ids", "option_ids", "recommendation_ids", "outcome_ids", "review_ids",
+    ),
+    DecisionEpisode: (
+        "episode_id", "created_at", "title", "description", "raw_input_ids", "evidence_ids", "observation_ids",
+        "interpretation_ids", "model_spec_ids", "model_state_ids", "orientation_ids", "option_ids",
+        "recommendation_ids", "choice_ids", "outcome_ids", "review_ids", "calibration_ids", "audit_ids",
+        "acted", "acted_at", "chosen_option_id", "meta",
+    ),
+    Observation: (
+        "observation_id", "created_at", "info_type", "statement", "data", "raw_input_ids", "evidence_ids",
+        "confidence", "uncertainties", "tags", "meta",
+    ),
+    Assumption: ("assumption_id", "name", "description", "confidence", "uncertainties"),
+    Interpretation: (
+        "interpretation_id", "created_at", "info_type", "title", "narrative", "observation_ids", "evidence_ids",
+        "assumptions", "confidence", "uncertainties", "model_payload", "meta",
+    ),
+    Option: (
+        "option_id", "created_at", "kind", "title", "description", "action_class", "action_payload",
+        "orientation_id", "observation_ids", "interpretation_ids", "evidence_ids", "reversibility", "impact",
+        "uncertainties", "meta",
+    ),
+    Orientation: ("orientation_id", "created_at", "objectives", "constraints", "values", "risk_posture", "owner", "meta"),
+}
+
+
+@pytest.mark.parametrize("cls", list(_PUBLIC_FIELDS), ids=lambda c: c.__name__)
+def test_memos_stay_out_of_dataclass_fields(cls):
+    assert tuple(f.name for f in dataclasses.fields(cls)) == _PUBLIC_FIELDS[cls]
+    obj = next(o for o in _models() if type(o) is cls)
+    assert tuple(dataclasses.asdict(obj)) == _PUBLIC_FIELDS[cls]
+
+
+def test_memos_are_rebuilt_after_pickle_and_deepcopy():
+    lin = Lineage().add_evidence("ev_1").add_options("opt_1")
+    ep = DecisionEpisode().add_evidence("ev_1")
+
+    for restored in (pickle.loads(pickle.dumps(lin)), copy.deepcopy(lin), dataclasses.replace(lin)):
+        assert restored == lin and not restored.is_empty()
+        assert restored.add_evidence("ev_1") is restored
+        assert restored.add_evidence("ev_2").evidence_ids == ("ev_1", "ev_2")
+    assert Lineage.from_trusted_tuples(option_ids=("opt_1",)).is_empty() is False
+
+    restored_ep = pickle.loads(pickle.dumps(ep))
+    assert restored_ep.add_evidence("ev_1") is restored_ep
+    assert restored_ep.add_evidence("ev_2").evidence_ids == ("ev_1", "ev_2")
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [Observation().add_evidence("ev_1"), Interpretation().add_evidence("ev_1"), Option(title="x").add_evidence("ev_1")],
+    ids=lambda o: type(o).__name__,
+)
+def test_id_memos_are_rebuilt_after_pickle_and_deepcopy(obj):
+    for restored in (pickle.loads(pickle.dumps(obj)), copy.deepcopy(obj), dataclasses.replace(obj)):
+        assert restored == obj
+        assert restored.add_evidence("ev_1") is restored
+        assert restored.add_evidence("ev_2").evidence_ids == ("ev_1", "ev_2")
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [Observation(), Assumption(), Interpretation(), Option(title="x")],
+    ids=lambda o: type(o).__name__,
+)
+def test_max_uncertainty_memo_is_rebuilt_after_pickle_and_deepcopy(obj):
+    low = obj.add_uncertainties(Uncertainty(description="u", level=0.25))
+    assert low.max_uncertainty_level() == 0.25
+
+    for restored in (pickle.loads(pickle.dumps(low)), copy.deepcopy(low), dataclasses.replace(low)):
+        assert restored.max_uncertainty_level() == 0.25
+        assert restored.add_uncertainties(Uncertainty(description="v", level=0.75)).max_uncertainty_level() == 0.75
+
+
+def test_orientation_memos_are_rebuilt_after_pickle_and_deepcopy():
+    ori = Orientation().add_objectives(Objective(name="o", description="d")).add_constraints(Constraint(name="c", description="d"))
+    assert ori.objective_weight_map() == {"o": 1.0} and ori.constraint_names() == ("c",)
+
+    for restored in (pickle.loads(pickle.dumps(ori)), copy.deepcopy(ori), dataclasses.replace(ori)):
+        assert restored == ori
+        assert restored.objective_weight_map() == {"o": 1.0} and restored.constraint_names() == ("c",)
+        assert restored.add_objectives(Objective(name="o", description="d")) is restored
+        assert restored.add_objectives(Objective(name="p", description="d")).objective_weight_map() == {"o": 1.0, "p": 1.0}
@@ -1,3 +1,7 @@
+from dataclasses import replace
+
+import pytest
+
 from constitution_engine.models.episode import DecisionEpisode
 from constitution_engine.models.outcome import Outcome
 from constitution_engine.runtime.store import ArtifactStore
@@ -24,3 +28,94 @@ def test_episode_act_and_log_outcome_roundtrip():
     # store resolve sanity
     got = store.must_get(Outcome, out.outcome_id)
     assert got.description.startswith("Observed:")
+
+
+def test_episode_appenders_dedupe_across_chained_calls():
+    ep = DecisionEpisode().add_evidence("ev_1", "ev_2").add_evidence("ev_2", "ev_3", "ev_3")
+    older = ep.add_evidence("ev_4")
+
+    # Appending to an older version must not see ids added on a sibling branch.
+    branch = ep.add_evidence("ev_5", "ev_4")
+
+    assert ep.evidence_ids == ("ev_1", "ev_2", "ev_3")
+    assert older.evidence_ids == ("ev_1", "ev_2", "ev_3", "ev_4")
+    assert branch.evidence_ids == ("ev_1", "ev_2", "ev_3", "ev_5", "ev_4")
+    assert branch == replace(branch)  # membership cache is not part of equality
+
+
+def test_episode_extend_matches_chained_adders():
+    chained = DecisionEpisode().add_evidence("ev_1", "ev_2").add_options("opt_1").add_evidence("ev_1", "ev_3")
+    batched = DecisionEpisode(episode_id=chained.episode_id, created_at=chained.created_at).extend(
+        evidence_ids=("ev_1", "ev_2", "ev_1", "ev_3"),
+        option_ids=("opt_1",),
+    )
+
+    assert batched == chained
+
+
+def test_episode_meta_defaults_are_shared_and_read_only():
+    a, b = DecisionEpisode(), DecisionEpisode()
+    assert a.meta is b.meta
+    assert dict(a.with_meta(note="x").with_meta(k=1).meta) == {"note": "x", "k": 1}
+    assert a.meta == {}
+
+
+def test_with_meta_is_a_noop_when_nothing_changes():
+    ep = DecisionEpisode().with_meta(note="x")
+    assert ep.with_meta() is ep
+    assert ep.with_meta(note="x") is ep
+    assert dict(ep.with_meta(note="y").meta) == {"note": "y"}
+
+
+def test_noop_appends_return_the_same_episode():
+    ep = DecisionEpisode().add_evidence("ev_1")
+    assert ep.add_evidence() is ep
+    assert ep.add_evidence("ev_1", "") is ep
+    assert ep.extend(evidence_ids=("ev_1",), option_ids=()) is ep
+    assert ep.add_evidence("ev_2").evidence_ids == ("ev_1", "ev_2")
+
+
+def test_with_meta_merges_onto_large_meta():
+    big = {f"k{i}": i for i in range(20)}
+    ep = DecisionEpisode(meta=big)
+    ep2 = ep.with_meta(k0=-1, extra="x")
+    assert ep2.meta["k0"] == -1 and ep2.meta["extra"] == "x" and ep2.meta["k5"] == 5
+    assert dict(ep2.meta) == {**big, "k0": -1, "extra": "x"}
+    assert ep.meta["k0"] == 0
+
+    many = ep2
+    for i in range(10):
+        many = many.with_meta(step=i)
+    assert many.meta["step"] == 9 and many.meta["extra"] == "x"
+    with pytest.raises(TypeError):
+        many.meta["k1"] = 0  # type: ignore[index]
+
+
+def test_with_helpers_copy_every_field_and_stay_frozen():
+    ep = DecisionEpisode(title="t").add_evidence("ev_1").with_meta(k=1)
+    ep2 = ep.with_description("d")
+    assert replace(ep2, description=None) == ep
+    assert ep2.evidence_ids == ("ev_1",) and ep2.add_evidence("ev_1") is ep2
+    with pytest.raises(AttributeError):
+        ep2.title = "x"  # type: ignore[misc]
+
+
+def test_fast_init_leaf_models_keep_dataclass_semantics():
+    a = Outcome("out_1", None, "rec_1", description="ok")
+    b, c = Outcome(), Outcome()
+    assert a.recommendation_id == "rec_1" and a.confidence.value == 0.5 and a.meta == {}
+    assert b.outcome_id != c.outcome_id
+    assert replace(a, description="ok") == a
+    with pytest.raises(AttributeError):
+        a.description = "x"  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        Outcome(unknown=1)  # type: ignore[call-arg]
+
+
+def test_batched_clock_shares_one_timestamp():
+    from constitution_engine.models.types import batched_clock, now_utc
+
+    with batched_clock() as t:
+        a, b = Outcome(), DecisionEpisode()
+        assert a.created_at is t and b.created_at is t and now_utc() is t
+    assert now_utc() is not t and Outcome().created_at >= t
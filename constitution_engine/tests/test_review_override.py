@@ -1,3 +1,6 @@
+import sys
+from dataclasses import dataclass
+
 import pytest
 
 from constitution_engine.invariants.validate import validate_episode
@@ -130,4 +133,166 @@ def test_override_review_valid_passes() -> None:
     report = validate_episode(store, "ep1")
     assert report.ok, report.violations
 def _make_store():
-    return InMemoryArtifactStore()
\ No newline at end of file
+    return InMemoryArtifactStore()
+
+def test_recommendation_and_review_models_are_slotted() -> None:
+    ro = RankedOption(option_id="opt1", rank=1, score=0.5, rationale="x")
+    rec = Recommendation(orientation_id="ori1", ranked_options=(ro,))
+    rev = ReviewRecord(episode_id="ep1")
+    for obj in (ro, rec, rev):
+        assert not hasattr(obj, "__dict__")
+    assert rec.with_summary("s").summary == "s" and rev.with_meta(k=1).meta == {"k": 1}
+    with pytest.raises(AttributeError):
+        rec.summary = "x"  # type: ignore[misc]
+
+
+def test_ranked_options_must_be_a_permutation_of_1_to_n() -> None:
+    def ro(oid: str, rank: int) -> RankedOption:
+        return RankedOption(option_id=oid, rank=rank, score=0.5, rationale="x")
+
+    rec = Recommendation(orientation_id="ori1", ranked_options=(ro("b", 2), ro("a", 1)))
+    assert rec.add_ranked_options(ro("c", 3)).top_option_id() == "a"
+    with pytest.raises(ValueError, match="contiguous"):
+        Recommendation(orientation_id="ori1", ranked_options=(ro("a", 1), ro("b", 1)))
+    with pytest.raises(ValueError, match="contiguous"):
+        Recommendation(orientation_id="ori1", ranked_options=(ro("a", 1), ro("b", 3)))
+    with pytest.raises(ValueError, match="contiguous"):
+        rec.add_ranked_options(ro("c", 4))
+    # Integral float ranks compare equal to their ints and are accepted, as before.
+    assert Recommendation(orientation_id="ori1", ranked_options=(ro("a", 1.0), ro("b", 2))).top_option_id() == "a"
+
+
+def test_recommendation_appenders_dedupe_and_keep_order() -> None:
+    rec = Recommendation(orientation_id="ori1", evidence_ids=("ev1",))
+    rec = rec.add_evidence("ev2").add_evidence("ev1", "ev3", "ev3", "", "ev2").add_evidence("ev1")
+    assert rec.evidence_ids == ("ev1", "ev2", "ev3")
+    assert rec.with_override_scope_used("A", "B").with_override_scope_used("B").override_scope_used == ("A", "B")
+
+
+def test_empty_meta_defaults_are_shared() -> None:
+    a, b = ReviewRecord(), ReviewRecord()
+    assert a.meta is b.meta and a.override_audit is b.meta
+    assert Recommendation(orientation_id="o").meta is a.meta
+    assert a.with_meta(k=1).meta == {"k": 1} and a.meta == {}
+
+
+def test_recommendation_normalizes_lists_and_keeps_tuples() -> None:
+    ids = ("ev1", "ev2")
+    ros = [RankedOption(option_id="opt1", rank=1, score=0.5, rationale="x", tradeoffs=["t"])]
+    rec = Recommendation(orientation_id="ori1", ranked_options=ros, evidence_ids=ids, observation_ids=["obs1"])
+    assert rec.evidence_ids is ids
+    assert rec.observation_ids == ("obs1",) and type(rec.ranked_options) is tuple
+    assert rec.ranked_options[0].tradeoffs == ("t",)
+
+
+def test_with_helpers_copy_without_revalidating() -> None:
+    ro = RankedOption(option_id="opt1", rank=1, score=0.5, rationale="x").add_tradeoffs("t1")
+    assert ro.add_tradeoffs("t1") is ro and ro.add_tradeoffs("t2").tradeoffs == ("t1", "t2")
+    assert ro.with_score(1).score == 1.0
+    with pytest.raises(ValueError):
+        ro.with_score(1.5)
+
+    rec = Recommendation(orientation_id="ori1", ranked_options=(ro,), evidence_ids=("ev1",))
+    assert rec.add_evidence("ev1") is rec
+    rec2 = rec.with_summary("s").with_override_used(True).add_model_states("ms1")
+    assert (rec2.summary, rec2.override_used, rec2.model_state_ids) == ("s", True, ("ms1",))
+    assert rec2.ranked_options is rec.ranked_options
+
+
+def test_as_dict_returns_lists_and_serializes_to_json() -> None:
+    import json
+
+    ro = RankedOption(option_id="opt1", rank=1, score=0.5, rationale="x", tradeoffs=("t",))
+    rec = Recommendation(orientation_id="ori1", ranked_options=(ro,), evidence_ids=("ev1",)).with_meta(k=1)
+    d = rec.as_dict()
+    assert d["evidence_ids"] == ["ev1"] and d["ranked_options"][0]["tradeoffs"] == ["t"]
+    out = json.loads(json.dumps(d))
+    assert out["evidence_ids"] == ["ev1"] and out["ranked_options"][0]["tradeoffs"] == ["t"]
+    assert out["meta"] == {"k": 1}
+
+
+def test_ranked_option_uncertainty_appends() -> None:
+    u = Uncertainty(description="u", level=0.2)
+    ro = RankedOption(option_id="opt1", rank=1, score=0.5, rationale="x").add_uncertainties(u)
+    assert ro.add_uncertainties() is ro and ro.add_uncertainties(None) is ro  # type: ignore[arg-type]
+    assert ro.add_uncertainties(u).uncertainties == (u, u)
+
+
+def test_ids_for_trace_is_a_read_only_view() -> None:
+    rec = Recommendation(orientation_id="ori1", evidence_ids=("ev1",), observation_ids=["obs1"])
+    trace = rec.ids_for_trace()
+    assert trace["evidence_ids"] is rec.evidence_ids and trace["observation_ids"] == ("obs1",)
+    with pytest.raises(TypeError):
+        trace["evidence_ids"] = ()  # type: ignore[index]
+
+
+def test_with_meta_noop_returns_self_and_merges_read_only() -> None:
+    rev = ReviewRecord().with_meta(k=1)
+    assert rev.with_meta() is rev and rev.with_meta(k=1) is rev
+    rec = Recommendation(orientation_id="ori1").with_meta(a=1).with_meta(b=2)
+    assert dict(rec.meta) == {"a": 1, "b": 2}
+    with pytest.raises(TypeError):
+        rec.meta["a"] = 0  # type: ignore[index]
+
+
+def test_create_batch_matches_the_constructor() -> None:
+    ro = RankedOption(option_id="opt1", rank=1, score=0.5, rationale="x")
+    recs = Recommendation.create_batch(
+        [{"ranked_options": [ro], "evidence_ids": ["ev1"]}, {"summary": "s"}],
+        orientation_id="ori1",
+    )
+    assert len({r.recommendation_id for r in recs}) == 2 and recs[0].created_at is recs[1].created_at
+    first = recs[0]
+    assert first == Recommendation(
+        recommendation_id=first.recommendation_id,
+        created_at=first.created_at,
+        orientation_id="ori1",
+        ranked_options=(ro,),
+        evidence_ids=("ev1",),
+    )
+    assert first.evidence_ids == ("ev1",) and recs[1].summary == "s" and recs[1].meta == {}
+    with pytest.raises(ValueError):
+        Recommendation.create_batch([{}], orientation_id="")
+    with pytest.raises(ValueError):
+        Recommendation.create_batch([{"ranked_options": (ro, ro)}], orientation_id="ori1")
+    with pytest.raises(TypeError):
+        Recommendation.create_batch([{"sumary": "typo"}], orientation_id="ori1")
+
+
+def test_create_batch_keeps_supplied_ids_and_runs_subclass_post_init() -> None:
+    recs = Recommendation.create_batch([{"recommendation_id": "rec_given"}, {}], orientation_id="ori1")
+    assert recs[0].recommendation_id == "rec_given"
+    assert recs[1].recommendation_id.startswith("rec") and recs[1].recommendation_id != "rec_given"
+
+    seen = []
+
+    @dataclass(frozen=True, slots=True)
+    class TaggedRecommendation(Recommendation):
+        def __post_init__(self) -> None:
+            super(TaggedRecommendation, self).__post_init__()
+            seen.append(self.recommendation_id)
+
+    tagged = TaggedRecommendation.create_batch([{"recommendation_id": "rec_t"}, {}], orientation_id="ori1")
+    assert [type(r) for r in tagged] == [TaggedRecommendation, TaggedRecommendation]
+    assert seen == [r.recommendation_id for r in tagged] and seen[0] == "rec_t"
+    assert tagged[0].created_at is tagged[1].created_at
+
+
+def test_scope_and_constraint_check_names_are_interned() -> None:
+    name = "".join(["ALLOW_", "GATE_BYPASS"])  # built at runtime, so not the literal's object
+    rec = Recommendation(orientation_id="ori1", override_scope_used=[name])
+    assert rec.override_scope_used[0] is sys.intern("ALLOW_GATE_BYPASS")
+    assert rec.with_override_scope_used("".join(["X", "Y"])).override_scope_used[1] is sys.intern("XY")
+    ro = RankedOption(option_id="o", rank=1, score=0.5, rationale="x").add_constraint_checks("".join(["c", "1"]))
+    assert ro.constraint_checks[0] is sys.intern("c1")
+
+
+def test_long_ranked_option_lists_validate() -> None:
+    ros = [RankedOption(option_id=f"o{i}", rank=i, score=0.5, rationale="x") for i in range(20, 0, -1)]
+    assert Recommendation(orientation_id="ori1", ranked_options=ros).top_option_id() == "o1"
+    dup = ros[:-1] + [RankedOption(option_id="o0", rank=2, score=0.5, rationale="x")]
+    with pytest.raises(ValueError, match="contiguous"):
+        Recommendation(orientation_id="ori1", ranked_options=dup)
+    gap = ros[1:] + [RankedOption(option_id="o0", rank=21, score=0.5, rationale="x")]
+    with pytest.raises(ValueError, match="contiguous"):
+        Recommendation(orientation_id="ori1", ranked_options=gap)
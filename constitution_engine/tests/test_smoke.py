@@ -1,6 +1,15 @@
 # tests/test_smoke.py
 
+import dataclasses
+
+import pytest
+
 from constitution_engine.models import RawInput
+from constitution_engine.models.episode import DecisionEpisode
+from constitution_engine.models.observation import Observation
+from constitution_engine.models.option import Option
+from constitution_engine.models.orientation import Constraint, Objective, Orientation
+from constitution_engine.models.types import InfoType, Uncertainty, Weight
 from constitution_engine.runtime import InMemoryArtifactStore, Engine
 from constitution_engine.invariants.validate import validate_episode
 
@@ -23,3 +32,285 @@ def test_minimal_episode_smoke():
 
     # 5. Assert the constitution is satisfied
     assert report.ok, f"Violations: {report.violations}, Resolve errors: {report.resolve_errors}"
+
+
+def test_empty_episode_fast_path_still_flags_acted():
+    store = InMemoryArtifactStore()
+    idle = DecisionEpisode()
+    acted = DecisionEpisode(acted=True)
+    store.put(idle)
+    store.put(acted)
+
+    assert validate_episode(store, idle.episode_id).ok
+    rules = {v.rule for v in validate_episode(store, acted.episode_id).violations}
+    assert "INV-CHO-001" in rules
+
+
+def test_validate_episode_reports_missing_episode():
+    report = validate_episode(InMemoryArtifactStore(), "ep_missing")
+
+    assert not report.ok
+    assert [(e.artifact_type, e.artifact_id) for e in report.resolve_errors] == [("DecisionEpisode", "ep_missing")]
+
+
+def test_observation_and_option_appenders_dedupe_incrementally():
+    obs = Observation(statement="s", tags=["a"]).add_tags("b", "a").add_tags("c")
+    assert obs.tags == ("a", "b", "c")
+    assert obs.add_tags("b", "") is obs
+
+    opt = Option(title="t").add_evidence("ev_1").add_evidence("ev_1", "ev_2")
+    assert opt.evidence_ids == ("ev_1", "ev_2")
+    assert opt == Option(option_id=opt.option_id, created_at=opt.created_at, title="t", evidence_ids=("ev_1", "ev_2"))
+
+
+def test_max_uncertainty_level_tracks_added_uncertainties():
+    opt = Option(title="t")
+    assert opt.max_uncertainty_level() is None
+    opt = opt.add_uncertainties(Uncertainty("low", level=0.2))
+    assert opt.max_uncertainty_level() == 0.2
+    opt = opt.add_uncertainties(Uncertainty("high", level=0.9)).with_title("t2")
+    assert opt.max_uncertainty_level() == 0.9
+    assert opt.max_uncertainty_level() == 0.9
+
+
+def test_noop_uncertainty_appends_return_the_same_option():
+    opt = Option(title="t").add_uncertainties(Uncertainty("low", level=0.2))
+    assert opt.add_uncertainties() is opt
+    assert opt.add_uncertainties(None) is opt
+
+
+def test_orientation_weight_maps_are_cached_and_refreshed_on_add():
+    ori = Orientation(objectives=(Objective("speed", "go fast", Weight(2.0)),))
+    assert ori.objective_weight_map() == {"speed": 2.0}
+    assert ori.objective_weight_map() is ori.objective_weight_map()
+
+    ori2 = ori.add_objectives(Objective("cost", "stay cheap")).add_constraints(Constraint("legal", "stay legal"))
+    assert ori2.objective_weight_map() == {"speed": 2.0, "cost": 1.0}
+    assert ori2.constraint_names() == ("legal",)
+    assert ori.objective_weight_map() == {"speed": 2.0}
+
+
+def test_orientation_adders_dedupe_by_name_across_calls():
+    ori = Orientation().add_objectives(Objective("speed", "a"), Objective("speed", "b"))
+    ori = ori.add_objectives(Objective("cost", "c")).add_objectives(Objective("speed", "d"))
+    assert [(o.name, o.description) for o in ori.objectives] == [("speed", "a"), ("cost", "c")]
+    assert ori.add_objectives(Objective("cost", "again")) is ori
+
+
+def test_bulk_create_shares_timestamp_and_mints_distinct_ids():
+    obs = Observation.bulk_create([{"statement": "a"}, {"statement": "b"}, {"statement": "c", "observation_id": "obs_x"}])
+    assert [o.statement for o in obs] == ["a", "b", "c"]
+    assert len({o.observation_id for o in obs}) == 3 and obs[2].observation_id == "obs_x"
+    assert obs[0].observation_id.startswith("obs_") and len(obs[0].observation_id) == len(Observation().observation_id)
+    assert obs[0].created_at is obs[1].created_at
+    assert Option.bulk_create([]) == ()
+    with pytest.raises(ValueError):
+        Observation.bulk_create([{"info_type": InfoType.HYPOTHESIS}])
+
+
+def test_replace_dunder_validates_and_resets_private_caches():
+    obs = Observation(statement="s").add_evidence("ev_1").add_uncertainties(Uncertainty(description="u", level=0.4))
+    assert obs.max_uncertainty_level() == 0.4
+
+    more = (Uncertainty(description="v", level=0.9),)
+    swapped = obs.__replace__(evidence_ids=("ev_2",), uncertainties=more)
+    assert swapped.add_evidence("ev_1").evidence_ids == ("ev_2", "ev_1")  # membership cache was reset
+    assert swapped.max_uncertainty_level() == 0.9
+    assert swapped == dataclasses.replace(obs, evidence_ids=("ev_2",), uncertainties=more)
+
+    with pytest.raises(ValueError):
+        obs.__replace__(info_type=InfoType.HYPOTHESIS)
+    with pytest.raises(TypeError):
+        obs.__replace__(_max_unc=1.0)
+
+
+def test_canonical_orientation_values_are_shared():
+    a = Objective.canonical("speed", "go fast", Weight(2.0))
+    assert Objective.canonical("speed", "go fast", Weight(2.0)) is a
+    assert a == Objective("speed", "go fast", Weight(2.0))
+    assert Objective.canonical("speed", "go slow", Weight(2.0)) is not a
+    assert Constraint.canonical("legal", "stay legal") is Constraint.canonical("legal", "stay legal")
+    with pytest.raises(ValueError):
+        Objective.canonical(" ", "blank")
+
+
+def test_observation_builder_matches_mutator_chain():
+    obs = Observation(statement="s", tags=("x",)).with_meta(k=0)
+    u = Uncertainty(description="u", level=0.3)
+    chained = (
+        obs.add_tags("a", "x").add_evidence("ev_1").add_tags("b", "a")
+        .add_uncertainties(u).with_meta(k=1).with_statement("t").with_meta(j=2)
+    )
+
+    with obs.builder() as b:
+        b.add_tags("a", "x").add_evidence("ev_1").add_tags("b", "a")
+        b.add_uncertainties(u).with_meta(k=1).with_statement("t").with_meta(j=2)
+
+    built = b.result
+    assert built == chained and dict(built.meta) == dict(chained.meta)
+    assert built.add_tags("b") is built and built.max_uncertainty_level() == 0.3
+    assert obs.builder().add_tags("x").with_meta(k=0).build() is obs
+
+
+def test_scalar_value_types_are_slotted_and_validated():
+    from constitution_engine.models.types import Confidence, Impact, Reversibility, Score, Strength
+
+    for v in (Confidence(0.5), Uncertainty(description="u", level=0.1), Impact(0.2), Reversibility(0.3), Score(0.4), Strength(0.6)):
+        assert not hasattr(v, "__dict__")
+    assert Confidence(0.5) == Confidence(0.5) and hash(Confidence(0.5)) == hash(Confidence(0.5))
+    with pytest.raises(ValueError):
+        Confidence(1.5)
+
+
+def test_legacy_store_dispatches_by_type_and_subclass():
+    from constitution_engine.models import types as legacy
+
+    store = legacy.InMemoryStore()
+    ep_id = legacy.build_toy_episode(store)
+    assert legacy.validate_episode(store, ep_id, [legacy.inv_proportionate_action, legacy.inv_info_type_slots]) == []
+
+    class TaggedEpisode(legacy.DecisionEpisode):
+        pass
+
+    tagged = TaggedEpisode(id="ep_sub", created_at=legacy.now_utc())
+    store.put(tagged)
+    assert store.get_episode("ep_sub") is tagged
+    with pytest.raises(TypeError):
+        store.put(object())
+
+
+def test_legacy_strength_cap_is_clamped_and_posture_ordered():
+    from constitution_engine.models import types as legacy
+
+    def cap(posture, conf=0.6, unc=0.4, imp=0.5, rev=0.5):
+        return legacy.max_strength_allowed(
+            confidence=legacy.Confidence(conf),
+            uncertainty=legacy.Uncertainty(description="u", level=unc),
+            impact=legacy.Impact(imp),
+            reversibility=legacy.Reversibility(rev),
+            risk_posture=posture,
+        )
+
+    P = legacy.RiskPosture
+    assert cap(P.CONSERVATIVE) < cap(P.BALANCED) < cap(P.AGGRESSIVE)
+    assert cap(P.BALANCED) == pytest.approx(1.0 - 0.95 * 0.5 - 0.95 * (0.6 * 0.4 + 0.4 * 0.4))
+    assert cap(P.CONSERVATIVE, conf=0.0, unc=1.0, imp=1.0, rev=0.0) == 0.0
+    assert cap(P.AGGRESSIVE, conf=1.0, unc=0.0, imp=0.0, rev=1.0) == 1.0
+
+    hits = legacy._strength_cap.cache_info().hits
+    assert cap(P.BALANCED) == cap(P.BALANCED)
+    assert legacy._strength_cap.cache_info().hits > hits
+
+
+def test_legacy_proportionate_action_flags_only_overstrong_options():
+    from dataclasses import replace
+
+    from constitution_engine.models import types as legacy
+
+    store = legacy.InMemoryStore()
+    ep_id = legacy.build_toy_episode(store)
+    rec_id = store.get_episode(ep_id).recommendation_ids[0]
+    rec = store.get_recommendation(rec_id)
+
+    first, *rest = rec.ranked_options
+    pushed = replace(first, strength=legacy.Strength(1.0))
+    store.put(replace(rec, ranked_options=(pushed, *rest)))
+
+    violations = legacy.inv_proportionate_action(store, ep_id)
+    assert [v.code for v in violations] == ["action.disproportionate"]
+    assert violations[0].artifact_id == rec_id and "Strength 1.000" in violations[0].message
+
+    # A recommendation listed twice is reported twice, once per listing.
+    ep = store.get_episode(ep_id)
+    store.put(replace(ep, recommendation_ids=(*ep.recommendation_ids, rec_id)))
+    assert [v.artifact_id for v in legacy.inv_proportionate_action(store, ep_id)] == [rec_id, rec_id]
+
+
+def test_legacy_compiled_validator_matches_validate_episode():
+    from dataclasses import replace
+
+    from constitution_engine.models import types as legacy
+
+    invariants = [
+        legacy.inv_episode_requires_orientation,
+        legacy.inv_recommendation_requires_audit,
+        legacy.inv_info_type_slots,
+        legacy.inv_traceability_minimum,
+        legacy.inv_proportionate_action,
+    ]
+    validate = legacy.compile_validator(invariants)
+    assert legacy.compile_validator(tuple(invariants)) is validate
+
+    store = legacy.InMemoryStore()
+    ep_id = legacy.build_toy_episode(store)
+    assert validate(store, ep_id) == []
+
+    # Break every invariant across three episodes: bad observation/interpretation types, missing
+    # audit, over-strong recommendation, no orientation/provenance.
+    ep = store.get_episode(ep_id)
+    obs = store.get_observation(ep.observation_ids[0])
+    store.put(replace(obs, info_type=InfoType.HYPOTHESIS))
+    it = store.get_interpretation(ep.interpretation_ids[0])
+    store.put(replace(it, info_type=InfoType.FACT))
+    rec = store.get_recommendation(ep.recommendation_ids[0])
+    first, *rest = rec.ranked_options
+    pushed = replace(first, strength=legacy.Strength(1.0))
+    store.put(replace(rec, audit_trail_id="", ranked_options=(pushed, *rest)))
+    store.put(replace(ep, id="ep_oriented"))
+    store.put(replace(ep, orientation_id=None))
+    bare = replace(ep, id="ep_bare", orientation_id=None, observation_ids=(), interpretation_ids=(), evidence_ids=())
+    store.put(bare)
+
+    seen = set()
+    for eid in (ep_id, "ep_bare", "ep_oriented"):
+        expected = legacy.validate_episode(store, eid, invariants)
+        assert expected and validate(store, eid) == expected
+        seen.update(v.code for v in expected)
+    assert seen == {
+        "orientation.missing",
+        "audit.missing",
+        "infotype.observation.invalid",
+        "infotype.interpretation.invalid",
+        "action.disproportionate",
+        "traceability.empty",
+    }
+    assert legacy.compile_validator([])(store, "ep_missing") == []
+
+
+def test_legacy_store_batch_getters():
+    from constitution_engine.models import types as legacy
+
+    store = legacy.InMemoryStore()
+    ep = store.get_episode(legacy.build_toy_episode(store))
+    ids = list(reversed(ep.option_ids)) + [ep.option_ids[0]]
+
+    by_id = store.get_options(ids)
+    assert list(by_id) == list(reversed(ep.option_ids))
+    assert all(by_id[oid] is store.get_option(oid) for oid in ep.option_ids)
+    assert legacy.ArtifactStore.get_options(store, ids) == by_id
+    assert list(store.get_recommendations(ep.recommendation_ids)) == list(ep.recommendation_ids)
+    with pytest.raises(KeyError):
+        store.get_options(["opt_missing"])
+
+
+def test_legacy_find_first_violation_stops_at_first_failure():
+    from dataclasses import replace
+
+    from constitution_engine.models import types as legacy
+
+    store = legacy.InMemoryStore()
+    ep_id = legacy.build_toy_episode(store)
+    assert legacy.find_first_violation(store, ep_id, legacy.FAIL_FAST_INVARIANTS) is None
+    assert legacy.inv_episode_requires_orientation(store, ep_id) == legacy.inv_traceability_minimum(store, ep_id) == []
+
+    store.put(replace(store.get_episode(ep_id), orientation_id=None))
+    calls = []
+
+    def expensive(store, episode_id):
+        calls.append(episode_id)
+        return []
+
+    first = legacy.find_first_violation(store, ep_id, (*legacy.FAIL_FAST_INVARIANTS, expensive))
+    assert first is not None and first.code == "orientation.missing"
+    assert calls == []
+    assert first == legacy.validate_episode(store, ep_id, legacy.DEFAULT_INVARIANTS)[0]
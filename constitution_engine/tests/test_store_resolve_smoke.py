@@ -0,0 +1,140 @@
+import pytest
+
+from constitution_engine.models.option import Option
+from constitution_engine.models.outcome import Outcome
+from constitution_engine.runtime.in_memory_store import InMemoryArtifactStore
+from constitution_engine.runtime.store import ArtifactStore, ResolveError
+
+
+def test_resolve_many_indexed_returns_mapping_and_errors():
+    store = ArtifactStore()
+    a = Option(title="A")
+    b = Option(title="B")
+    store.put(a)
+    store.put(b)
+
+    by_id, errors = store.resolve_many_indexed(
+        Option, [a.option_id, "opt_missing", b.option_id, "opt_missing", a.option_id]
+    )
+
+    assert dict(by_id) == {a.option_id: a, b.option_id: b}
+    assert [(e.artifact_type, e.artifact_id) for e in errors] == [("Option", "opt_missing")]
+
+
+def test_resolve_batch_groups_by_type_and_collects_errors():
+    store = ArtifactStore()
+    a = Option(title="A")
+    store.put(a)
+
+    resolved, errors = store.resolve_batch({Option: [a.option_id, "opt_missing"], Outcome: []})
+
+    assert dict(resolved[Option]) == {a.option_id: a}
+    assert dict(resolved[Outcome]) == {}
+    assert [(e.artifact_type, e.artifact_id) for e in errors] == [("Option", "opt_missing")]
+
+
+def test_resolve_many_returns_one_instance_per_id():
+    store = ArtifactStore()
+    a = Option(title="A")
+    store.put(a)
+
+    found, errors = store.resolve_many(Option, [a.option_id, "opt_missing", a.option_id, "opt_missing"])
+
+    assert found == (a,)
+    assert [e.artifact_id for e in errors] == ["opt_missing"]
+
+
+def test_locked_store_keys_buckets_by_class():
+    from dataclasses import dataclass
+
+    from constitution_engine.models.option import Option as ModelOption
+    from constitution_engine.runtime import InMemoryArtifactStore
+
+    @dataclass(frozen=True)
+    class Option:  # same __name__ as the model, different class
+        parent_id: str = ""
+        option_id: str = "opt_local"
+
+    store = InMemoryArtifactStore()
+    a, b = Outcome(), Outcome()
+    local = Option()
+    assert store.put(b) == b.outcome_id and store.put(a) == a.outcome_id
+    assert store.put(local) == "opt_local"  # empty parent_id is skipped
+
+    assert store.list_ids(Outcome) == (b.outcome_id, a.outcome_id)
+    assert store.get(Option, "opt_local") is local
+    assert store.get(ModelOption, "opt_local") is None and store.list_ids(ModelOption) == ()
+
+
+def test_primary_id_inference_uses_per_class_candidates():
+    from dataclasses import dataclass
+
+    from constitution_engine.runtime.store import _infer_primary_id
+
+    @dataclass(frozen=True, slots=True)
+    class Note:
+        episode_id: str = "ep_1"
+        review_id: str = ""
+
+    @dataclass(frozen=True, slots=True)
+    class Link:
+        target_id: str = "t_1"
+        src_id: str = "s_1"
+
+    class Loose:
+        def __init__(self, **ids: str) -> None:
+            self.__dict__.update(ids)
+
+    assert _infer_primary_id(Note()) == "ep_1"  # empty review_id falls through to episode_id
+    assert _infer_primary_id(Note(review_id="rev_1")) == "rev_1"
+    assert _infer_primary_id(Link()) == "s_1"  # shortest attr name wins
+    assert _infer_primary_id(Loose(zz_id="z", ab_id="a")) == "a"
+    assert _infer_primary_id(Loose(only_id="o")) == "o"  # per-instance attrs still scanned
+    with pytest.raises(ValueError):
+        _infer_primary_id(Loose())
+
+
+def test_locked_store_lock_free_reads_under_concurrent_puts():
+    import threading
+
+    from constitution_engine.runtime import InMemoryArtifactStore
+
+    store = InMemoryArtifactStore()
+    outcomes = [Outcome() for _ in range(2000)]
+    errors: list[BaseException] = []
+
+    def writer(chunk):
+        for o in chunk:
+            store.put(o)
+
+    def reader():
+        try:
+            for o in outcomes:
+                got = store.get(Outcome, o.outcome_id)
+                assert got is None or got is o
+        except BaseException as exc:  # surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=writer, args=(outcomes[i::2],)) for i in range(2)]
+    threads += [threading.Thread(target=reader) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors
+    assert store.get(Option, "opt_missing") is None
+    assert all(store.must_get(Outcome, o.outcome_id) is o for o in outcomes)
+    assert len(store.list_ids(Outcome)) == len(outcomes)
+
+
+@pytest.mark.parametrize("store_cls", [ArtifactStore, InMemoryArtifactStore])
+def test_must_get_missing_raises_resolve_error_that_is_a_key_error(store_cls):
+    store = store_cls()
+
+    with pytest.raises(ResolveError) as excinfo:
+        store.must_get(Option, "opt_missing")
+    assert (excinfo.value.artifact_type, excinfo.value.artifact_id) == ("Option", "opt_missing")
+
+    with pytest.raises(KeyError, match="opt_missing"):
+        store.must_get(Option, "opt_missing")
@@ -218,3 +218,43 @@ def test_v051_gate_blocks_commit_for_med_risk_med_uncertainty_execute(make_minim
     rules = {v.rule for v in violations}
     assert "INV-ACT-001" not in rules
     assert "INV-ACT-002" in rules
+
+
+def test_legacy_numeric_gate_requires_hedge_for_risky_execute(make_minimal_bundle):
+    """
+    Legacy numeric gate (opt-in): a risky EXECUTE option needs a HEDGE/INFO_GATHERING sibling.
+    """
+    observations, evidence_items, options, rec = make_minimal_bundle()
+    top_id = rec.ranked_options[0].option_id
+
+    risky = [
+        opt.with_kind(OptionKind.EXECUTE)
+        .with_impact(Impact(0.9))
+        .with_reversibility(Reversibility(0.1))
+        .add_uncertainties(Uncertainty("high uncertainty", level=0.9))
+        .with_action_class("probe")
+        if opt.option_id == top_id
+        else opt
+        for opt in options
+    ]
+
+    violations = validate_all(
+        observations=observations,
+        evidence_items=evidence_items,
+        options=risky,
+        recommendation=rec,
+        use_legacy_numeric_gate=True,
+    )
+    legacy = [v for v in violations if v.rule == "proportionate_action_legacy_numeric"]
+    assert len(legacy) == 1
+    assert f"Witness option_id={top_id}" in legacy[0].message
+
+    # Baseline fixture option is INFO_GATHERING: nothing risky, nothing to flag.
+    violations = validate_all(
+        observations=observations,
+        evidence_items=evidence_items,
+        options=options,
+        recommendation=rec,
+        use_legacy_numeric_gate=True,
+    )
+    assert "proportionate_action_legacy_numeric" not in {v.rule for v in violations}
@@ -0,0 +1,176 @@
+# tests/test_validate_cache_smoke.py
+
+import dataclasses
+import threading
+from collections import OrderedDict
+
+from constitution_engine.invariants import validate
+from constitution_engine.invariants.validate import validate_episode, validate_recommendation
+from constitution_engine.models.episode import DecisionEpisode
+from constitution_engine.models.option import Option, OptionKind
+from constitution_engine.models.recommendation import Recommendation
+from constitution_engine.runtime.store import ArtifactStore
+
+
+def test_content_hash_tracks_field_changes(make_minimal_bundle):
+    _, _, options, rec = make_minimal_bundle()
+    opt = options[0]
+
+    assert rec.content_hash() == rec.content_hash()
+    assert rec.with_summary("changed").content_hash() != rec.content_hash()
+    assert opt.with_kind(OptionKind.EXECUTE).content_hash() != opt.content_hash()
+
+
+def test_memoized_content_hash_is_not_carried_into_copies(make_minimal_bundle):
+    _, _, options, rec = make_minimal_bundle()
+    opt = options[0]
+    rec_digest, opt_digest = rec.content_hash(), opt.content_hash()
+
+    # Digests are computed before the copies, so a carried memo would show up as equality.
+    assert rec.with_summary("changed").content_hash() != rec_digest
+    assert rec.add_evidence("ev_new").content_hash() != rec_digest
+    assert opt.with_kind(OptionKind.EXECUTE).content_hash() != opt_digest
+    assert opt.add_evidence("ev_new").content_hash() != opt_digest
+    assert rec.with_summary(rec.summary).content_hash() == rec_digest
+
+
+def test_validate_recommendation_cache_sees_option_changes(make_minimal_bundle):
+    _, _, options, rec = make_minimal_bundle()
+    store = ArtifactStore()
+    store.put(rec)
+    for opt in options:
+        store.put(opt)
+
+    first = validate_recommendation(store, rec.recommendation_id)
+    again = validate_recommendation(store, rec.recommendation_id)
+    # Reports compare by identity (eq=False); check the contents field-by-field.
+    assert [(v.rule, v.message) for v in first.violations] == [(v.rule, v.message) for v in again.violations]
+    assert first.resolve_errors == again.resolve_errors
+
+    # Same Recommendation, edited Option: the cached result must not be reused.
+    top_id = rec.ranked_options[0].option_id
+    top = next(o for o in options if o.option_id == top_id)
+    store.put(top.with_kind(OptionKind.EXECUTE).with_action_class(None))
+
+    after = validate_recommendation(store, rec.recommendation_id)
+    assert "INV-ACT-001" in {v.rule for v in after.violations}
+    assert "INV-ACT-001" not in {v.rule for v in first.violations}
+
+
+def test_validate_recommendation_cache_is_thread_safe(make_minimal_bundle, monkeypatch):
+    # A tiny cache forces constant eviction while threads hit and miss it concurrently.
+    monkeypatch.setattr(validate, "_REC_CORE_CACHE_MAXSIZE", 2)
+    monkeypatch.setattr(validate, "_rec_core_cache", OrderedDict())
+    _, _, options, rec = make_minimal_bundle()
+    store = ArtifactStore()
+    for opt in options:
+        store.put(opt)
+    recs = [dataclasses.replace(rec, recommendation_id=f"rec_thread_{i}") for i in range(8)]
+    for r in recs:
+        store.put(r)
+
+    errors: list[BaseException] = []
+
+    def worker() -> None:
+        try:
+            for _ in range(200):
+                for r in recs:
+                    validate_recommendation(store, r.recommendation_id)
+        except BaseException as exc:  # pragma: no cover - only on failure
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert len(validate._rec_core_cache) <= 2
+
+
+def test_clear_validation_cache_empties_the_recommendation_cache(make_minimal_bundle, monkeypatch):
+    monkeypatch.setattr(validate, "_rec_core_cache", OrderedDict())
+    _, _, options, rec = make_minimal_bundle()
+    store = ArtifactStore()
+    for obj in (*options, rec):
+        store.put(obj)
+
+    first = validate_recommendation(store, rec.recommendation_id)
+    assert len(validate._rec_core_cache) == 1
+
+    validate.clear_validation_cache()
+    assert len(validate._rec_core_cache) == 0
+    again = validate_recommendation(store, rec.recommendation_id)
+    assert [(v.rule, v.message) for v in again.violations] == [(v.rule, v.message) for v in first.violations]
+
+    validate._validate_recommendation_cached.cache_clear()
+    assert len(validate._rec_core_cache) == 0
+
+
+def _episode_with_three_recommendations(make_minimal_bundle, store):
+    # rec_a ranks an option that is not stored, rec_gone is not stored, rec_b trips INV-ACT-001.
+    _, _, _, rec_a = make_minimal_bundle(recommendation_id="rec_a", option_id="opt_gone")
+    _, _, options_b, rec_b = make_minimal_bundle(recommendation_id="rec_b", option_id="opt_b")
+    store.put(rec_a)
+    store.put(rec_b)
+    for opt in options_b:
+        store.put(opt.with_kind(OptionKind.EXECUTE).with_action_class(None))
+    ep = DecisionEpisode(recommendation_ids=("rec_a", "rec_gone", "rec_b"))
+    store.put(ep)
+    return ep
+
+
+def test_validate_episode_reports_recommendations_in_episode_order(make_minimal_bundle):
+    store = ArtifactStore()
+    ep = _episode_with_three_recommendations(make_minimal_bundle, store)
+
+    report = validate_episode(store, ep.episode_id)
+
+    assert [(e.artifact_type, e.artifact_id) for e in report.resolve_errors] == [
+        ("Option", "opt_gone"),
+        ("Recommendation", "rec_gone"),
+    ]
+    messages = [v.message for v in report.violations]
+    gone_at = messages.index("Recommendation missing: rec_gone")
+    assert any("opt_gone" in m for m in messages[:gone_at])
+    assert "INV-ACT-001" in {v.rule for v in report.violations[gone_at + 1:]}
+
+
+class _ProtocolOnlyStore:
+    # Only the ArtifactStoreProtocol surface: no resolve_many_indexed / resolve_batch.
+    def __init__(self) -> None:
+        self._inner = ArtifactStore()
+
+    def put(self, obj):
+        return self._inner.put(obj)
+
+    def get(self, cls, obj_id):
+        return self._inner.get(cls, obj_id)
+
+    def must_get(self, cls, obj_id):
+        return self._inner.must_get(cls, obj_id)
+
+    def has(self, cls, obj_id):
+        return self._inner.has(cls, obj_id)
+
+    def list_ids(self, cls):
+        return self._inner.list_ids(cls)
+
+    def resolve_many(self, cls, ids):
+        return self._inner.resolve_many(cls, ids)
+
+
+def test_validate_episode_falls_back_to_resolve_many(make_minimal_bundle):
+    full, minimal = ArtifactStore(), _ProtocolOnlyStore()
+    ep = _episode_with_three_recommendations(make_minimal_bundle, full)
+    for cls in (Recommendation, Option, DecisionEpisode):
+        for obj_id in full.list_ids(cls):
+            minimal.put(full.get(cls, obj_id))
+
+    expected = validate_episode(full, ep.episode_id)
+    report = validate_episode(minimal, ep.episode_id)
+
+    assert [(v.rule, v.message) for v in report.violations] == [(v.rule, v.message) for v in expected.violations]
+    assert report.resolve_errors == expected.resolve_errors
+    assert "INV-ACT-001" in {v.rule for v in validate_recommendation(minimal, "rec_b").violations}